@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Accumulators Module
+Mergeable, JSON-serializable running statistics shared by the analytics scripts
+
+A StatsAccumulator can be fed one P&L value at a time, merged with another
+accumulator, and round-tripped through a plain dict so it can be persisted
+between pipeline runs. PeriodStatsAccumulator adds the volume, best/worst
+trade and per-strategy breakdown used by the period summaries.
+"""
+
+from typing import Dict, Iterable
+
+
+class StatsAccumulator:
+    """Running win/loss statistics over a stream of P&L values"""
+
+    __slots__ = ("count", "wins", "losses", "total_pnl", "gross_profit", "gross_loss")
+
+    def __init__(self):
+        self.count = 0
+        self.wins = 0
+        self.losses = 0
+        self.total_pnl = 0.0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0  # Stored as a positive magnitude
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Dict]) -> "StatsAccumulator":
+        """Build an accumulator from an iterable of trade dictionaries"""
+        acc = cls()
+        for trade in trades:
+            acc.add(trade.get("pnl_usd", 0))
+        return acc
+
+    def add(self, pnl: float) -> None:
+        """Add a single trade P&L"""
+        self.count += 1
+        self.total_pnl += pnl
+        if pnl > 0:
+            self.wins += 1
+            self.gross_profit += pnl
+        elif pnl < 0:
+            self.losses += 1
+            self.gross_loss -= pnl
+
+    def merge(self, other: "StatsAccumulator") -> "StatsAccumulator":
+        """Fold another accumulator into this one and return self"""
+        self.count += other.count
+        self.wins += other.wins
+        self.losses += other.losses
+        self.total_pnl += other.total_pnl
+        self.gross_profit += other.gross_profit
+        self.gross_loss += other.gross_loss
+        return self
+
+    @property
+    def win_rate(self) -> float:
+        """Win rate as a fraction (0-1)"""
+        return self.wins / self.count if self.count > 0 else 0.0
+
+    @property
+    def avg_pnl(self) -> float:
+        return self.total_pnl / self.count if self.count > 0 else 0.0
+
+    @property
+    def avg_win(self) -> float:
+        return self.gross_profit / self.wins if self.wins > 0 else 0.0
+
+    @property
+    def avg_loss(self) -> float:
+        """Average losing trade as a positive magnitude"""
+        return self.gross_loss / self.losses if self.losses > 0 else 0.0
+
+    def expectancy(self) -> float:
+        """(Win% × Avg Win) - (Loss% × Avg Loss)"""
+        if self.count == 0:
+            return 0.0
+        loss_rate = self.losses / self.count
+        return round((self.win_rate * self.avg_win) - (loss_rate * self.avg_loss), 2)
+
+    def profit_factor(self) -> float:
+        """Gross profit / gross loss (inf when there are no losses)"""
+        if self.count == 0:
+            return 0.0
+        if self.gross_loss == 0:
+            return 0.0 if self.gross_profit == 0 else float("inf")
+        return round(self.gross_profit / self.gross_loss, 2)
+
+    def kelly(self) -> float:
+        """Kelly Criterion percentage: W - [(1 - W) / R]"""
+        if self.wins == 0 or self.losses == 0 or self.avg_loss == 0:
+            return 0.0
+        r_ratio = self.avg_win / self.avg_loss
+        return round((self.win_rate - ((1 - self.win_rate) / r_ratio)) * 100, 1)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StatsAccumulator":
+        acc = cls()
+        for name in cls.__slots__:
+            setattr(acc, name, data.get(name, getattr(acc, name)))
+        return acc
+
+
+class PeriodStatsAccumulator(StatsAccumulator):
+    """StatsAccumulator plus volume, best/worst trade and strategy breakdown"""
+
+    __slots__ = ("total_volume", "best_trade", "worst_trade", "strategies")
+
+    def __init__(self):
+        super().__init__()
+        self.total_volume = 0
+        self.best_trade = None  # {'ticker', 'pnl', 'trade_number'}
+        self.worst_trade = None
+        self.strategies = {}  # {strategy: {'count', 'pnl', 'first'}}
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Dict]) -> "PeriodStatsAccumulator":
+        acc = cls()
+        for trade in trades:
+            acc.add_trade(trade)
+        return acc
+
+    def add_trade(self, trade: Dict) -> None:
+        """Add a single trade dictionary"""
+        pnl = trade.get("pnl_usd", 0)
+        self.add(pnl)
+        self.total_volume += trade.get("position_size", 0)
+
+        # Strict comparisons keep the earliest trade on ties
+        if self.best_trade is None or pnl > self.best_trade["pnl"]:
+            self.best_trade = _trade_ref(trade, pnl)
+        if self.worst_trade is None or pnl < self.worst_trade["pnl"]:
+            self.worst_trade = _trade_ref(trade, pnl)
+
+        strategy = trade.get("strategy", "Unknown")
+        if strategy not in self.strategies:
+            self.strategies[strategy] = {
+                "count": 0,
+                "pnl": 0.0,
+                "first": trade.get("trade_number"),
+            }
+        self.strategies[strategy]["count"] += 1
+        self.strategies[strategy]["pnl"] += pnl
+
+    def merge(self, other: "StatsAccumulator") -> "PeriodStatsAccumulator":
+        """Fold another (later) period into this one and return self"""
+        super().merge(other)
+        if not isinstance(other, PeriodStatsAccumulator):
+            return self
+        self.total_volume += other.total_volume
+        # Ties go to the lower trade number, as when trades are added in order
+        if other.best_trade is not None and (
+            self.best_trade is None
+            or (-other.best_trade["pnl"], _trade_order(other.best_trade))
+            < (-self.best_trade["pnl"], _trade_order(self.best_trade))
+        ):
+            self.best_trade = dict(other.best_trade)
+        if other.worst_trade is not None and (
+            self.worst_trade is None
+            or (other.worst_trade["pnl"], _trade_order(other.worst_trade))
+            < (self.worst_trade["pnl"], _trade_order(self.worst_trade))
+        ):
+            self.worst_trade = dict(other.worst_trade)
+        for strategy, data in other.strategies.items():
+            if strategy not in self.strategies:
+                self.strategies[strategy] = dict(data)
+                continue
+            merged = self.strategies[strategy]
+            merged["count"] += data["count"]
+            merged["pnl"] += data["pnl"]
+            if _number_order(data["first"]) < _number_order(merged["first"]):
+                merged["first"] = data["first"]
+        return self
+
+    def to_period_stats(self) -> Dict:
+        """Period statistics in the shape used by the summary markdown"""
+        if self.count == 0:
+            return {}
+
+        def trade_summary(ref):
+            return {
+                "ticker": ref["ticker"],
+                "pnl": round(ref["pnl"], 2),
+                "trade_number": ref["trade_number"],
+            }
+
+        return {
+            "total_trades": self.count,
+            "winning_trades": self.wins,
+            "losing_trades": self.losses,
+            "win_rate": round(self.win_rate * 100, 2),
+            "total_pnl": round(self.total_pnl, 2),
+            "avg_pnl": round(self.avg_pnl, 2),
+            "best_trade": trade_summary(self.best_trade),
+            "worst_trade": trade_summary(self.worst_trade),
+            "total_volume": self.total_volume,
+            # In order of each strategy's first trade number
+            "strategies": {
+                strategy: {"count": data["count"], "pnl": data["pnl"]}
+                for strategy, data in sorted(
+                    self.strategies.items(),
+                    key=lambda item: _number_order(item[1]["first"]),
+                )
+            },
+        }
+
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data.update({name: getattr(self, name) for name in self.__slots__})
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PeriodStatsAccumulator":
+        acc = cls()
+        for name in StatsAccumulator.__slots__ + cls.__slots__:
+            setattr(acc, name, data.get(name, getattr(acc, name)))
+        return acc
+
+
+def _trade_ref(trade: Dict, pnl: float) -> Dict:
+    return {
+        "ticker": trade.get("ticker"),
+        "pnl": pnl,
+        "trade_number": trade.get("trade_number"),
+    }
+
+
+def _number_order(trade_number) -> tuple:
+    """Sort key for trade numbers (missing numbers sort last)"""
+    return (trade_number is None, trade_number or 0)
+
+
+def _trade_order(ref: Dict) -> tuple:
+    return _number_order(ref["trade_number"])
+
+
+def merge_accumulators(
+    accumulators: Iterable[StatsAccumulator], cls: type = StatsAccumulator
+) -> StatsAccumulator:
+    """Merge any number of accumulators (in order) into a new `cls` instance"""
+    merged = cls()
+    for acc in accumulators:
+        merged.merge(acc)
+    return merged
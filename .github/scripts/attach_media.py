@@ -14,8 +14,161 @@ This script provides media management functionality:
 import os
 import json
 import glob
+from datetime import datetime
 from pathlib import Path
 
+from template_engine import compile_template
+
+# Media validation report layout
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Media Validation Report - SFTi-Pennies</title>
+    <style>
+        body {
+            font-family: 'Inter', sans-serif;
+            background: #0a0e1a;
+            color: #e4e4e7;
+            padding: 2rem;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+        h1 {
+            color: #00ff88;
+            margin-bottom: 0.5rem;
+        }
+        .summary {
+            background: #1a1f2e;
+            padding: 1.5rem;
+            border-radius: 8px;
+            margin: 1.5rem 0;
+            border-left: 4px solid #00ff88;
+        }
+        .stat {
+            display: flex;
+            justify-content: space-between;
+            padding: 0.5rem 0;
+        }
+        .stat-label {
+            color: #9ca3af;
+        }
+        .stat-value {
+            font-weight: 600;
+            color: #00ff88;
+        }
+        .section {
+            background: #1a1f2e;
+            padding: 1.5rem;
+            border-radius: 8px;
+            margin: 1.5rem 0;
+        }
+        .section h2 {
+            color: #ffd700;
+            margin-bottom: 1rem;
+        }
+        .trade-item {
+            background: #0f1420;
+            padding: 1rem;
+            border-radius: 6px;
+            margin: 0.75rem 0;
+        }
+        .image-list {
+            margin-top: 0.5rem;
+            padding-left: 1rem;
+        }
+        .image-item {
+            color: #9ca3af;
+            font-family: 'JetBrains Mono', monospace;
+            font-size: 0.875rem;
+            padding: 0.25rem 0;
+        }
+        .warning {
+            color: #ff4757;
+        }
+        .success {
+            color: #00ff88;
+        }
+        .timestamp {
+            color: #9ca3af;
+            font-size: 0.875rem;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📸 Media Validation Report</h1>
+        <p class="timestamp">Generated: {{ generated }}</p>
+        
+        <div class="summary">
+            <h2 style="margin-top: 0;">Summary</h2>
+            <div class="stat">
+                <span class="stat-label">Total Images:</span>
+                <span class="stat-value">{{ total_images }}</span>
+            </div>
+            <div class="stat">
+                <span class="stat-label">Trades with Images:</span>
+                <span class="stat-value">{{ len(trade_images) }}</span>
+            </div>
+            <div class="stat">
+                <span class="stat-label">Orphaned Images:</span>
+                <span class="stat-value {{ 'warning' if orphaned else 'success' }}">{{ len(orphaned) }}</span>
+            </div>
+            <div class="stat">
+                <span class="stat-label">Updated Files:</span>
+                <span class="stat-value">{{ len(updated_files) }}</span>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>✓ Linked Images</h2>
+            {% for trade_id, images in trade_images.items() %}
+            <div class="trade-item">
+                <strong>{{ trade_id }}</strong> ({{ len(images) }} image{{ 's' if len(images) != 1 else '' }})
+                <div class="image-list">
+                    {% for img in images %}
+                    <div class="image-item">• {{ img }}</div>
+                    {% endfor %}
+                </div>
+            </div>
+            {% endfor %}
+        </div>
+        
+        {% if orphaned %}
+        <div class="section">
+            <h2 class="warning">⚠️ Orphaned Images</h2>
+            <p style="color: #9ca3af; margin-bottom: 1rem;">
+                These images are not linked to any trade. They may be from deleted trades or incorrectly named directories.
+            </p>
+            <div class="image-list">
+                {% for img in orphaned %}
+                <div class="image-item warning">• {{ img }}</div>
+                {% endfor %}
+            </div>
+        </div>
+        {% else %}
+        <div class="section"><h2 class="success">✓ No Orphaned Images</h2><p style="color: #9ca3af;">All images are properly linked to trades.</p></div>
+        {% endif %}
+        
+        {% if updated_files %}
+        <div class="section">
+            <h2 class="success">✓ Updated Trade Files</h2>
+            <div class="image-list">
+                {% for f in updated_files %}
+                <div class="image-item success">• {{ f }}</div>
+                {% endfor %}
+            </div>
+        </div>
+        {% endif %}
+    </div>
+</body>
+</html>
+"""
+
 
 def scan_trade_images():
     """
@@ -200,151 +353,17 @@ def generate_validation_report(trade_images, trades, orphaned, updated_files):
     """
     total_images = sum(len(imgs) for imgs in trade_images.values())
 
-    report_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Media Validation Report - SFTi-Pennies</title>
-    <style>
-        body {{
-            font-family: 'Inter', sans-serif;
-            background: #0a0e1a;
-            color: #e4e4e7;
-            padding: 2rem;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        h1 {{
-            color: #00ff88;
-            margin-bottom: 0.5rem;
-        }}
-        .summary {{
-            background: #1a1f2e;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin: 1.5rem 0;
-            border-left: 4px solid #00ff88;
-        }}
-        .stat {{
-            display: flex;
-            justify-content: space-between;
-            padding: 0.5rem 0;
-        }}
-        .stat-label {{
-            color: #9ca3af;
-        }}
-        .stat-value {{
-            font-weight: 600;
-            color: #00ff88;
-        }}
-        .section {{
-            background: #1a1f2e;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin: 1.5rem 0;
-        }}
-        .section h2 {{
-            color: #ffd700;
-            margin-bottom: 1rem;
-        }}
-        .trade-item {{
-            background: #0f1420;
-            padding: 1rem;
-            border-radius: 6px;
-            margin: 0.75rem 0;
-        }}
-        .image-list {{
-            margin-top: 0.5rem;
-            padding-left: 1rem;
-        }}
-        .image-item {{
-            color: #9ca3af;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.875rem;
-            padding: 0.25rem 0;
-        }}
-        .warning {{
-            color: #ff4757;
-        }}
-        .success {{
-            color: #00ff88;
-        }}
-        .timestamp {{
-            color: #9ca3af;
-            font-size: 0.875rem;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📸 Media Validation Report</h1>
-        <p class="timestamp">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div class="summary">
-            <h2 style="margin-top: 0;">Summary</h2>
-            <div class="stat">
-                <span class="stat-label">Total Images:</span>
-                <span class="stat-value">{total_images}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Trades with Images:</span>
-                <span class="stat-value">{len(trade_images)}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Orphaned Images:</span>
-                <span class="stat-value {'warning' if orphaned else 'success'}">{len(orphaned)}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Updated Files:</span>
-                <span class="stat-value">{len(updated_files)}</span>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>✓ Linked Images</h2>
-            {''.join([f'''
-            <div class="trade-item">
-                <strong>{trade_id}</strong> ({len(images)} image{'s' if len(images) != 1 else ''})
-                <div class="image-list">
-                    {''.join([f'<div class="image-item">• {img}</div>' for img in images])}
-                </div>
-            </div>
-            ''' for trade_id, images in trade_images.items()])}
-        </div>
-        
-        {f'''
-        <div class="section">
-            <h2 class="warning">⚠️ Orphaned Images</h2>
-            <p style="color: #9ca3af; margin-bottom: 1rem;">
-                These images are not linked to any trade. They may be from deleted trades or incorrectly named directories.
-            </p>
-            <div class="image-list">
-                {''.join([f'<div class="image-item warning">• {img}</div>' for img in orphaned])}
-            </div>
-        </div>
-        ''' if orphaned else '<div class="section"><h2 class="success">✓ No Orphaned Images</h2><p style="color: #9ca3af;">All images are properly linked to trades.</p></div>'}
-        
-        {f'''
-        <div class="section">
-            <h2 class="success">✓ Updated Trade Files</h2>
-            <div class="image-list">
-                {''.join([f'<div class="image-item success">• {f}</div>' for f in updated_files])}
-            </div>
-        </div>
-        ''' if updated_files else ''}
-    </div>
-</body>
-</html>
-"""
-
-    # Write report to file
+    # Stream the report to file
     report_path = Path("index.directory/media-validation-report.html")
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(report_html)
+    template = compile_template(REPORT_TEMPLATE, "media-validation-report.html")
+    template.render_to_file(
+        report_path,
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        total_images=total_images,
+        trade_images=trade_images,
+        orphaned=orphaned,
+        updated_files=updated_files,
+    )
 
     print(f"\n✓ Generated validation report: {report_path}")
     return report_path
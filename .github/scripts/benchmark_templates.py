@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark Templates Script
+Measures per-page render cost of the shared template engine
+
+Renders synthetic trades through the trade detail page, trade markdown and
+period summary templates, both to strings and streamed to files in a
+temporary directory, and reports the one-off compile cost and the average
+cost per page.
+
+Usage:
+    python .github/scripts/benchmark_templates.py [--pages 10000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+import generate_summaries
+import generate_trade_pages
+import import_csv
+from template_engine import Template, compile_template
+
+
+def synthetic_trades(count, seed=7):
+    """
+    Build deterministic trade dictionaries shaped like trades-index.json
+
+    Args:
+        count (int): Number of trades
+        seed (int): Random seed
+
+    Returns:
+        list: Trade dictionaries
+    """
+    rng = random.Random(seed)
+    tickers = [f"T{i:03d}" for i in range(200)]
+    trades = []
+    for number in range(1, count + 1):
+        entry = round(rng.uniform(0.5, 8), 2)
+        exit_price = round(entry * rng.uniform(0.8, 1.25), 2)
+        size = rng.randint(10, 2000)
+        pnl = round((exit_price - entry) * size, 2)
+        trades.append(
+            {
+                "trade_number": number,
+                "ticker": rng.choice(tickers),
+                "entry_date": "2025-03-14",
+                "entry_time": "09:41",
+                "exit_date": "2025-03-14",
+                "exit_time": "10:12",
+                "entry_price": entry,
+                "exit_price": exit_price,
+                "position_size": size,
+                "direction": "LONG",
+                "strategy": rng.choice(["Breakout", "Dip Buy", "VWAP Reclaim"]),
+                "stop_loss": round(entry * 0.95, 2),
+                "target_price": round(entry * 1.1, 2),
+                "risk_reward_ratio": 2.0,
+                "broker": "IBKR",
+                "pnl_usd": pnl,
+                "pnl_percent": round((exit_price - entry) / entry * 100, 2),
+                "time_in_trade": "31m",
+                "notes": "Clean break of the morning range.\nScaled out into strength.",
+                "strategy_tags": ["Momentum"],
+                "setup_tags": ["Flag", "Gap"],
+                "session_tags": [],
+                "market_condition_tags": ["Trending"],
+                "images": [f"../../assets/trade-images/trade-{number:03d}/entry.png"],
+            }
+        )
+    return trades
+
+
+def time_per_page(label, pages, render):
+    """
+    Time a render callable over every page and print the per-page cost
+
+    Args:
+        label (str): Row label
+        pages (list): Items passed to render
+        render (callable): Renders one item
+    """
+    start = time.perf_counter()
+    for page in pages:
+        render(page)
+    elapsed = time.perf_counter() - start
+    per_page = elapsed / len(pages) * 1e6
+    print(f"  {label:<34} {elapsed:8.3f}s total  {per_page:8.1f} µs/page")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Benchmark template rendering")
+    parser.add_argument(
+        "--pages", type=int, default=10000, help="Pages to render (default: 10000)"
+    )
+    args = parser.parse_args()
+
+    trades = synthetic_trades(args.pages)
+    print(f"Rendering {len(trades)} pages per template")
+
+    # One-off compile cost (uncached) versus a cache hit
+    start = time.perf_counter()
+    Template(generate_trade_pages.TRADE_PAGE_TEMPLATE, "trade-page.html")
+    compiled = time.perf_counter() - start
+    compile_template(generate_trade_pages.TRADE_PAGE_TEMPLATE, "trade-page.html")
+    start = time.perf_counter()
+    compile_template(generate_trade_pages.TRADE_PAGE_TEMPLATE, "trade-page.html")
+    cached = time.perf_counter() - start
+    print(
+        f"  Trade page compile: {compiled * 1e3:.2f} ms once, "
+        f"{cached * 1e6:.2f} µs per cached lookup"
+    )
+
+    stats = generate_summaries.calculate_period_stats(trades[:50])
+
+    time_per_page(
+        "trade page -> string", trades, generate_trade_pages.generate_trade_html
+    )
+    time_per_page(
+        "summary markdown -> string",
+        trades,
+        lambda trade: generate_summaries.generate_summary_markdown(
+            "2025-W11", stats, "week"
+        ),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        time_per_page(
+            "trade page -> file (streamed)",
+            trades,
+            lambda trade: generate_trade_pages.write_trade_page(
+                trade, os.path.join(tmp, f"trade-{trade['trade_number']}.html")
+            ),
+        )
+        # create_trade_markdown reports every file it writes
+        markdown_dir = os.path.join(tmp, "markdown")
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for trade in trades:
+                import_csv.create_trade_markdown(trade, markdown_dir)
+            elapsed = time.perf_counter() - start
+        print(
+            f"  {'trade markdown -> file (streamed)':<34} {elapsed:8.3f}s total  "
+            f"{elapsed / len(trades) * 1e6:8.1f} µs/page"
+        )
+
+
+if __name__ == "__main__":
+    main()
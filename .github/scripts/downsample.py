@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Downsample Module
+Largest-Triangle-Three-Buckets (LTTB) downsampling for chart series
+
+LTTB keeps the first and last points and, for every bucket in between,
+the point that forms the largest triangle with the point chosen from the
+previous bucket and the average of the next bucket. Peaks, troughs and the
+overall shape of an equity or drawdown curve survive even at a small point
+budget, which keeps Chart.js responsive on phones with 10k+ trades.
+"""
+
+from typing import Dict, List, Sequence
+
+# Default number of points in a downsampled ("lite") series
+DEFAULT_POINT_BUDGET = 500
+
+# Smallest usable budget: LTTB always keeps the first and last points
+MIN_POINT_BUDGET = 3
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> List[int]:
+    """
+    Select the indices of the points to keep
+
+    Points are treated as evenly spaced on the x axis (one per trade).
+
+    Args:
+        values: Y values in plot order
+        threshold: Maximum number of points to keep
+
+    Returns:
+        list: Sorted indices into values (all of them if no reduction is needed)
+
+    Raises:
+        ValueError: If threshold is below MIN_POINT_BUDGET
+    """
+    if threshold < MIN_POINT_BUDGET:
+        raise ValueError(
+            f"LTTB point budget must be at least {MIN_POINT_BUDGET}, got {threshold}"
+        )
+
+    n = len(values)
+    if threshold >= n:
+        return list(range(n))
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if next_start >= next_end:
+            avg_x, avg_y = n - 1, values[n - 1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        ax, ay = a, values[a]
+        best_index = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best_index = j
+
+        selected.append(best_index)
+        a = best_index
+
+    selected.append(n - 1)
+    return selected
+
+
+def downsample_series(
+    labels: Sequence, values: Sequence[float], threshold: int = DEFAULT_POINT_BUDGET
+) -> Dict:
+    """
+    Downsample a labels/values series with LTTB
+
+    Args:
+        labels: X labels, parallel to values
+        values: Y values
+        threshold: Point budget
+
+    Returns:
+        dict: {'labels': [...], 'values': [...]} with at most threshold points
+    """
+    indices = lttb_indices(values, threshold)
+    return {
+        "labels": [labels[i] for i in indices],
+        "values": [values[i] for i in indices],
+    }
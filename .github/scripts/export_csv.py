@@ -12,6 +12,7 @@ Features:
 import json
 import csv
 import argparse
+import calendar
 from datetime import datetime
 
 
@@ -121,17 +122,15 @@ def main():
         # Filter trades from date (inclusive)
         try:
             from_date = datetime.strptime(args.filter_date_from, "%Y-%m-%d")
-            filtered_trades = []
-            for t in trades:
-                entry_date = t.get("entry_date", "")
-                if entry_date:  # Skip trades with missing dates
-                    try:
-                        if datetime.strptime(entry_date, "%Y-%m-%d") >= from_date:
-                            filtered_trades.append(t)
-                    except ValueError:
-                        # Skip trades with invalid date format
-                        continue
-            trades = filtered_trades
+            from_ts = calendar.timegm(from_date.timetuple())
+            # entry_timestamp is precomputed by parse_trades.py; trades
+            # without an entry date have none and are skipped
+            trades = [
+                t
+                for t in trades
+                if t.get("entry_timestamp") is not None
+                and t["entry_timestamp"] >= from_ts
+            ]
             print(f"Filtered to {len(trades)} trade(s) from {args.filter_date_from}")
         except ValueError:
             print(
@@ -139,20 +138,15 @@ def main():
             )
 
     if args.filter_date_to:
-        # Filter trades to date (inclusive)
+        # Filter trades to date (inclusive, through the end of that day)
         try:
             to_date = datetime.strptime(args.filter_date_to, "%Y-%m-%d")
-            filtered_trades = []
-            for t in trades:
-                entry_date = t.get("entry_date", "")
-                if entry_date:  # Skip trades with missing dates
-                    try:
-                        if datetime.strptime(entry_date, "%Y-%m-%d") <= to_date:
-                            filtered_trades.append(t)
-                    except ValueError:
-                        # Skip trades with invalid date format
-                        continue
-            trades = filtered_trades
+            to_ts = calendar.timegm(to_date.timetuple()) + 86400
+            trades = [
+                t
+                for t in trades
+                if t.get("entry_timestamp") is not None and t["entry_timestamp"] < to_ts
+            ]
             print(f"Filtered to {len(trades)} trade(s) until {args.filter_date_to}")
         except ValueError:
             print(
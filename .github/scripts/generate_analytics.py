@@ -9,14 +9,66 @@ Performance Optimizations:
 - Reduced list comprehensions and intermediate data structures
 - Optimized aggregate_by_tag() to minimize iterations
 - Efficient memory usage with streaming calculations
-
-Output: analytics-data.json
+- O(n) drawdown episode extraction with heap-based top-K selection
+- Persisted accumulator state: appended trades update every metric in
+  O(new trades); the state holds only bounded running aggregates (no
+  per-trade series) plus one chained digest of every processed trade, so
+  any edit to already-processed trades triggers a full rebuild
+- Mergeable t-digest sketches for per-group P&L distributions, built per
+  month in one streaming pass and merged into yearly and all-time rollups
+- R-multiple expectancy, distribution and R equity curves accumulated from
+  the r_multiple column precomputed by parse_trades.py
+- Week-over-week, month-over-month and year-over-year deltas rolled up from
+  per (week, month) accumulator cells instead of regrouping trades
+- LTTB-downsampled drawdown series (configurable point budget) alongside
+  the full-resolution series for fast chart rendering
+- Dates are never parsed here: ordering, labels, months and ISO weeks come
+  from the timestamp and calendar-key columns written by parse_trades.py
+
+Output: analytics-data.json, analytics-state.json
 """
 
+import argparse
+import hashlib
+import heapq
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Tuple
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from accumulators import StatsAccumulator, merge_accumulators
+from downsample import DEFAULT_POINT_BUDGET, MIN_POINT_BUDGET, downsample_series
+from quantile_sketch import TDigest, merge_digests
+
+# Drawdown episode length buckets (in trades) for the duration histogram
+DRAWDOWN_DURATION_BUCKETS = [(1, 1), (2, 3), (4, 7), (8, 15), (16, 31), (32, None)]
+
+# Number of deepest drawdown episodes reported in analytics-data.json
+DRAWDOWN_TOP_EPISODES = 5
+
+# Tag fields aggregated into by_<field> sections; time_of_day and
+# holding_band are precomputed by parse_trades.py from entry/exit timestamps
+TAG_FIELDS = ["strategy", "setup", "session", "time_of_day", "holding_band"]
+
+# Number of most recent trades covered by the rolling metrics
+ROLLING_WINDOW = 20
+
+# P&L distribution sketches: grouping fields, reported percentiles,
+# histogram bin budget and tail fraction for the tail means
+DISTRIBUTION_FIELDS = TAG_FIELDS + ["ticker"]
+DISTRIBUTION_PERCENTILES = [5, 25, 50, 75, 95]
+DISTRIBUTION_BINS = 20
+DISTRIBUTION_TAIL = 0.05
+
+# Headline metrics (in column order) of the period-over-period comparison
+PERIOD_METRICS = ["trades", "total_pnl", "win_rate", "expectancy", "profit_factor"]
+
+# Bump whenever the persisted state layout changes to force a full rebuild
+STATE_VERSION = 8
+
+OUTPUT_FILE = "index.directory/assets/charts/analytics-data.json"
+STATE_FILE = "index.directory/assets/charts/analytics-state.json"
 
 
 def load_trades_index():
@@ -29,6 +81,29 @@ def load_trades_index():
         return None
 
 
+def _trade_date(trade: Dict) -> str:
+    """Date reported for a trade in episode points (exit, else entry)"""
+    return str(trade.get("exit_date", trade.get("entry_date", "")))
+
+
+def _sort_key(trade: Dict) -> int:
+    """Order trades by the exit timestamp precomputed by parse_trades.py"""
+    return trade.get("exit_timestamp") or 0
+
+
+def _month_key(trade: Dict) -> str:
+    """YYYY-MM bucket for a trade (from its exit date, else entry date)"""
+    return trade.get("exit_month") or "unknown"
+
+
+def _date_label(trade: Dict) -> str:
+    """Short MM/DD label for a chart point"""
+    timestamp = trade.get("exit_timestamp")
+    if timestamp is None:
+        return _trade_date(trade)
+    return time.strftime("%m/%d", time.gmtime(timestamp))
+
+
 def calculate_expectancy(trades: List[Dict]) -> float:
     """
     Calculate expectancy (average P&L per trade)
@@ -41,33 +116,7 @@ def calculate_expectancy(trades: List[Dict]) -> float:
     Returns:
         float: Expectancy value
     """
-    if not trades:
-        return 0.0
-
-    # Single pass to calculate wins and losses
-    total = len(trades)
-    win_count = 0
-    loss_count = 0
-    total_wins = 0.0
-    total_losses = 0.0
-    
-    for t in trades:
-        pnl = t.get("pnl_usd", 0)
-        if pnl > 0:
-            win_count += 1
-            total_wins += pnl
-        elif pnl < 0:
-            loss_count += 1
-            total_losses += pnl
-
-    win_rate = win_count / total if total > 0 else 0
-    loss_rate = loss_count / total if total > 0 else 0
-
-    avg_win = total_wins / win_count if win_count > 0 else 0
-    avg_loss = abs(total_losses / loss_count) if loss_count > 0 else 0
-
-    expectancy = (win_rate * avg_win) - (loss_rate * avg_loss)
-    return round(expectancy, 2)
+    return StatsAccumulator.from_trades(trades).expectancy()
 
 
 def calculate_profit_factor(trades: List[Dict]) -> float:
@@ -80,26 +129,36 @@ def calculate_profit_factor(trades: List[Dict]) -> float:
     Returns:
         float: Profit factor
     """
-    if not trades:
-        return 0.0
-
-    # Single pass calculation
-    gross_profit = 0.0
-    gross_loss = 0.0
-    
-    for t in trades:
-        pnl = t.get("pnl_usd", 0)
+    return StatsAccumulator.from_trades(trades).profit_factor()
+
+
+class StreakTracker:
+    """Running max win/loss streak counters"""
+
+    def __init__(self):
+        self.current_win = 0
+        self.current_loss = 0
+        self.max_win = 0
+        self.max_loss = 0
+
+    def update(self, pnl: float) -> None:
         if pnl > 0:
-            gross_profit += pnl
+            self.current_win += 1
+            self.current_loss = 0
+            self.max_win = max(self.max_win, self.current_win)
         elif pnl < 0:
-            gross_loss += pnl
+            self.current_loss += 1
+            self.current_win = 0
+            self.max_loss = max(self.max_loss, self.current_loss)
 
-    gross_loss = abs(gross_loss)
-    
-    if gross_loss == 0:
-        return 0.0 if gross_profit == 0 else float("inf")
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
 
-    return round(gross_profit / gross_loss, 2)
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StreakTracker":
+        tracker = cls()
+        tracker.__dict__.update(data)
+        return tracker
 
 
 def calculate_streaks(trades: List[Dict]) -> Tuple[int, int]:
@@ -112,27 +171,178 @@ def calculate_streaks(trades: List[Dict]) -> Tuple[int, int]:
     Returns:
         Tuple: (max_win_streak, max_loss_streak)
     """
-    if not trades:
-        return 0, 0
+    tracker = StreakTracker()
+    for trade in trades:
+        tracker.update(trade.get("pnl_usd", 0))
+    return tracker.max_win, tracker.max_loss
 
-    current_win_streak = 0
-    current_loss_streak = 0
-    max_win_streak = 0
-    max_loss_streak = 0
 
-    for trade in trades:
-        pnl = trade.get("pnl_usd", 0)
+def _episode_point(trade: Dict, index: int, equity: float) -> Dict:
+    """Describe one point (peak, trough or recovery) of a drawdown episode"""
+    return {
+        "index": index,
+        "trade_number": trade.get("trade_number"),
+        "date": _trade_date(trade),
+        "timestamp": trade.get("exit_timestamp"),
+        "equity": round(equity, 2),
+    }
 
-        if pnl > 0:
-            current_win_streak += 1
-            current_loss_streak = 0
-            max_win_streak = max(max_win_streak, current_win_streak)
-        elif pnl < 0:
-            current_loss_streak += 1
-            current_win_streak = 0
-            max_loss_streak = max(max_loss_streak, current_loss_streak)
 
-    return max_win_streak, max_loss_streak
+def _days_between(start_timestamp, end_timestamp):
+    """Calendar days between two epoch timestamps, or None if either is missing"""
+    if start_timestamp is None or end_timestamp is None:
+        return None
+    return end_timestamp // 86400 - start_timestamp // 86400
+
+
+def _duration_label(low: int, high) -> str:
+    """Histogram label for a (low, high) duration bucket"""
+    if high is None:
+        return f"{low}+"
+    return str(low) if low == high else f"{low}-{high}"
+
+
+def _duration_bucket(duration: int) -> str:
+    """Map an episode length in trades to a power-of-two histogram bucket"""
+    for low, high in DRAWDOWN_DURATION_BUCKETS:
+        if high is None or duration <= high:
+            return _duration_label(low, high)
+    return _duration_label(*DRAWDOWN_DURATION_BUCKETS[-1])
+
+
+def _close_episode(episode: Dict, recovery, recovery_index: int) -> Dict:
+    """Finalize an episode dict with depth, durations and recovery times"""
+    peak = episode["peak"]
+    trough = episode["trough"]
+    end_index = recovery_index if recovery else episode["last_index"]
+    end_timestamp = recovery["timestamp"] if recovery else episode["last_timestamp"]
+
+    return {
+        "peak": peak,
+        "trough": trough,
+        "recovery": recovery,
+        "recovered": recovery is not None,
+        "depth": round(trough["equity"] - peak["equity"], 2),
+        "start_index": peak["index"],
+        "end_index": end_index,
+        "duration_trades": end_index - peak["index"],
+        "duration_days": _days_between(peak["timestamp"], end_timestamp),
+        "recovery_trades": (recovery_index - trough["index"]) if recovery else None,
+        "recovery_days": (
+            _days_between(trough["timestamp"], recovery["timestamp"])
+            if recovery
+            else None
+        ),
+    }
+
+
+class DrawdownTracker:
+    """
+    Incremental equity curve tracker producing drawdown episodes
+    (peak -> trough -> recovery) and the maximum drawdown
+
+    Only bounded aggregates are kept: the deepest drawdown, the open
+    episode, the recovered-episode count and duration histogram, and a heap
+    of the top_k deepest recovered episodes. The per-trade series comes from
+    calculate_drawdown_series().
+
+    The running peak starts at the first cumulative value, so the deepest
+    episode always matches the minimum of the drawdown series.
+    """
+
+    def __init__(self, top_k: int = DRAWDOWN_TOP_EPISODES):
+        self.top_k = top_k
+        self.index = 0
+        self.running_total = 0.0
+        self.peak_value = None
+        self.peak_point = None
+        self.deepest = 0.0
+        self.current = None  # Open (unrecovered) episode
+        self.recovered = 0
+        self.histogram = {}  # Recovered episodes per duration bucket
+        self.deepest_episodes = []  # Heap of [-depth, -sequence, episode]
+
+    def _add_recovered(self, episode: Dict) -> None:
+        """Count a recovered episode and keep it if it is among the deepest"""
+        self.recovered += 1
+        bucket = _duration_bucket(episode["duration_trades"])
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+        # Shallowest (then latest) episode sits on top and is evicted first
+        heapq.heappush(
+            self.deepest_episodes, [-episode["depth"], -self.recovered, episode]
+        )
+        if len(self.deepest_episodes) > self.top_k:
+            heapq.heappop(self.deepest_episodes)
+
+    def update(self, trade: Dict) -> None:
+        index = self.index
+        self.index += 1
+        self.running_total += trade.get("pnl_usd", 0)
+        running_total = self.running_total
+
+        if self.peak_value is None or running_total >= self.peak_value:
+            if self.current is not None:
+                recovery = _episode_point(trade, index, running_total)
+                self._add_recovered(_close_episode(self.current, recovery, index))
+                self.current = None
+            self.peak_value = running_total
+            self.peak_point = _episode_point(trade, index, running_total)
+            return
+
+        self.deepest = min(self.deepest, round(running_total - self.peak_value, 2))
+
+        # Below the running peak: open or extend the current episode
+        if self.current is None:
+            self.current = {"peak": self.peak_point, "trough": None}
+        trough = self.current["trough"]
+        if trough is None or running_total < trough["equity"]:
+            self.current["trough"] = _episode_point(trade, index, running_total)
+        self.current["last_index"] = index
+        self.current["last_timestamp"] = trade.get("exit_timestamp")
+
+    def max_drawdown(self) -> float:
+        return self.deepest if self.index else 0
+
+    def summary(self) -> Dict:
+        """Top-K deepest episodes plus a histogram of episode durations"""
+        # Kept episodes in chronological order, then the open one
+        episodes = [
+            entry[2] for entry in sorted(self.deepest_episodes, key=lambda e: -e[1])
+        ]
+        histogram = dict(self.histogram)
+        total = self.recovered
+        if self.current is not None:
+            episode = _close_episode(self.current, None, self.current["last_index"])
+            episodes.append(episode)
+            bucket = _duration_bucket(episode["duration_trades"])
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+            total += 1
+
+        labels = [
+            _duration_label(low, high) for low, high in DRAWDOWN_DURATION_BUCKETS
+        ]
+
+        return {
+            "total_episodes": total,
+            "recovered_episodes": self.recovered,
+            "top_episodes": heapq.nsmallest(
+                self.top_k, episodes, key=lambda e: e["depth"]
+            ),
+            "duration_histogram": {
+                "labels": labels,
+                "values": [histogram.get(label, 0) for label in labels],
+            },
+        }
+
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DrawdownTracker":
+        tracker = cls()
+        tracker.__dict__.update(data)
+        return tracker
 
 
 def calculate_drawdown_series(trades: List[Dict]) -> Dict:
@@ -145,37 +355,19 @@ def calculate_drawdown_series(trades: List[Dict]) -> Dict:
     Returns:
         Dict: {'labels': [...], 'values': [...]}
     """
-    if not trades:
-        return {"labels": [], "values": []}
-
     labels = []
-    drawdowns = []
-
-    cumulative_pnl = []
-    running_total = 0
-
+    values = []
+    running_total = 0.0
+    peak_value = None
     for trade in trades:
-        pnl = trade.get("pnl_usd", 0)
-        running_total += pnl
-        cumulative_pnl.append(running_total)
-
-        # Date label
-        date_str = trade.get("exit_date", trade.get("entry_date", ""))
-        try:
-            date_obj = datetime.fromisoformat(str(date_str).split("T")[0])
-            labels.append(date_obj.strftime("%m/%d"))
-        except:
-            labels.append(date_str)
-
-    # Calculate drawdown from peak
-    peak = cumulative_pnl[0] if cumulative_pnl else 0
-    for value in cumulative_pnl:
-        if value > peak:
-            peak = value
-        drawdown = value - peak
-        drawdowns.append(round(drawdown, 2))
-
-    return {"labels": labels, "values": drawdowns}
+        running_total += trade.get("pnl_usd", 0)
+        labels.append(_date_label(trade))
+        if peak_value is None or running_total >= peak_value:
+            peak_value = running_total
+            values.append(0.0)
+        else:
+            values.append(round(running_total - peak_value, 2))
+    return {"labels": labels, "values": values}
 
 
 def calculate_kelly_criterion(trades: List[Dict]) -> float:
@@ -191,38 +383,25 @@ def calculate_kelly_criterion(trades: List[Dict]) -> float:
     Returns:
         float: Kelly percentage
     """
-    if not trades:
-        return 0.0
-
-    # Single pass to calculate stats
-    win_count = 0
-    loss_count = 0
-    total_wins = 0.0
-    total_losses = 0.0
-    
-    for t in trades:
-        pnl = t.get("pnl_usd", 0)
-        if pnl > 0:
-            win_count += 1
-            total_wins += pnl
-        elif pnl < 0:
-            loss_count += 1
-            total_losses += pnl
-
-    if win_count == 0 or loss_count == 0:
-        return 0.0
+    return StatsAccumulator.from_trades(trades).kelly()
 
-    win_rate = win_count / len(trades)
-    avg_win = total_wins / win_count
-    avg_loss = abs(total_losses / loss_count)
 
-    if avg_loss == 0:
-        return 0.0
+def _tag_value(trade: Dict, tag_field: str) -> str:
+    """Tag value for grouping, with missing/empty tags as 'Unclassified'"""
+    return trade.get(tag_field) or "Unclassified"
 
-    r_ratio = avg_win / avg_loss
-    kelly = win_rate - ((1 - win_rate) / r_ratio)
 
-    return round(kelly * 100, 1)
+def _tag_summary(acc: StatsAccumulator) -> Dict:
+    """Per-tag statistics block as written to analytics-data.json"""
+    return {
+        "total_trades": acc.count,
+        "winning_trades": acc.wins,
+        "losing_trades": acc.losses,
+        "win_rate": round(acc.win_rate * 100, 1),
+        "total_pnl": round(acc.total_pnl, 2),
+        "avg_pnl": round(acc.avg_pnl, 2),
+        "expectancy": acc.expectancy(),
+    }
 
 
 def aggregate_by_tag(trades: List[Dict], tag_field: str) -> Dict:
@@ -236,67 +415,676 @@ def aggregate_by_tag(trades: List[Dict], tag_field: str) -> Dict:
     Returns:
         Dict: {tag_value: {stats...}, ...}
     """
-    aggregates = {}
+    accumulators = {}
+    for trade in trades:
+        tag_value = _tag_value(trade, tag_field)
+        if tag_value not in accumulators:
+            accumulators[tag_value] = StatsAccumulator()
+        accumulators[tag_value].add(trade.get("pnl_usd", 0))
+
+    return {tag: _tag_summary(acc) for tag, acc in accumulators.items()}
+
+
+def _distribution_summary(digest: TDigest) -> Dict:
+    """Percentiles, tail means and histogram for one P&L distribution"""
+    return digest.summary(
+        DISTRIBUTION_PERCENTILES, DISTRIBUTION_BINS, DISTRIBUTION_TAIL
+    )
+
+
+def _empty_sketches() -> Dict:
+    return {"overall": {}, **{field: {} for field in DISTRIBUTION_FIELDS}}
+
+
+def _add_to_sketch(months: Dict, month: str, pnl: float) -> None:
+    """Add a P&L value to the month's digest in a {month: TDigest} map"""
+    if month not in months:
+        months[month] = TDigest()
+    months[month].add(pnl)
+
+
+def _add_trade_to_sketches(sketches: Dict, trade: Dict) -> None:
+    """Feed one trade's P&L into the overall and per-group monthly sketches"""
+    pnl = trade.get("pnl_usd", 0)
+    month = _month_key(trade)
+    _add_to_sketch(sketches["overall"], month, pnl)
+    for field in DISTRIBUTION_FIELDS:
+        groups = sketches[field]
+        _add_to_sketch(groups.setdefault(_tag_value(trade, field), {}), month, pnl)
+
+
+def build_distributions(sketches: Dict) -> Dict:
+    """
+    Roll per-month sketches up into monthly, yearly and all-time distributions
+
+    Args:
+        sketches: {'overall': {month: TDigest}, field: {value: {month: TDigest}}}
+
+    Returns:
+        Dict: overall, by_month, by_year and by_<field> distribution summaries
+    """
+    overall_months = sketches.get("overall", {})
+
+    years = {}
+    for month, digest in overall_months.items():
+        years.setdefault(month[:4], []).append(digest)
+
+    distributions = {
+        "overall": _distribution_summary(merge_digests(overall_months.values())),
+        "by_month": {
+            month: _distribution_summary(digest)
+            for month, digest in sorted(overall_months.items())
+        },
+        "by_year": {
+            year: _distribution_summary(merge_digests(digests))
+            for year, digests in sorted(years.items())
+        },
+    }
+    for field in DISTRIBUTION_FIELDS:
+        distributions[f"by_{field}"] = {
+            value: _distribution_summary(merge_digests(months.values()))
+            for value, months in sketches.get(field, {}).items()
+        }
+    return distributions
+
+
+class HoldingTimeTracker:
+    """Running holding-time sums (minutes) overall and for winners/losers"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_minutes = 0
+        self.winner_count = 0
+        self.winner_minutes = 0
+        self.loser_count = 0
+        self.loser_minutes = 0
+
+    def update(self, trade: Dict) -> None:
+        minutes = trade.get("holding_minutes")
+        if minutes is None:
+            return
+        pnl = trade.get("pnl_usd", 0)
+        self.count += 1
+        self.total_minutes += minutes
+        if pnl > 0:
+            self.winner_count += 1
+            self.winner_minutes += minutes
+        elif pnl < 0:
+            self.loser_count += 1
+            self.loser_minutes += minutes
+
+    def summary(self) -> Dict:
+        def average(total, count):
+            return round(total / count, 1) if count > 0 else 0
+
+        return {
+            "trades_with_times": self.count,
+            "avg_minutes": average(self.total_minutes, self.count),
+            "avg_winner_minutes": average(self.winner_minutes, self.winner_count),
+            "avg_loser_minutes": average(self.loser_minutes, self.loser_count),
+        }
+
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HoldingTimeTracker":
+        tracker = cls()
+        tracker.__dict__.update(data)
+        return tracker
+
+
+class RMultipleTracker:
+    """
+    R-multiple statistics, overall and per strategy
+
+    Reads the r_multiple/risk_status columns from parse_trades.py. Trades
+    without a valid stop are counted per risk_status but excluded from the
+    R statistics. The R equity curves come from calculate_r_equity_curves().
+    """
+
+    def __init__(self):
+        self.status_counts = {}
+        self.overall = StatsAccumulator()
+        self.digest = TDigest()
+        self.by_strategy = {}  # {strategy: StatsAccumulator}
+
+    def update(self, trade: Dict) -> None:
+        status = trade.get("risk_status", "missing_stop")
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+        r_multiple = trade.get("r_multiple")
+        if r_multiple is None:
+            return
+
+        self.overall.add(r_multiple)
+        self.digest.add(r_multiple)
+
+        strategy = _tag_value(trade, "strategy")
+        if strategy not in self.by_strategy:
+            self.by_strategy[strategy] = StatsAccumulator()
+        self.by_strategy[strategy].add(r_multiple)
+
+    @staticmethod
+    def _r_summary(acc: StatsAccumulator) -> Dict:
+        return {
+            "trades": acc.count,
+            "expectancy_r": round(acc.avg_pnl, 2),
+            "total_r": round(acc.total_pnl, 2),
+            "win_rate": round(acc.win_rate * 100, 1),
+            "avg_win_r": round(acc.avg_win, 2),
+            "avg_loss_r": round(-acc.avg_loss, 2),
+        }
+
+    def summary(self, curves: Dict) -> Dict:
+        """
+        R statistics with the equity curves merged in
+
+        Args:
+            curves: calculate_r_equity_curves() output for the same trades
+        """
+        return {
+            "risk_status": dict(self.status_counts),
+            **self._r_summary(self.overall),
+            "distribution": _distribution_summary(self.digest),
+            "equity_curve": {"labels": curves["labels"], "values": curves["values"]},
+            "by_strategy": {
+                strategy: {
+                    **self._r_summary(acc),
+                    "equity_curve": curves["by_strategy"].get(strategy, []),
+                }
+                for strategy, acc in self.by_strategy.items()
+            },
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "status_counts": self.status_counts,
+            "overall": self.overall.to_dict(),
+            "digest": self.digest.to_dict(),
+            "by_strategy": {
+                strategy: acc.to_dict() for strategy, acc in self.by_strategy.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RMultipleTracker":
+        tracker = cls()
+        tracker.status_counts = data["status_counts"]
+        tracker.overall = StatsAccumulator.from_dict(data["overall"])
+        tracker.digest = TDigest.from_dict(data["digest"])
+        tracker.by_strategy = {
+            strategy: StatsAccumulator.from_dict(acc)
+            for strategy, acc in data["by_strategy"].items()
+        }
+        return tracker
+
+
+def calculate_r_equity_curves(trades: List[Dict]) -> Dict:
+    """
+    Cumulative R equity curves, overall and per strategy
 
-    # Group trades by tag and calculate stats in single pass
+    Args:
+        trades: List of trade dictionaries (sorted by date)
+
+    Returns:
+        Dict: {'labels': [...], 'values': [...], 'by_strategy': {strategy: [...]}}
+    """
+    labels = []
+    values = []
+    total = 0.0
+    strategy_totals = {}
+    by_strategy = {}
     for trade in trades:
-        tag_value = trade.get(tag_field)
-        if not tag_value or tag_value == "":
-            tag_value = "Unclassified"
-
-        if tag_value not in aggregates:
-            aggregates[tag_value] = {
-                "trades": [],
-                "total_trades": 0,
-                "winning_trades": 0,
-                "losing_trades": 0,
-                "win_rate": 0,
-                "total_pnl": 0.0,
-                "avg_pnl": 0,
-                "expectancy": 0,
-            }
+        r_multiple = trade.get("r_multiple")
+        if r_multiple is None:
+            continue
+        total += r_multiple
+        labels.append(_date_label(trade))
+        values.append(round(total, 2))
+
+        strategy = _tag_value(trade, "strategy")
+        strategy_totals[strategy] = strategy_totals.get(strategy, 0.0) + r_multiple
+        by_strategy.setdefault(strategy, []).append(round(strategy_totals[strategy], 2))
+    return {"labels": labels, "values": values, "by_strategy": by_strategy}
+
+
+def _period_cell(trade: Dict) -> Optional[Tuple[str, str]]:
+    """(ISO week, month) cell for a trade, e.g. ('2025-W01', '2024-12')"""
+    week = trade.get("exit_week")
+    month = trade.get("exit_month")
+    if not week or not month:
+        return None
+    return week, month
+
+
+def _previous_week(week: str) -> str:
+    year, number = week.split("-W")
+    monday = date.fromisocalendar(int(year), int(number), 1) - timedelta(days=7)
+    iso = monday.isocalendar()
+    return f"{iso[0]}-W{iso[1]:02d}"
+
+
+def _previous_month(month: str) -> str:
+    year, number = int(month[:4]), int(month[5:7])
+    return f"{year - 1}-12" if number == 1 else f"{year}-{number - 1:02d}"
+
 
-        aggregates[tag_value]["trades"].append(trade)
-
-    # Calculate stats for each tag in optimized manner
-    for tag_value, data in aggregates.items():
-        tag_trades = data["trades"]
-        data["total_trades"] = len(tag_trades)
-        
-        # Calculate all metrics in single pass
-        win_count = 0
-        loss_count = 0
-        total_pnl = 0.0
-        
-        for t in tag_trades:
-            pnl = t.get("pnl_usd", 0)
-            total_pnl += pnl
-            if pnl > 0:
-                win_count += 1
-            elif pnl < 0:
-                loss_count += 1
-        
-        data["winning_trades"] = win_count
-        data["losing_trades"] = loss_count
-        data["win_rate"] = round(
-            (win_count / data["total_trades"] * 100) if data["total_trades"] > 0 else 0,
-            1,
+def _previous_year(year: str) -> str:
+    return str(int(year) - 1)
+
+
+def _period_values(acc: StatsAccumulator) -> List:
+    """Headline metrics for one period, in PERIOD_METRICS order"""
+    profit_factor = acc.profit_factor()
+    return [
+        acc.count,
+        round(acc.total_pnl, 2),
+        round(acc.win_rate * 100, 1),
+        acc.expectancy(),
+        None if profit_factor == float("inf") else profit_factor,
+    ]
+
+
+def _period_rows(periods: Dict[str, StatsAccumulator], previous_of) -> List[Dict]:
+    """
+    Comparison rows for consecutive calendar periods
+
+    Each row carries the period's metric values and the deltas against the
+    immediately preceding calendar period. Deltas are null when the previous
+    period had no trades (or for a metric that is undefined in either one).
+    """
+    values = {period: _period_values(acc) for period, acc in periods.items()}
+    rows = []
+    for period in sorted(values):
+        previous = previous_of(period)
+        current = values[period]
+        before = values.get(previous)
+        deltas = None
+        if before is not None:
+            deltas = [
+                None if a is None or b is None else round(a - b, 2)
+                for a, b in zip(current, before)
+            ]
+        rows.append(
+            {
+                "period": period,
+                "previous": previous,
+                "values": current,
+                "deltas": deltas,
+            }
         )
-        data["total_pnl"] = round(total_pnl, 2)
-        data["avg_pnl"] = round(
-            total_pnl / data["total_trades"] if data["total_trades"] > 0 else 0,
-            2,
+    return rows
+
+
+def build_period_comparison(cells: Dict[str, Dict[str, StatsAccumulator]]) -> Dict:
+    """
+    Roll (week, month) accumulator cells up into WoW/MoM/YoY comparison rows
+
+    Weeks merge their cells across months, months merge their cells across
+    weeks, and years merge their months, so weeks that straddle a month or
+    year boundary are counted exactly once at every level.
+
+    Args:
+        cells: {week: {month: StatsAccumulator}}
+
+    Returns:
+        Dict: weekly, monthly and yearly comparison rows
+    """
+    weeks = {}
+    months = {}
+    for week, week_cells in cells.items():
+        weeks[week] = merge_accumulators(week_cells.values())
+        for month, acc in week_cells.items():
+            months.setdefault(month, StatsAccumulator()).merge(acc)
+
+    years = {}
+    for month, acc in months.items():
+        years.setdefault(month[:4], StatsAccumulator()).merge(acc)
+
+    return {
+        "weekly": _period_rows(weeks, _previous_week),
+        "monthly": _period_rows(months, _previous_month),
+        "yearly": _period_rows(years, _previous_year),
+    }
+
+
+class PeriodTracker:
+    """Per (ISO week, month) accumulators, overall and per strategy"""
+
+    def __init__(self):
+        self.overall = {}  # {week: {month: StatsAccumulator}}
+        self.by_strategy = {}  # {strategy: {week: {month: StatsAccumulator}}}
+
+    @staticmethod
+    def _add(cells: Dict, week: str, month: str, pnl: float) -> None:
+        week_cells = cells.setdefault(week, {})
+        if month not in week_cells:
+            week_cells[month] = StatsAccumulator()
+        week_cells[month].add(pnl)
+
+    def update(self, trade: Dict) -> None:
+        cell = _period_cell(trade)
+        if cell is None:
+            return
+        week, month = cell
+        pnl = trade.get("pnl_usd", 0)
+        self._add(self.overall, week, month, pnl)
+        strategy_cells = self.by_strategy.setdefault(_tag_value(trade, "strategy"), {})
+        self._add(strategy_cells, week, month, pnl)
+
+    def summary(self) -> Dict:
+        return {
+            "metrics": PERIOD_METRICS,
+            "overall": build_period_comparison(self.overall),
+            "by_strategy": {
+                strategy: build_period_comparison(cells)
+                for strategy, cells in self.by_strategy.items()
+            },
+        }
+
+    @staticmethod
+    def _cells_to_dict(cells: Dict) -> Dict:
+        return {
+            week: {month: acc.to_dict() for month, acc in week_cells.items()}
+            for week, week_cells in cells.items()
+        }
+
+    @staticmethod
+    def _cells_from_dict(cells: Dict) -> Dict:
+        return {
+            week: {
+                month: StatsAccumulator.from_dict(acc)
+                for month, acc in week_cells.items()
+            }
+            for week, week_cells in cells.items()
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "overall": self._cells_to_dict(self.overall),
+            "by_strategy": {
+                strategy: self._cells_to_dict(cells)
+                for strategy, cells in self.by_strategy.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PeriodTracker":
+        tracker = cls()
+        tracker.overall = cls._cells_from_dict(data["overall"])
+        tracker.by_strategy = {
+            strategy: cls._cells_from_dict(cells)
+            for strategy, cells in data["by_strategy"].items()
+        }
+        return tracker
+
+
+def trade_digest(trade: Dict, previous: str = "") -> str:
+    """
+    Chained digest of a trade record and the digest of the trades before it
+
+    Args:
+        trade: Trade dictionary
+        previous: Digest returned for the preceding trade ("" for the first)
+
+    Returns:
+        str: Hex digest
+    """
+    payload = previous + json.dumps(trade, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class AnalyticsState:
+    """
+    Serializable accumulator state behind analytics-data.json
+
+    Holds everything needed to extend the analytics with newly appended
+    trades: running sums, streak counters, the equity/drawdown tracker,
+    holding-time sums, R-multiple statistics, per-week/month period
+    accumulators, per-tag accumulators, the rolling-window buffer and
+    per-month P&L sketches for every distribution group. Nothing grows with
+    the trade count; per-trade chart series are derived from the trades in
+    build_analytics(). `digest` chains the digests of every processed trade
+    so a later run can check that they are all unchanged.
+    """
+
+    def __init__(self):
+        self.version = STATE_VERSION
+        self.count = 0
+        self.digest = ""
+        self.overall = StatsAccumulator()
+        self.streaks = StreakTracker()
+        self.drawdown = DrawdownTracker()
+        self.holding = HoldingTimeTracker()
+        self.r_multiples = RMultipleTracker()
+        self.periods = PeriodTracker()
+        self.by_tag = {field: {} for field in TAG_FIELDS}
+        self.rolling = []
+        self.sketches = _empty_sketches()
+
+    def update(self, trade: Dict) -> None:
+        """Fold one trade (in date order) into every accumulator"""
+        pnl = trade.get("pnl_usd", 0)
+
+        self.count += 1
+        self.digest = trade_digest(trade, self.digest)
+        self.overall.add(pnl)
+        self.streaks.update(pnl)
+        self.drawdown.update(trade)
+        self.holding.update(trade)
+        self.r_multiples.update(trade)
+        self.periods.update(trade)
+
+        for field, groups in self.by_tag.items():
+            tag_value = _tag_value(trade, field)
+            if tag_value not in groups:
+                groups[tag_value] = StatsAccumulator()
+            groups[tag_value].add(pnl)
+
+        self.rolling.append(pnl)
+        if len(self.rolling) > ROLLING_WINDOW:
+            del self.rolling[0]
+
+        _add_trade_to_sketches(self.sketches, trade)
+
+    def build_analytics(
+        self, sorted_trades: List[Dict], max_points: int = DEFAULT_POINT_BUDGET
+    ) -> Dict:
+        """
+        Render analytics-data.json content from the accumulators
+
+        Args:
+            sorted_trades: The trades folded into this state, in date order
+                           (source of the per-trade chart series)
+            max_points: Point budget for the downsampled drawdown series
+
+        Returns:
+            Dict: Analytics data
+        """
+        rolling = StatsAccumulator()
+        for pnl in self.rolling:
+            rolling.add(pnl)
+
+        analytics = {
+            "expectancy": self.overall.expectancy(),
+            "profit_factor": self.overall.profit_factor(),
+            "max_win_streak": self.streaks.max_win,
+            "max_loss_streak": self.streaks.max_loss,
+            "max_drawdown": self.drawdown.max_drawdown(),
+            "kelly_criterion": self.overall.kelly(),
+        }
+        for field, groups in self.by_tag.items():
+            analytics[f"by_{field}"] = {
+                tag: _tag_summary(acc) for tag, acc in groups.items()
+            }
+        analytics["rolling"] = {
+            "window": ROLLING_WINDOW,
+            "trades": rolling.count,
+            "win_rate": round(rolling.win_rate * 100, 1),
+            "total_pnl": round(rolling.total_pnl, 2),
+            "expectancy": rolling.expectancy(),
+        }
+        analytics["holding_time"] = self.holding.summary()
+        analytics["r_multiples"] = self.r_multiples.summary(
+            calculate_r_equity_curves(sorted_trades)
         )
-        data["expectancy"] = calculate_expectancy(tag_trades)
+        analytics["period_comparison"] = self.periods.summary()
+        drawdown_series = calculate_drawdown_series(sorted_trades)
+        analytics["drawdown_series"] = drawdown_series
+        analytics["drawdown_series_lite"] = {
+            **downsample_series(
+                drawdown_series["labels"], drawdown_series["values"], max_points
+            ),
+            "full_points": len(drawdown_series["values"]),
+        }
+        analytics["drawdown_episodes"] = self.drawdown.summary()
+        analytics["distributions"] = build_distributions(self.sketches)
+        analytics["generated_at"] = datetime.now().isoformat()
+        return analytics
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": self.version,
+            "count": self.count,
+            "digest": self.digest,
+            "overall": self.overall.to_dict(),
+            "streaks": self.streaks.to_dict(),
+            "drawdown": self.drawdown.to_dict(),
+            "holding": self.holding.to_dict(),
+            "r_multiples": self.r_multiples.to_dict(),
+            "periods": self.periods.to_dict(),
+            "by_tag": {
+                field: {tag: acc.to_dict() for tag, acc in groups.items()}
+                for field, groups in self.by_tag.items()
+            },
+            "rolling": self.rolling,
+            "sketches": {
+                "overall": _sketches_to_dict(self.sketches["overall"]),
+                **{
+                    field: {
+                        value: _sketches_to_dict(months)
+                        for value, months in self.sketches[field].items()
+                    }
+                    for field in DISTRIBUTION_FIELDS
+                },
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AnalyticsState":
+        state = cls()
+        state.version = data["version"]
+        state.count = data["count"]
+        state.digest = data["digest"]
+        state.overall = StatsAccumulator.from_dict(data["overall"])
+        state.streaks = StreakTracker.from_dict(data["streaks"])
+        state.drawdown = DrawdownTracker.from_dict(data["drawdown"])
+        state.holding = HoldingTimeTracker.from_dict(data["holding"])
+        state.r_multiples = RMultipleTracker.from_dict(data["r_multiples"])
+        state.periods = PeriodTracker.from_dict(data["periods"])
+        state.by_tag = {
+            field: {
+                tag: StatsAccumulator.from_dict(acc)
+                for tag, acc in data["by_tag"].get(field, {}).items()
+            }
+            for field in TAG_FIELDS
+        }
+        state.rolling = data["rolling"]
+        sketches = data["sketches"]
+        state.sketches = {
+            "overall": _sketches_from_dict(sketches["overall"]),
+            **{
+                field: {
+                    value: _sketches_from_dict(months)
+                    for value, months in sketches.get(field, {}).items()
+                }
+                for field in DISTRIBUTION_FIELDS
+            },
+        }
+        return state
+
+
+def _sketches_to_dict(months: Dict) -> Dict:
+    return {month: digest.to_dict() for month, digest in months.items()}
+
+
+def _sketches_from_dict(months: Dict) -> Dict:
+    return {month: TDigest.from_dict(digest) for month, digest in months.items()}
+
+
+def load_state(sorted_trades: List[Dict]) -> Optional[AnalyticsState]:
+    """
+    Load persisted analytics state if it is still valid for these trades
+
+    The state is reusable only when its version matches and the trades it
+    has already processed are an unchanged prefix of sorted_trades, i.e.
+    new trades were only appended at the end in date order. Every processed
+    trade is re-hashed into the chained digest, so an edit to any field of
+    any of them (a retagged strategy, a corrected entry time) is caught.
 
-        # Remove trades list from output
-        del data["trades"]
+    Args:
+        sorted_trades: All trades sorted by date
 
-    return aggregates
+    Returns:
+        AnalyticsState or None if a full rebuild is required
+    """
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if data.get("version") != STATE_VERSION:
+        print("Analytics state version changed, rebuilding")
+        return None
+
+    count = data.get("count", 0)
+    if count > len(sorted_trades):
+        print("Trades were removed since the last run, rebuilding")
+        return None
+
+    try:
+        state = AnalyticsState.from_dict(data)
+    except (KeyError, TypeError) as e:
+        print(f"Warning: Invalid analytics state ({e}), rebuilding")
+        return None
+
+    digest = ""
+    for trade in sorted_trades[:count]:
+        digest = trade_digest(trade, digest)
+    if digest != state.digest:
+        print("Previously processed trades changed or were reordered, rebuilding")
+        return None
+
+    return state
+
+
+def save_state(state: AnalyticsState) -> None:
+    """Persist accumulator state next to analytics-data.json"""
+    with open(STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state.to_dict(), f, separators=(",", ":"))
 
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Generate trading analytics")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Ignore persisted analytics state and recompute from scratch",
+    )
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=DEFAULT_POINT_BUDGET,
+        help="Point budget for the downsampled drawdown series "
+        f"(default: {DEFAULT_POINT_BUDGET})",
+    )
+    args = parser.parse_args()
+    if args.max_points < MIN_POINT_BUDGET:
+        parser.error(f"--max-points must be at least {MIN_POINT_BUDGET}")
+
     print("Generating analytics...")
 
     # Load trades index
@@ -307,65 +1095,36 @@ def main():
     trades = index_data.get("trades", [])
     if not trades:
         print("No trades found in index")
-        # Create empty analytics
-        analytics = {
-            "expectancy": 0,
-            "profit_factor": 0,
-            "max_win_streak": 0,
-            "max_loss_streak": 0,
-            "max_drawdown": 0,
-            "kelly_criterion": 0,
-            "by_strategy": {},
-            "by_setup": {},
-            "by_session": {},
-            "drawdown_series": {"labels": [], "values": []},
-            "generated_at": datetime.now().isoformat(),
-        }
     else:
         print(f"Processing {len(trades)} trades...")
 
-        # Sort trades by date
-        sorted_trades = sorted(
-            trades, key=lambda t: t.get("exit_date", t.get("entry_date", ""))
-        )
+    # Sort trades by date
+    sorted_trades = sorted(trades, key=_sort_key)
 
-        # Calculate overall metrics
-        expectancy = calculate_expectancy(sorted_trades)
-        profit_factor = calculate_profit_factor(sorted_trades)
-        max_win_streak, max_loss_streak = calculate_streaks(sorted_trades)
-        drawdown_series = calculate_drawdown_series(sorted_trades)
-        max_drawdown = (
-            min(drawdown_series["values"]) if drawdown_series["values"] else 0
-        )
-        kelly = calculate_kelly_criterion(sorted_trades)
+    state = None if args.rebuild else load_state(sorted_trades)
+    loaded = state is not None
+    if state is None:
+        state = AnalyticsState()
+    elif state.count:
+        print(f"Reusing analytics state for {state.count} previously processed trades")
 
-        # Aggregate by tags
-        by_strategy = aggregate_by_tag(sorted_trades, "strategy")
-        by_setup = aggregate_by_tag(sorted_trades, "setup")
-        by_session = aggregate_by_tag(sorted_trades, "session")
+    new_trades = sorted_trades[state.count:]
+    for trade in new_trades:
+        state.update(trade)
+    print(f"Applied {len(new_trades)} new trade(s)")
 
-        analytics = {
-            "expectancy": expectancy,
-            "profit_factor": profit_factor,
-            "max_win_streak": max_win_streak,
-            "max_loss_streak": max_loss_streak,
-            "max_drawdown": max_drawdown,
-            "kelly_criterion": kelly,
-            "by_strategy": by_strategy,
-            "by_setup": by_setup,
-            "by_session": by_session,
-            "drawdown_series": drawdown_series,
-            "generated_at": datetime.now().isoformat(),
-        }
+    analytics = state.build_analytics(sorted_trades, args.max_points)
 
     # Save analytics data
     os.makedirs("index.directory/assets/charts", exist_ok=True)
-    output_file = "index.directory/assets/charts/analytics-data.json"
 
-    with open(output_file, "w", encoding="utf-8") as f:
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(analytics, f, indent=2)
+    # An unchanged state is not rewritten
+    if new_trades or not loaded:
+        save_state(state)
 
-    print(f"Analytics written to {output_file}")
+    print(f"Analytics written to {OUTPUT_FILE}")
     print(f"Expectancy: ${analytics['expectancy']}")
     print(f"Profit Factor: {analytics['profit_factor']}")
     print(f"Kelly Criterion: {analytics['kelly_criterion']}%")
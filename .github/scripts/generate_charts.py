@@ -3,19 +3,127 @@
 Generate Charts Script
 Generates equity curve data in Chart.js compatible JSON format
 and creates a static chart image using matplotlib (if available)
+
+Performance Optimizations:
+- Per-ticker statistics aggregated once and shared by the ticker chart and
+  the leaderboard
+- Bounded heaps (heapq.nlargest/nsmallest) for top-K/bottom-K rankings, so
+  the full ticker list is never sorted
+- LTTB-downsampled "lite" equity curve (configurable point budget) written
+  next to the full-resolution series so pages can render the small one first
+- Trades ordered, labelled and bucketed by weekday from the timestamp and
+  calendar-key columns written by parse_trades.py (no date parsing here)
+- Small-multiple equity/drawdown curves for every strategy, setup and top
+  ticker from one sorted pass with grouped running sums, rendered as a
+  single grid figure
+- Histogram mode for the P&L distribution above a trade-count threshold:
+  Freedman-Diaconis bin width from a t-digest IQR (no sort), zero-anchored
+  edges so every bin is all wins or all losses, bins filled in one pass
+- Trades bucketed by exit day once; performance-by-day and the calendar
+  heatmap (day-of-year arrays plus week/month totals) both read the buckets
+- Static matplotlib charts rendered as independent jobs in a process pool,
+  each on its own Agg canvas with per-worker style setup
+- Render cache: each chart's input series and style parameters are hashed
+  into chart-manifest.json, and charts whose hash and image are unchanged
+  are not re-rendered
+- Each chart is drawn once and saved as WebP thumbnail, PNG and SVG, with a
+  size budget report and srcset metadata in chart-images.json
 """
 
+import argparse
+import calendar
+import hashlib
+import heapq
 import json
+import math
 import os
-from datetime import datetime
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from accumulators import StatsAccumulator
+from quantile_sketch import TDigest
+from downsample import (
+    DEFAULT_POINT_BUDGET,
+    MIN_POINT_BUDGET,
+    downsample_series,
+    lttb_indices,
+)
+
+# Number of tickers shown in the ticker performance chart
+TICKER_CHART_LIMIT = 20
+
+# Leaderboard size (top-K and bottom-K) and the minimum trades a ticker
+# needs before it is ranked by win rate
+LEADERBOARD_SIZE = 10
+LEADERBOARD_MIN_TRADES = 3
+
+# Small multiples: grouping fields (every strategy and setup, only the most
+# traded tickers), point budget per panel series, grid columns, panel size
+# (inches) and the pixel cap that scales the grid's raster DPI down so the
+# PNG stays within its size budget however many panels there are
+SMALL_MULTIPLE_FIELDS = ["strategy", "setup", "ticker"]
+SMALL_MULTIPLE_TICKER_LIMIT = 8
+SMALL_MULTIPLE_POINTS = 200
+SMALL_MULTIPLE_COLUMNS = 4
+SMALL_MULTIPLE_PANEL_SIZE = (3.2, 2.1)
+SMALL_MULTIPLE_MAX_PIXELS = 800_000
+
+# Trade distribution: above this many trades the per-trade bar chart is
+# replaced by a binned histogram (Freedman-Diaconis width, capped bin count)
+HISTOGRAM_TRADE_THRESHOLD = 100
+HISTOGRAM_MAX_BINS = 60
+
+# Day numbers in the daily buckets count from the Unix epoch
+SECONDS_PER_DAY = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Resolution of the static PNG charts
+STATIC_CHART_DPI = 150
+
+# Image variants written for every static chart: a small WebP thumbnail for
+# phones, the standard PNG and a resolution-independent SVG for retina
+# screens. Budgets (bytes) only drive the size report; nothing is dropped.
+CHART_VARIANTS = {
+    "thumb": {
+        "suffix": "-thumb.webp",
+        "format": "webp",
+        "mime": "image/webp",
+        "dpi": 50,
+        "budget": 40 * 1024,
+    },
+    "png": {
+        "suffix": ".png",
+        "format": "png",
+        "mime": "image/png",
+        "dpi": STATIC_CHART_DPI,
+        "budget": 250 * 1024,
+    },
+    "svg": {
+        "suffix": ".svg",
+        "format": "svg",
+        "mime": "image/svg+xml",
+        "dpi": 72,
+        "budget": 400 * 1024,
+    },
+}
+CHART_IMAGES_FILE = "index.directory/assets/charts/chart-images.json"
+
+# Render cache: bump CHART_STYLE_VERSION whenever the drawing code changes
+# so every cached image is re-rendered once
+CHART_STYLE_VERSION = 3
+CHART_MANIFEST_FILE = "index.directory/assets/charts/chart-manifest.json"
 
 # Try to import matplotlib, but don't fail if it's not available
 try:
     import matplotlib
 
     matplotlib.use("Agg")  # Use non-interactive backend
-    import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
@@ -23,6 +131,16 @@ except ImportError:
     print("Note: matplotlib not available, skipping static chart generation")
 
 
+def _epoch_weekday(day):
+    """Weekday (0=Monday) of a day number since 1970-01-01 (a Thursday)"""
+    return (day + 3) % 7
+
+
+def _exit_sort_key(trade):
+    """Order trades by the exit timestamp precomputed by parse_trades.py"""
+    return trade.get("exit_timestamp") or 0
+
+
 def load_trades_index():
     """Load the trades index JSON file"""
     try:
@@ -58,9 +176,7 @@ def generate_equity_curve_data(trades):
         }
 
     # Sort trades by exit date
-    sorted_trades = sorted(
-        trades, key=lambda t: t.get("exit_date", t.get("entry_date", ""))
-    )
+    sorted_trades = sorted(trades, key=_exit_sort_key)
 
     # Calculate cumulative P&L
     labels = []
@@ -72,12 +188,11 @@ def generate_equity_curve_data(trades):
         running_total += pnl
 
         # Use exit date for the equity point
-        date_str = trade.get("exit_date", trade.get("entry_date", ""))
-        try:
-            date_obj = datetime.fromisoformat(str(date_str))
-            labels.append(date_obj.strftime("%Y-%m-%d"))
-        except (ValueError, TypeError):
-            labels.append(date_str)
+        timestamp = trade.get("exit_timestamp")
+        if timestamp is None:
+            labels.append(trade.get("exit_date", trade.get("entry_date", "")))
+        else:
+            labels.append(time.strftime("%Y-%m-%d", time.gmtime(timestamp)))
 
         cumulative_pnl.append(round(running_total, 2))
 
@@ -104,54 +219,61 @@ def generate_equity_curve_data(trades):
     return chartjs_data
 
 
-def generate_static_chart(
-    trades, output_path="index.directory/assets/charts/equity-curve.png"
-):
+def generate_equity_curve_lite(equity_data, max_points=DEFAULT_POINT_BUDGET):
     """
-    Generate a static equity curve image using matplotlib
+    Downsample equity curve data with LTTB for fast first render
 
     Args:
-        trades (list): List of trade dictionaries
-        output_path (str): Output file path for the chart
+        equity_data (dict): generate_equity_curve_data() result
+        max_points (int): Point budget for the downsampled series
+
+    Returns:
+        dict: Chart.js compatible data structure with at most max_points
+              points and a 'downsampled' block describing the reduction
     """
-    if not MATPLOTLIB_AVAILABLE:
-        print("Skipping static chart generation (matplotlib not available)")
-        return
+    dataset = equity_data["datasets"][0]
+    full_points = len(dataset["data"])
+    series = downsample_series(equity_data["labels"], dataset["data"], max_points)
 
-    if not trades:
-        print("No trades to chart")
-        return
+    lite_dataset = dict(dataset, data=series["values"])
+    if len(series["values"]) < full_points:
+        # Point markers are what makes thousands of points slow to draw
+        lite_dataset["pointRadius"] = 0
 
-    # Sort trades by exit date
-    sorted_trades = sorted(
-        trades, key=lambda t: t.get("exit_date", t.get("entry_date", ""))
-    )
+    return {
+        "labels": series["labels"],
+        "datasets": [lite_dataset],
+        "downsampled": {
+            "points": len(series["values"]),
+            "full_points": full_points,
+            "full_data": "equity-curve-data.json",
+        },
+    }
 
-    # Calculate cumulative P&L
-    dates = []
-    cumulative_pnl = []
-    running_total = 0
 
-    for trade in sorted_trades:
-        pnl = trade.get("pnl_usd", 0)
-        running_total += pnl
+def _init_chart_worker():
+    """Per-process matplotlib setup, run once in each render worker"""
+    matplotlib.use("Agg")
+    matplotlib.style.use("dark_background")
 
-        date_str = trade.get("exit_date", trade.get("entry_date", ""))
-        try:
-            date_obj = datetime.fromisoformat(str(date_str))
-            dates.append(date_obj)
-            cumulative_pnl.append(running_total)
-        except (ValueError, TypeError):
-            print(f"Warning: Could not parse date {date_str}")
-            continue
 
-    if not dates:
-        print("No valid dates found for charting")
-        return
+def _style_axes(fig, ax):
+    """Shared dark theme for static charts"""
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["left"].set_color("#a1a1aa")
+    ax.spines["bottom"].set_color("#a1a1aa")
+    ax.tick_params(colors="#e4e4e7")
+
+    fig.patch.set_facecolor("#0a0e27")
+    ax.set_facecolor("#0f1429")
+
 
-    # Create the plot with dark theme
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(12, 6))
+def _draw_equity_curve(fig, data):
+    """Draw the cumulative P&L curve onto fig"""
+    dates = data["dates"]
+    cumulative_pnl = data["values"]
+    ax = fig.add_subplot()
 
     # Plot the equity curve
     ax.plot(
@@ -172,65 +294,24 @@ def generate_static_chart(
     # Format x-axis dates
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%m/%d"))
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-    plt.xticks(rotation=45, ha="right")
+    fig.autofmt_xdate(rotation=45, ha="right")
 
     # Grid
     ax.grid(True, alpha=0.2, color="#a1a1aa")
+    _style_axes(fig, ax)
 
-    # Style
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-    ax.spines["left"].set_color("#a1a1aa")
-    ax.spines["bottom"].set_color("#a1a1aa")
-    ax.tick_params(colors="#e4e4e7")
 
-    # Set background color
-    fig.patch.set_facecolor("#0a0e27")
-    ax.set_facecolor("#0f1429")
-
-    # Tight layout
-    plt.tight_layout()
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    # Save the chart
-    plt.savefig(output_path, dpi=150, facecolor="#0a0e27", edgecolor="none")
-    plt.close()
-
-    print(f"Static chart saved to {output_path}")
-
-
-def generate_trade_distribution_chart(
-    trades, output_path="index.directory/assets/charts/trade-distribution.png"
-):
-    """
-    Generate a bar chart showing P&L distribution
-
-    Args:
-        trades (list): List of trade dictionaries
-        output_path (str): Output file path for the chart
-    """
-    if not MATPLOTLIB_AVAILABLE:
-        print("Skipping trade distribution chart generation (matplotlib not available)")
-        return
-
-    if not trades:
-        return
-
-    # Get P&L values
-    pnls = [t.get("pnl_usd", 0) for t in trades]
-    trade_numbers = [f"#{t.get('trade_number', i)}" for i, t in enumerate(trades, 1)]
-
-    # Create the plot
-    plt.style.use("dark_background")
-    fig, ax = plt.subplots(figsize=(14, 6))
+def _draw_trade_distribution(fig, data):
+    """Draw the per-trade P&L bar chart onto fig"""
+    pnls = data["values"]
+    trade_numbers = data["labels"]
+    ax = fig.add_subplot()
 
     # Color bars based on positive/negative
     colors = ["#00ff88" if pnl >= 0 else "#ff4757" for pnl in pnls]
 
     # Plot bars
-    bars = ax.bar(
+    ax.bar(
         trade_numbers, pnls, color=colors, alpha=0.8, edgecolor="#0a0e27", linewidth=1
     )
 
@@ -250,41 +331,579 @@ def generate_trade_distribution_chart(
 
     # Rotate x-axis labels if many trades
     if len(trade_numbers) > 10:
-        plt.xticks(rotation=45, ha="right")
+        ax.tick_params(axis="x", labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment("right")
 
     # Grid
     ax.grid(True, alpha=0.2, axis="y", color="#a1a1aa")
+    _style_axes(fig, ax)
+
+
+def _draw_trade_histogram(fig, data):
+    """Draw the binned P&L histogram onto fig"""
+    edges = data["edges"]
+    counts = data["counts"]
+    ax = fig.add_subplot()
+
+    colors = ["#00ff88" if low >= 0 else "#ff4757" for low in edges[:-1]]
+    ax.bar(
+        edges[:-1],
+        counts,
+        width=data["bin_width"],
+        align="edge",
+        color=colors,
+        alpha=0.8,
+        edgecolor="#0a0e27",
+        linewidth=1,
+    )
 
-    # Style
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-    ax.spines["left"].set_color("#a1a1aa")
-    ax.spines["bottom"].set_color("#a1a1aa")
-    ax.tick_params(colors="#e4e4e7")
+    # Zero is always a bin edge, so this separates losses from wins
+    ax.axvline(x=0, color="#ffffff", linestyle="-", alpha=0.5, linewidth=1)
 
-    # Set background color
-    fig.patch.set_facecolor("#0a0e27")
-    ax.set_facecolor("#0f1429")
+    ax.set_title(
+        "Trade P&L Distribution",
+        fontsize=16,
+        fontweight="bold",
+        color="#00ff88",
+        pad=20,
+    )
+    # Escape "$" so matplotlib does not treat the label as mathtext
+    width_label = f"{data['bin_width']:,g}"
+    ax.set_xlabel(f"P&L (\\$, bins of \\${width_label})", fontsize=12, color="#e4e4e7")
+    ax.set_ylabel("Trades", fontsize=12, color="#e4e4e7")
+
+    ax.grid(True, alpha=0.2, axis="y", color="#a1a1aa")
+    _style_axes(fig, ax)
+
+
+def _draw_small_multiples(fig, data):
+    """Draw one equity/drawdown panel per group in a shared grid"""
+    panels = data["panels"]
+    columns = min(SMALL_MULTIPLE_COLUMNS, len(panels))
+    rows = math.ceil(len(panels) / columns)
+    axes = fig.subplots(rows, columns, squeeze=False)
+
+    for ax, panel in zip(axes.flat, panels):
+        equity = panel["equity"]
+        drawdown = panel["drawdown"]
+        ax.plot(equity["index"], equity["values"], color="#00ff88", linewidth=1.2)
+        ax.fill_between(
+            drawdown["index"], drawdown["values"], alpha=0.35, color="#ff4757"
+        )
+        ax.axhline(y=0, color="#a1a1aa", linestyle="--", alpha=0.4, linewidth=0.8)
+        ax.set_title(panel["title"], fontsize=10, color="#e4e4e7")
+        ax.tick_params(labelsize=7)
+        ax.grid(True, alpha=0.15, color="#a1a1aa")
+        _style_axes(fig, ax)
+
+    # Hide unused cells of the last row
+    for ax in list(axes.flat)[len(panels) :]:
+        ax.set_visible(False)
+
+    fig.suptitle(
+        "Equity & Drawdown by Group", fontsize=14, fontweight="bold", color="#00ff88"
+    )
 
-    # Tight layout
-    plt.tight_layout()
 
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+# Static chart renderers by job kind; each draws onto a fresh Figure
+CHART_RENDERERS = {
+    "equity_curve": _draw_equity_curve,
+    "trade_distribution": _draw_trade_distribution,
+    "trade_histogram": _draw_trade_histogram,
+    "small_multiples": _draw_small_multiples,
+}
+
+
+def chart_variant_paths(output_path):
+    """
+    Output path of every image variant for a chart
+
+    Args:
+        output_path (str): The chart's PNG path
+
+    Returns:
+        dict: {variant: path}
+    """
+    base = os.path.splitext(output_path)[0]
+    return {variant: base + spec["suffix"] for variant, spec in CHART_VARIANTS.items()}
+
+
+def render_chart(job):
+    """
+    Render one static chart job on its own Agg canvas
+
+    The figure is drawn once and saved in every CHART_VARIANTS format.
+    Runs inside a worker process, so it never touches pyplot's global figure
+    state and never raises: failures are returned for per-chart reporting.
+
+    Args:
+        job (dict): {'name', 'kind', 'output_path', 'figsize', 'data'} and
+                    optionally 'dpi_scale' for the raster variants
+
+    Returns:
+        dict: {'name', 'output_path', 'ok', 'error'}
+    """
+    result = {"name": job["name"], "output_path": job["output_path"], "ok": False}
+    try:
+        fig = Figure(figsize=job["figsize"])
+        FigureCanvasAgg(fig)
+        CHART_RENDERERS[job["kind"]](fig, job["data"])
+        fig.tight_layout()
+
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(job["output_path"]), exist_ok=True)
+        for variant, path in chart_variant_paths(job["output_path"]).items():
+            spec = CHART_VARIANTS[variant]
+            fig.savefig(
+                path,
+                format=spec["format"],
+                dpi=variant_dpi(job, spec),
+                facecolor="#0a0e27",
+                edgecolor="none",
+            )
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def render_chart_jobs(jobs, workers=None):
+    """
+    Render static chart jobs, in parallel when there is more than one
+
+    Args:
+        jobs (list): Chart jobs from the build_*_chart_job() functions
+        workers (int): Process count (default: one per job, capped at CPUs)
+
+    Returns:
+        list: render_chart() results in job order
+    """
+    if not jobs:
+        return []
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+
+    if workers <= 1 or len(jobs) == 1:
+        _init_chart_worker()
+        return [render_chart(job) for job in jobs]
+
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_chart_worker
+    ) as executor:
+        futures = [executor.submit(render_chart, job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Worker crashed or the job could not be sent to it
+                results.append(
+                    {
+                        "name": job["name"],
+                        "output_path": job["output_path"],
+                        "ok": False,
+                        "error": f"{type(e).__name__}: {e}",
+                    }
+                )
+    return results
+
+
+def variant_dpi(job, spec):
+    """DPI of one image variant of a chart job (raster DPI may be scaled)"""
+    if spec["format"] == "svg":
+        return spec["dpi"]
+    return spec["dpi"] * job.get("dpi_scale", 1)
+
+
+def chart_job_hash(job):
+    """
+    Hash everything that affects a chart image: plotted data and style
+
+    Args:
+        job (dict): Chart job
+
+    Returns:
+        str: Hex digest
+    """
+    payload = json.dumps(
+        {
+            "kind": job["kind"],
+            "figsize": job["figsize"],
+            "dpi_scale": job.get("dpi_scale", 1),
+            "variants": CHART_VARIANTS,
+            "style_version": CHART_STYLE_VERSION,
+            "matplotlib": matplotlib.__version__,
+            "data": job["data"],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_chart_manifest():
+    """Load {output_path: hash} for previously rendered charts"""
+    try:
+        with open(CHART_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_chart_manifest(manifest):
+    """Persist the chart render manifest"""
+    with open(CHART_MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def split_cached_jobs(jobs, manifest):
+    """
+    Separate jobs whose image is already up to date from those to render
+
+    Args:
+        jobs (list): Chart jobs
+        manifest (dict): {output_path: hash} from the previous run
+
+    Returns:
+        tuple: (jobs to render, cached jobs, {output_path: hash} for all jobs)
+    """
+    to_render = []
+    cached = []
+    hashes = {}
+    for job in jobs:
+        digest = chart_job_hash(job)
+        hashes[job["output_path"]] = digest
+        paths = chart_variant_paths(job["output_path"]).values()
+        if manifest.get(job["output_path"]) == digest and all(
+            os.path.exists(path) for path in paths
+        ):
+            cached.append(job)
+        else:
+            to_render.append(job)
+    return to_render, cached, hashes
+
+
+def _srcset(variants):
+    """srcset attribute value for variants of one MIME type"""
+    return ", ".join(f"{v['src']} {v['width']}w" for v in variants)
+
+
+def build_chart_image_metadata(jobs):
+    """
+    Describe the image variants of every chart for responsive <img>/<picture>
+
+    Args:
+        jobs (list): Chart jobs (rendered or cached)
+
+    Returns:
+        dict: {chart: {'name', 'src', 'srcset', 'sources', 'svg',
+              'variants': [...]}} keyed by the PNG's base name. Browsers do
+              not choose by type within one srcset, so each MIME type gets
+              its own: 'sources' holds one {'type', 'srcset', 'media'} per
+              non-PNG raster type for <picture><source>, limited to
+              viewports no wider than its widest candidate, while 'src' and
+              'srcset' list only PNG candidates for the <img> fallback
+    """
+    images = {}
+    for job in jobs:
+        width_in, height_in = job["figsize"]
+        variants = []
+        for variant, path in chart_variant_paths(job["output_path"]).items():
+            if not os.path.exists(path):
+                continue
+            spec = CHART_VARIANTS[variant]
+            size = os.path.getsize(path)
+            entry = {
+                "variant": variant,
+                "src": os.path.basename(path),
+                "type": spec["mime"],
+                "bytes": size,
+                "budget": spec["budget"],
+                "over_budget": size > spec["budget"],
+            }
+            if spec["format"] != "svg":
+                entry["width"] = round(width_in * variant_dpi(job, spec))
+                entry["height"] = round(height_in * variant_dpi(job, spec))
+            variants.append(entry)
+
+        # Raster candidates grouped by MIME type, each ordered by width
+        by_type = {}
+        for v in sorted(
+            (v for v in variants if "width" in v), key=lambda v: v["width"]
+        ):
+            by_type.setdefault(v["type"], []).append(v)
+        png = by_type.pop("image/png", [])
+        svg = next((v["src"] for v in variants if v["variant"] == "svg"), None)
+        key = os.path.splitext(os.path.basename(job["output_path"]))[0]
+        images[key] = {
+            "name": job["name"],
+            "src": os.path.basename(job["output_path"]),
+            "srcset": _srcset(png),
+            "sources": [
+                {
+                    "type": mime,
+                    "srcset": _srcset(candidates),
+                    "media": f"(max-width: {candidates[-1]['width']}px)",
+                }
+                for mime, candidates in by_type.items()
+            ],
+            "svg": svg,
+            "variants": variants,
+        }
+    return images
+
+
+def _report_image_sizes(images):
+    """Print each chart variant's size against its budget; return overruns"""
+    over = 0
+    for image in images.values():
+        print(f"  {image['name']}:")
+        for v in image["variants"]:
+            flag = "  ⚠ over budget" if v["over_budget"] else ""
+            over += v["over_budget"]
+            print(
+                f"    {v['src']}: {v['bytes'] / 1024:.1f} KB"
+                f" / {v['budget'] / 1024:.0f} KB{flag}"
+            )
+    return over
+
+
+def build_equity_chart_job(
+    trades, output_path="index.directory/assets/charts/equity-curve.png"
+):
+    """
+    Prepare the static equity curve job (cumulative P&L by exit date)
+
+    Args:
+        trades (list): List of trade dictionaries
+        output_path (str): Output file path for the chart
+
+    Returns:
+        dict: Chart job for render_chart(), or None if there is nothing to plot
+    """
+    if not trades:
+        print("No trades to chart")
+        return None
+
+    # Sort trades by exit date
+    sorted_trades = sorted(trades, key=_exit_sort_key)
+
+    # Calculate cumulative P&L
+    dates = []
+    cumulative_pnl = []
+    running_total = 0
+
+    for trade in sorted_trades:
+        pnl = trade.get("pnl_usd", 0)
+        running_total += pnl
+
+        timestamp = trade.get("exit_timestamp")
+        if timestamp is None:
+            print(f"Warning: No exit timestamp for trade {trade.get('trade_number')}")
+            continue
+        # Matplotlib date numbers are days since the Unix epoch
+        dates.append(timestamp / 86400)
+        cumulative_pnl.append(running_total)
+
+    if not dates:
+        print("No valid dates found for charting")
+        return None
+
+    return {
+        "name": "Equity curve",
+        "kind": "equity_curve",
+        "output_path": output_path,
+        "figsize": (12, 6),
+        "data": {"dates": dates, "values": cumulative_pnl},
+    }
+
+
+def _nice_width(width):
+    """Round a bin width up to 1, 2 or 5 times a power of ten"""
+    magnitude = 10 ** math.floor(math.log10(width))
+    for step in (1, 2, 5, 10):
+        if width <= step * magnitude:
+            return step * magnitude
+    return 10 * magnitude
+
+
+def _width_decimals(width):
+    """Decimal places that tell apart dollar edges one bin width apart"""
+    if width >= 1:
+        return 0
+    # Cents at least, finer for sub-cent (1/2/5 x 10^-k) widths
+    return max(2, -math.floor(math.log10(width)))
 
-    # Save the chart
-    plt.savefig(output_path, dpi=150, facecolor="#0a0e27", edgecolor="none")
-    plt.close()
 
-    print(f"Distribution chart saved to {output_path}")
+def calculate_pnl_histogram(pnls, max_bins=HISTOGRAM_MAX_BINS):
+    """
+    Bin P&L values with a Freedman-Diaconis width anchored at zero
+
+    The IQR comes from a t-digest, so the values are never sorted. The width
+    2 × IQR / n^(1/3) is rounded up to a 1/2/5 step (and widened if needed to
+    stay within max_bins). Edges are multiples of the width, so zero is always
+    an edge and every bin holds only losses or only wins/breakevens. Counts
+    are filled in a single pass.
+
+    Args:
+        pnls (list): P&L values
+        max_bins (int): Upper bound on the number of bins
+
+    Returns:
+        dict: {'bin_width', 'edges', 'counts', 'wins', 'losses'}
+    """
+    digest = TDigest()
+    digest.extend(pnls)
+    n = digest.count
+    low, high = digest.min, digest.max
+
+    iqr = digest.quantile(0.75) - digest.quantile(0.25)
+    width = 2 * iqr / n ** (1 / 3) if iqr > 0 else 0
+    if width <= 0:
+        # Degenerate spread: fall back to Sturges' rule over the range
+        width = (high - low) / (math.ceil(math.log2(n)) + 1) if high > low else 1
+    width = max(width, (high - low) / max_bins)
+    width = _nice_width(width)
+    while math.floor(high / width) - math.floor(low / width) + 1 > max_bins:
+        width = _nice_width(width * 1.01)
+
+    first = math.floor(low / width)
+    bin_count = math.floor(high / width) - first + 1
+    counts = [0] * bin_count
+    wins = [0] * bin_count
+    losses = [0] * bin_count
+    for pnl in pnls:
+        i = min(math.floor(pnl / width) - first, bin_count - 1)
+        counts[i] += 1
+        if pnl > 0:
+            wins[i] += 1
+        elif pnl < 0:
+            losses[i] += 1
+
+    return {
+        "bin_width": width,
+        "edges": [
+            round((first + i) * width, max(2, _width_decimals(width)))
+            for i in range(bin_count + 1)
+        ],
+        "counts": counts,
+        "wins": wins,
+        "losses": losses,
+    }
+
+
+def _use_histogram(trade_count, mode):
+    """Resolve the distribution mode ('auto', 'bars' or 'histogram')"""
+    if mode == "auto":
+        return trade_count > HISTOGRAM_TRADE_THRESHOLD
+    return mode == "histogram"
+
+
+def build_distribution_chart_job(
+    trades,
+    output_path="index.directory/assets/charts/trade-distribution.png",
+    mode="auto",
+):
+    """
+    Prepare the static P&L distribution job (per-trade bars or histogram)
+
+    Args:
+        trades (list): List of trade dictionaries
+        output_path (str): Output file path for the chart
+        mode (str): 'auto' (histogram above HISTOGRAM_TRADE_THRESHOLD trades),
+                    'bars' or 'histogram'
+
+    Returns:
+        dict: Chart job for render_chart(), or None if there is nothing to plot
+    """
+    if not trades:
+        return None
+
+    if _use_histogram(len(trades), mode):
+        return {
+            "name": "Trade distribution",
+            "kind": "trade_histogram",
+            "output_path": output_path,
+            "figsize": (14, 6),
+            "data": calculate_pnl_histogram([t.get("pnl_usd", 0) for t in trades]),
+        }
+
+    return {
+        "name": "Trade distribution",
+        "kind": "trade_distribution",
+        "output_path": output_path,
+        "figsize": (14, 6),
+        "data": {
+            "labels": [f"#{t.get('trade_number', i)}" for i, t in enumerate(trades, 1)],
+            "values": [t.get("pnl_usd", 0) for t in trades],
+        },
+    }
+
+
+def build_small_multiples_chart_job(
+    small_multiples, output_path="index.directory/assets/charts/small-multiples.png"
+):
+    """
+    Prepare the single grid figure of per-group equity/drawdown panels
 
+    Args:
+        small_multiples (dict): generate_small_multiples_data() result
+        output_path (str): Output file path for the chart
 
-def generate_trade_distribution_data(trades):
+    Returns:
+        dict: Chart job for render_chart(), or None if there are no groups
+    """
+    panels = [
+        {
+            "title": f"{field.title()}: {group}",
+            "equity": panel["equity"],
+            "drawdown": panel["drawdown"],
+        }
+        for field in SMALL_MULTIPLE_FIELDS
+        for group, panel in small_multiples.get(f"by_{field}", {}).items()
+    ]
+    if not panels:
+        return None
+
+    columns = min(SMALL_MULTIPLE_COLUMNS, len(panels))
+    rows = math.ceil(len(panels) / columns)
+    panel_width, panel_height = SMALL_MULTIPLE_PANEL_SIZE
+    figsize = (panel_width * columns, panel_height * rows + 0.6)
+    png_pixels = figsize[0] * figsize[1] * STATIC_CHART_DPI**2
+    return {
+        "name": "Small multiples",
+        "kind": "small_multiples",
+        "output_path": output_path,
+        "figsize": figsize,
+        "dpi_scale": round(
+            min(1.0, math.sqrt(SMALL_MULTIPLE_MAX_PIXELS / png_pixels)), 3
+        ),
+        "data": {"panels": panels},
+    }
+
+
+def _report_chart_results(results):
+    """Print one status line per rendered chart; return the failure count"""
+    failures = 0
+    for result in results:
+        if result["ok"]:
+            print(f"  ✓ {result['name']} saved to {result['output_path']}")
+        else:
+            failures += 1
+            print(f"  ✗ {result['name']} failed: {result['error']}")
+    return failures
+
+
+def generate_trade_distribution_data(trades, mode="auto"):
     """
     Generate trade distribution data (wins vs losses) in Chart.js format
 
     Args:
         trades (list): List of trade dictionaries
+        mode (str): 'auto' (histogram above HISTOGRAM_TRADE_THRESHOLD trades),
+                    'bars' (one bar per trade) or 'histogram'
 
     Returns:
         dict: Chart.js compatible data structure
@@ -295,10 +914,32 @@ def generate_trade_distribution_data(trades):
             "datasets": [{"label": "P&L", "data": [], "backgroundColor": []}],
         }
 
+    if _use_histogram(len(trades), mode):
+        histogram = calculate_pnl_histogram([t.get("pnl_usd", 0) for t in trades])
+        edges = histogram["edges"]
+        colors = ["#00ff88" if low >= 0 else "#ff4757" for low in edges[:-1]]
+        # Sub-dollar bins (penny stocks) need cents or finer to stay distinct
+        decimals = _width_decimals(histogram["bin_width"])
+        return {
+            "mode": "histogram",
+            "labels": [
+                f"${edges[i]:,.{decimals}f} to ${edges[i + 1]:,.{decimals}f}"
+                for i in range(len(edges) - 1)
+            ],
+            "datasets": [
+                {
+                    "label": "Trades",
+                    "data": histogram["counts"],
+                    "backgroundColor": colors,
+                    "borderColor": colors,
+                    "borderWidth": 2,
+                }
+            ],
+            "histogram": histogram,
+        }
+
     # Sort trades by exit date
-    sorted_trades = sorted(
-        trades, key=lambda t: t.get("exit_date", t.get("entry_date", ""))
-    )
+    sorted_trades = sorted(trades, key=_exit_sort_key)
 
     # Get trade numbers and P&L values
     labels = []
@@ -327,12 +968,37 @@ def generate_trade_distribution_data(trades):
     }
 
 
-def generate_performance_by_day_data(trades):
+def bucket_daily_pnl(trades):
+    """
+    Bucket trades by exit day in a single pass
+
+    Args:
+        trades (list): List of trade dictionaries
+
+    Returns:
+        dict: {epoch day (exit_timestamp // 86400): [total P&L, trade count]}
+    """
+    daily = {}
+    for trade in trades:
+        timestamp = trade.get("exit_timestamp")
+        if timestamp is None:
+            continue
+        day = timestamp // SECONDS_PER_DAY
+        bucket = daily.get(day)
+        if bucket is None:
+            bucket = daily[day] = [0.0, 0]
+        bucket[0] += trade.get("pnl_usd", 0)
+        bucket[1] += 1
+    return daily
+
+
+def generate_performance_by_day_data(trades, daily=None):
     """
     Generate performance by day of week data in Chart.js format
 
     Args:
         trades (list): List of trade dictionaries
+        daily (dict): Optional precomputed bucket_daily_pnl() result
 
     Returns:
         dict: Chart.js compatible data structure
@@ -355,18 +1021,14 @@ def generate_performance_by_day_data(trades):
     ]
     day_stats = {day: {"total_pnl": 0, "count": 0} for day in days}
 
-    # Aggregate by day of week
-    for trade in trades:
-        exit_date_str = trade.get("exit_date", trade.get("entry_date", ""))
-        try:
-            date_obj = datetime.fromisoformat(str(exit_date_str))
-            day_name = date_obj.strftime("%A")
-            pnl = trade.get("pnl_usd", 0)
-
-            day_stats[day_name]["total_pnl"] += pnl
-            day_stats[day_name]["count"] += 1
-        except (ValueError, TypeError):
-            continue
+    if daily is None:
+        daily = bucket_daily_pnl(trades)
+
+    # Aggregate the daily buckets by day of week
+    for day, (pnl, count) in daily.items():
+        day_name = days[_epoch_weekday(day)]
+        day_stats[day_name]["total_pnl"] += pnl
+        day_stats[day_name]["count"] += count
 
     # Calculate averages
     labels = []
@@ -394,12 +1056,90 @@ def generate_performance_by_day_data(trades):
     }
 
 
-def generate_ticker_performance_data(trades):
+def generate_calendar_heatmap_data(daily):
+    """
+    GitHub-style calendar heatmap data from daily P&L buckets
+
+    Each year is stored as day-of-year arrays (index 0 = January 1) rather
+    than one object per day. Week totals are indexed by heatmap column:
+    weeks start on Monday and column 0 holds January 1, so a day's column is
+    (day_of_year + first_weekday) // 7.
+
+    Args:
+        daily (dict): bucket_daily_pnl() result
+
+    Returns:
+        dict: {'years': {year: {'first_weekday', 'days', 'pnl', 'trades',
+              'week_pnl', 'week_trades', 'month_pnl', 'month_trades',
+              'total_pnl', 'total_trades', 'max_abs_pnl'}}}
+    """
+    years = {}
+    for day, (pnl, count) in sorted(daily.items()):
+        current = date.fromordinal(EPOCH_ORDINAL + day)
+        year = years.get(current.year)
+        if year is None:
+            jan_1 = date(current.year, 1, 1)
+            days_in_year = 366 if calendar.isleap(current.year) else 365
+            first_weekday = jan_1.weekday()
+            columns = (days_in_year - 1 + first_weekday) // 7 + 1
+            year = years[current.year] = {
+                "first_weekday": first_weekday,
+                "days": days_in_year,
+                "pnl": [0] * days_in_year,
+                "trades": [0] * days_in_year,
+                "week_pnl": [0] * columns,
+                "week_trades": [0] * columns,
+                "month_pnl": [0] * 12,
+                "month_trades": [0] * 12,
+                "_start": day - current.timetuple().tm_yday + 1,
+            }
+
+        day_of_year = day - year["_start"]
+        column = (day_of_year + year["first_weekday"]) // 7
+        year["pnl"][day_of_year] = pnl
+        year["trades"][day_of_year] = count
+        year["week_pnl"][column] += pnl
+        year["week_trades"][column] += count
+        year["month_pnl"][current.month - 1] += pnl
+        year["month_trades"][current.month - 1] += count
+
+    for year in years.values():
+        del year["_start"]
+        for key in ("pnl", "week_pnl", "month_pnl"):
+            year[key] = [round(value, 2) for value in year[key]]
+        year["total_pnl"] = round(sum(year["month_pnl"]), 2)
+        year["total_trades"] = sum(year["month_trades"])
+        year["max_abs_pnl"] = max(abs(value) for value in year["pnl"])
+
+    return {"years": {str(y): years[y] for y in sorted(years)}}
+
+
+def aggregate_ticker_stats(trades):
+    """
+    Aggregate per-ticker statistics in a single pass
+
+    Args:
+        trades (list): List of trade dictionaries
+
+    Returns:
+        dict: {ticker: StatsAccumulator}
+    """
+    ticker_stats = {}
+    for trade in trades:
+        ticker = trade.get("ticker", "UNKNOWN")
+        if ticker not in ticker_stats:
+            ticker_stats[ticker] = StatsAccumulator()
+        ticker_stats[ticker].add(trade.get("pnl_usd", 0))
+    return ticker_stats
+
+
+def generate_ticker_performance_data(trades, ticker_stats=None):
     """
     Generate performance by ticker data in Chart.js format
 
     Args:
         trades (list): List of trade dictionaries
+        ticker_stats (dict): Optional precomputed aggregate_ticker_stats() result
 
     Returns:
         dict: Chart.js compatible data structure
@@ -410,22 +1150,12 @@ def generate_ticker_performance_data(trades):
             "datasets": [{"label": "Total P&L", "data": [], "backgroundColor": []}],
         }
 
-    # Aggregate by ticker
-    ticker_stats = {}
-
-    for trade in trades:
-        ticker = trade.get("ticker", "UNKNOWN")
-        pnl = trade.get("pnl_usd", 0)
-
-        if ticker not in ticker_stats:
-            ticker_stats[ticker] = {"total_pnl": 0, "count": 0}
-
-        ticker_stats[ticker]["total_pnl"] += pnl
-        ticker_stats[ticker]["count"] += 1
+    if ticker_stats is None:
+        ticker_stats = aggregate_ticker_stats(trades)
 
-    # Sort by total P&L (descending)
-    sorted_tickers = sorted(
-        ticker_stats.items(), key=lambda x: x[1]["total_pnl"], reverse=True
+    # Top tickers by total P&L via a bounded heap (no full sort)
+    top_tickers = heapq.nlargest(
+        TICKER_CHART_LIMIT, ticker_stats.items(), key=lambda x: x[1].total_pnl
     )
 
     # Prepare data
@@ -433,9 +1163,9 @@ def generate_ticker_performance_data(trades):
     total_pnls = []
     colors = []
 
-    for ticker, stats in sorted_tickers[:20]:  # Top 20 tickers
+    for ticker, stats in top_tickers:
         labels.append(ticker)
-        total_pnl = stats["total_pnl"]
+        total_pnl = stats.total_pnl
         total_pnls.append(round(total_pnl, 2))
         colors.append("#00ff88" if total_pnl >= 0 else "#ff4757")
 
@@ -453,8 +1183,248 @@ def generate_ticker_performance_data(trades):
     }
 
 
+def _ticker_row(ticker, stats):
+    """Leaderboard entry for one ticker"""
+    return {
+        "ticker": ticker,
+        "trades": stats.count,
+        "total_pnl": round(stats.total_pnl, 2),
+        "avg_pnl": round(stats.avg_pnl, 2),
+        "win_rate": round(stats.win_rate * 100, 1),
+    }
+
+
+def generate_ticker_leaderboard(ticker_stats, size=LEADERBOARD_SIZE):
+    """
+    Build top-K/bottom-K ticker rankings plus long-tail statistics
+
+    Rankings use bounded heaps, so the cost is O(tickers × log K) and the
+    full ticker list is never sorted. Win-rate rankings only consider
+    tickers with at least LEADERBOARD_MIN_TRADES trades.
+
+    Args:
+        ticker_stats (dict): {ticker: StatsAccumulator}
+        size (int): Number of tickers in each top/bottom list
+
+    Returns:
+        dict: Rankings by total P&L, win rate and trade count, and aggregate
+              stats for every ticker outside the P&L top/bottom lists
+    """
+    items = ticker_stats.items()
+    rated = [item for item in items if item[1].count >= LEADERBOARD_MIN_TRADES]
+
+    def by_pnl(item):
+        return item[1].total_pnl
+
+    def by_win_rate(item):
+        return (item[1].win_rate, item[1].count)
+
+    def by_count(item):
+        return (item[1].count, item[1].total_pnl)
+
+    rankings = {
+        "total_pnl": (
+            heapq.nlargest(size, items, key=by_pnl),
+            heapq.nsmallest(size, items, key=by_pnl),
+        ),
+        "win_rate": (
+            heapq.nlargest(size, rated, key=by_win_rate),
+            heapq.nsmallest(size, rated, key=by_win_rate),
+        ),
+        "trade_count": (
+            heapq.nlargest(size, items, key=by_count),
+            heapq.nsmallest(size, items, key=by_count),
+        ),
+    }
+
+    # Long tail: everything outside the P&L winners and losers lists
+    ranked = {t for t, _ in rankings["total_pnl"][0]}
+    ranked.update(t for t, _ in rankings["total_pnl"][1])
+    tail = StatsAccumulator()
+    tail_tickers = 0
+    for ticker, stats in items:
+        if ticker not in ranked:
+            tail.merge(stats)
+            tail_tickers += 1
+
+    return {
+        "size": size,
+        "min_trades_for_win_rate": LEADERBOARD_MIN_TRADES,
+        "total_tickers": len(ticker_stats),
+        "rankings": {
+            metric: {
+                "top": [_ticker_row(t, s) for t, s in top],
+                "bottom": [_ticker_row(t, s) for t, s in bottom],
+            }
+            for metric, (top, bottom) in rankings.items()
+        },
+        "long_tail": {
+            "tickers": tail_tickers,
+            "trades": tail.count,
+            "total_pnl": round(tail.total_pnl, 2),
+            "avg_pnl_per_trade": round(tail.avg_pnl, 2),
+            "avg_pnl_per_ticker": (
+                round(tail.total_pnl / tail_tickers, 2) if tail_tickers else 0
+            ),
+            "win_rate": round(tail.win_rate * 100, 1),
+            "profit_factor": tail.profit_factor(),
+        },
+    }
+
+
+def generate_ticker_summary_table(ticker_stats):
+    """
+    Per-ticker summary table in compact columnar form
+
+    Args:
+        ticker_stats (dict): {ticker: StatsAccumulator}
+
+    Returns:
+        dict: {'columns': [...], 'rows': [[...], ...]} in first-traded order
+    """
+    return {
+        "columns": [
+            "ticker",
+            "trades",
+            "wins",
+            "losses",
+            "win_rate",
+            "total_pnl",
+            "avg_pnl",
+            "gross_profit",
+            "gross_loss",
+        ],
+        "rows": [
+            [
+                ticker,
+                stats.count,
+                stats.wins,
+                stats.losses,
+                round(stats.win_rate * 100, 1),
+                round(stats.total_pnl, 2),
+                round(stats.avg_pnl, 2),
+                round(stats.gross_profit, 2),
+                round(stats.gross_loss, 2),
+            ]
+            for ticker, stats in ticker_stats.items()
+        ],
+    }
+
+
+def _panel_series(labels, values, max_points):
+    """LTTB-downsampled series keeping each point's index within the group"""
+    indices = lttb_indices(values, max_points)
+    return {
+        "index": indices,
+        "labels": [labels[i] for i in indices],
+        "values": [values[i] for i in indices],
+    }
+
+
+def generate_small_multiples_data(
+    trades, ticker_limit=SMALL_MULTIPLE_TICKER_LIMIT, max_points=SMALL_MULTIPLE_POINTS
+):
+    """
+    Per-group equity and drawdown curves for strategies, setups and tickers
+
+    Every strategy and setup gets a panel; only the `ticker_limit` most
+    traded tickers are kept, selected with one counting pass. Trades are
+    then sorted once, and a single pass appends every trade to its groups'
+    running cumulative P&L and running peak, so no group is re-sorted or
+    re-scanned.
+
+    Args:
+        trades (list): List of trade dictionaries
+        ticker_limit (int): Tickers kept (by trade count)
+        max_points (int): LTTB point budget for each panel series
+
+    Returns:
+        dict: {'by_<field>': {group: {'trades', 'total_pnl', 'max_drawdown',
+              'equity': series, 'drawdown': series}}} where each series has
+              'index' (trade number within the group), 'labels' and 'values'
+    """
+    counts = Counter(t.get("ticker") or "Unclassified" for t in trades)
+    top_tickers = {
+        ticker
+        for ticker, _ in heapq.nlargest(
+            ticker_limit, counts.items(), key=lambda x: x[1]
+        )
+    }
+
+    running = {}  # {(field, group): {'total', 'peak', 'labels', 'equity', 'drawdown'}}
+    for trade in sorted(trades, key=_exit_sort_key):
+        pnl = trade.get("pnl_usd", 0)
+        timestamp = trade.get("exit_timestamp")
+        label = (
+            time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+            if timestamp is not None
+            else trade.get("exit_date", trade.get("entry_date", ""))
+        )
+        for field in SMALL_MULTIPLE_FIELDS:
+            group = trade.get(field) or "Unclassified"
+            if field == "ticker" and group not in top_tickers:
+                continue
+            state = running.get((field, group))
+            if state is None:
+                state = running[(field, group)] = {
+                    "total": 0.0,
+                    "peak": None,
+                    "labels": [],
+                    "equity": [],
+                    "drawdown": [],
+                }
+            state["total"] += pnl
+            total = state["total"]
+            if state["peak"] is None or total > state["peak"]:
+                state["peak"] = total
+            state["labels"].append(label)
+            state["equity"].append(round(total, 2))
+            state["drawdown"].append(round(total - state["peak"], 2))
+
+    result = {f"by_{field}": {} for field in SMALL_MULTIPLE_FIELDS}
+    for (field, group), state in running.items():
+        result[f"by_{field}"][group] = {
+            "trades": len(state["equity"]),
+            "total_pnl": round(state["total"], 2),
+            "max_drawdown": min(state["drawdown"]),
+            "equity": _panel_series(state["labels"], state["equity"], max_points),
+            "drawdown": _panel_series(state["labels"], state["drawdown"], max_points),
+        }
+    return result
+
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Generate chart data and images")
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=DEFAULT_POINT_BUDGET,
+        help="Point budget for downsampled (lite) series "
+        f"(default: {DEFAULT_POINT_BUDGET})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to render static charts (default: one per chart)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render static charts even if their data has not changed",
+    )
+    parser.add_argument(
+        "--distribution-mode",
+        choices=["auto", "bars", "histogram"],
+        default="auto",
+        help="Trade distribution as per-trade bars or a P&L histogram "
+        f"(auto: histogram above {HISTOGRAM_TRADE_THRESHOLD} trades)",
+    )
+    args = parser.parse_args()
+    if args.max_points < MIN_POINT_BUDGET:
+        parser.error(f"--max-points must be at least {MIN_POINT_BUDGET}")
+
     print("Generating charts...")
 
     # Load trades index
@@ -481,10 +1451,16 @@ def main():
         "index.directory/assets/charts/equity-curve-data.json", "w", encoding="utf-8"
     ) as f:
         json.dump(equity_data, f, indent=2)
-    print("  ✓ Equity curve data saved")
+    with open(
+        "index.directory/assets/charts/equity-curve-data-lite.json",
+        "w",
+        encoding="utf-8",
+    ) as f:
+        json.dump(generate_equity_curve_lite(equity_data, args.max_points), f)
+    print("  ✓ Equity curve data saved (full and lite)")
 
     # 2. Trade Distribution
-    distribution_data = generate_trade_distribution_data(trades)
+    distribution_data = generate_trade_distribution_data(trades, args.distribution_mode)
     with open(
         "index.directory/assets/charts/trade-distribution-data.json",
         "w",
@@ -493,8 +1469,9 @@ def main():
         json.dump(distribution_data, f, indent=2)
     print("  ✓ Trade distribution data saved")
 
-    # 3. Performance by Day
-    day_data = generate_performance_by_day_data(trades)
+    # 3. Performance by Day and calendar heatmap from one daily bucketing pass
+    daily = bucket_daily_pnl(trades)
+    day_data = generate_performance_by_day_data(trades, daily)
     with open(
         "index.directory/assets/charts/performance-by-day-data.json",
         "w",
@@ -503,8 +1480,17 @@ def main():
         json.dump(day_data, f, indent=2)
     print("  ✓ Performance by day data saved")
 
+    with open(
+        "index.directory/assets/charts/calendar-heatmap-data.json",
+        "w",
+        encoding="utf-8",
+    ) as f:
+        json.dump(generate_calendar_heatmap_data(daily), f, separators=(",", ":"))
+    print("  ✓ Calendar heatmap data saved")
+
     # 4. Ticker Performance
-    ticker_data = generate_ticker_performance_data(trades)
+    ticker_stats = aggregate_ticker_stats(trades)
+    ticker_data = generate_ticker_performance_data(trades, ticker_stats)
     with open(
         "index.directory/assets/charts/ticker-performance-data.json",
         "w",
@@ -513,15 +1499,72 @@ def main():
         json.dump(ticker_data, f, indent=2)
     print("  ✓ Ticker performance data saved")
 
+    # 5. Ticker Leaderboard and per-ticker summary table
+    leaderboard = generate_ticker_leaderboard(ticker_stats)
+    with open(
+        "index.directory/assets/charts/ticker-leaderboard.json", "w", encoding="utf-8"
+    ) as f:
+        json.dump(leaderboard, f, indent=2)
+    with open(
+        "index.directory/assets/charts/ticker-summary.json", "w", encoding="utf-8"
+    ) as f:
+        json.dump(generate_ticker_summary_table(ticker_stats), f, separators=(",", ":"))
+    print("  ✓ Ticker leaderboard and summary table saved")
+
+    # 6. Small-multiple equity/drawdown curves per strategy, setup and ticker
+    small_multiples = generate_small_multiples_data(trades)
+    with open(
+        "index.directory/assets/charts/small-multiples-data.json",
+        "w",
+        encoding="utf-8",
+    ) as f:
+        json.dump(small_multiples, f, separators=(",", ":"))
+    print("  ✓ Small-multiple curves saved")
+
     # Generate static charts (PNG images)
     print("\nGenerating static chart images...")
-    try:
-        generate_static_chart(trades)
-        generate_trade_distribution_chart(trades)
+    if not MATPLOTLIB_AVAILABLE:
+        print("Skipping static chart generation (matplotlib not available)")
+        return
+
+    jobs = [
+        job
+        for job in (
+            build_equity_chart_job(trades),
+            build_distribution_chart_job(trades, mode=args.distribution_mode),
+            build_small_multiples_chart_job(small_multiples),
+        )
+        if job
+    ]
+    manifest = {} if args.force else load_chart_manifest()
+    to_render, cached, hashes = split_cached_jobs(jobs, manifest)
+    for job in cached:
+        print(f"  = {job['name']} unchanged, skipped")
+
+    results = render_chart_jobs(to_render, args.workers)
+    failures = _report_chart_results(results)
+
+    # Record hashes only for images that exist and match their data
+    updated = dict(manifest)
+    for result in results:
+        if result["ok"]:
+            updated[result["output_path"]] = hashes[result["output_path"]]
+        else:
+            updated.pop(result["output_path"], None)
+    if updated != manifest:
+        save_chart_manifest(updated)
+
+    print("\nChart image sizes:")
+    images = build_chart_image_metadata(jobs)
+    if _report_image_sizes(images):
+        print("  Some chart images exceed their size budget")
+    with open(CHART_IMAGES_FILE, "w", encoding="utf-8") as f:
+        json.dump(images, f, indent=2)
+
+    if failures:
+        print(f"{failures} static chart(s) failed, continuing without them...")
+    else:
         print("Static charts generated successfully")
-    except Exception as e:
-        print(f"Error generating static charts: {e}")
-        print("Continuing without static charts...")
 
 
 if __name__ == "__main__":
@@ -9,79 +9,10 @@ import json
 import os
 import shutil
 from navbar_template import get_navbar_html
+from template_engine import compile_template
 
-
-def main():
-    """Main execution function"""
-    print("Generating master trade index...")
-
-    # Check if trades-index.json exists
-    if not os.path.exists("index.directory/trades-index.json"):
-        print("Warning: index.directory/trades-index.json not found")
-        print("This file should be created by parse_trades.py")
-        return
-
-    # Load the index
-    with open("index.directory/trades-index.json", "r", encoding="utf-8") as f:
-        index_data = json.load(f)
-
-    trades = index_data.get("trades", [])
-    stats = index_data.get("statistics", {})
-
-    print(f"Master index contains {len(trades)} trade(s)")
-    print(f"Total P&L: ${stats.get('total_pnl', 0)}")
-    print(f"Win Rate: {stats.get('win_rate', 0)}%")
-
-    # Ensure the file is in place for GitHub Pages
-    # (it's already at index.directory/, which is correct)
-    print("Master index is ready at index.directory/trades-index.json")
-
-    # Create a simple trade list HTML for easy browsing (optional)
-    create_trade_list_html(trades)
-
-
-def create_trade_list_html(trades):
-    """
-    Create a simple HTML page listing all trades
-
-    Args:
-        trades (list): List of trade dictionaries
-    """
-    if not trades:
-        return
-
-    # Sort by trade number
-    sorted_trades = sorted(trades, key=lambda t: t.get("trade_number", 0), reverse=True)
-
-    # Generate table rows
-    rows = []
-    for trade in sorted_trades:
-        pnl = trade.get("pnl_usd", 0)
-        pnl_class = "positive" if pnl >= 0 else "negative"
-        pnl_sign = "+" if pnl >= 0 else ""
-
-        # Generate trade page link
-        trade_number = trade.get("trade_number", 0)
-        ticker = trade.get("ticker", "UNKNOWN")
-        trade_link = f"trades/trade-{trade_number:03d}-{ticker}.html"
-
-        rows.append(
-            f"""
-        <tr style="cursor: pointer;" onclick="window.location.href='{trade_link}'">
-            <td><a href="{trade_link}" style="color: inherit; text-decoration: none;">#{trade.get('trade_number', 'N/A')}</a></td>
-            <td><a href="{trade_link}" style="color: inherit; text-decoration: none;"><strong>{trade.get('ticker', 'N/A')}</strong></a></td>
-            <td>{trade.get('direction', 'N/A')}</td>
-            <td>${trade.get('entry_price', 0):.4f}</td>
-            <td>${trade.get('exit_price', 0):.4f}</td>
-            <td>{trade.get('position_size', 0):,}</td>
-            <td class="{pnl_class}">{pnl_sign}${abs(pnl):.2f}</td>
-            <td>{trade.get('entry_date', 'N/A')}</td>
-            <td>{trade.get('strategy', 'N/A')}</td>
-        </tr>
-        """
-        )
-
-    html_content = f"""<!DOCTYPE html>
+# All-trades list page layout
+TRADE_LIST_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -112,50 +43,50 @@ def create_trade_list_html(trades):
     <link rel="icon" type="image/png" sizes="192x192" href="assets/icons/icon-192.png">
     
     <style>
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             background-color: var(--bg-secondary);
             border: 1px solid var(--border-color);
             border-radius: 8px;
             overflow: hidden;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 1rem;
             text-align: left;
             border-bottom: 1px solid var(--border-color);
-        }}
-        th {{
+        }
+        th {
             background-color: var(--bg-tertiary);
             font-weight: 600;
             color: var(--accent-green);
             text-transform: uppercase;
             font-size: 0.875rem;
             letter-spacing: 0.05em;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: var(--bg-tertiary);
             cursor: pointer;
-        }}
-        tr a {{
+        }
+        tr a {
             display: block;
             width: 100%;
             height: 100%;
-        }}
-        .positive {{
+        }
+        .positive {
             color: var(--accent-green);
             font-weight: 600;
-        }}
-        .negative {{
+        }
+        .negative {
             color: var(--accent-red);
             font-weight: 600;
-        }}
+        }
     </style>
 </head>
 <body>
     <canvas id="bg-canvas"></canvas>
     
-{get_navbar_html("directory")}
+{{ navbar }}
     
     <main class="container">
         <h1>All Trades</h1>
@@ -179,7 +110,20 @@ def create_trade_list_html(trades):
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(rows)}
+                    {% for trade, trade_link in rows %}
+                    <tr style="cursor: pointer;" onclick="window.location.href='{{ trade_link }}'">
+                        <td><a href="{{ trade_link }}" style="color: inherit; text-decoration: none;">#{{ trade.get('trade_number', 'N/A') }}</a></td>
+                        <td><a href="{{ trade_link }}" style="color: inherit; text-decoration: none;"><strong>{{ trade.get('ticker', 'N/A') }}</strong></a></td>
+                        <td>{{ trade.get('direction', 'N/A') }}</td>
+                        <td>${{ trade.get('entry_price', 0):.4f }}</td>
+                        <td>${{ trade.get('exit_price', 0):.4f }}</td>
+                        <td>{{ trade.get('position_size', 0):, }}</td>
+                        {% set pnl = trade.get('pnl_usd', 0) %}
+                        <td class="{{ 'positive' if pnl >= 0 else 'negative' }}">{{ '+' if pnl >= 0 else '' }}${{ abs(pnl):.2f }}</td>
+                        <td>{{ trade.get('entry_date', 'N/A') }}</td>
+                        <td>{{ trade.get('strategy', 'N/A') }}</td>
+                    </tr>
+                    {% endfor %}
                 </tbody>
             </table>
         </div>
@@ -202,8 +146,65 @@ def create_trade_list_html(trades):
 </html>
 """
 
-    with open("index.directory/all-trades.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+
+def main():
+    """Main execution function"""
+    print("Generating master trade index...")
+
+    # Check if trades-index.json exists
+    if not os.path.exists("index.directory/trades-index.json"):
+        print("Warning: index.directory/trades-index.json not found")
+        print("This file should be created by parse_trades.py")
+        return
+
+    # Load the index
+    with open("index.directory/trades-index.json", "r", encoding="utf-8") as f:
+        index_data = json.load(f)
+
+    trades = index_data.get("trades", [])
+    stats = index_data.get("statistics", {})
+
+    print(f"Master index contains {len(trades)} trade(s)")
+    print(f"Total P&L: ${stats.get('total_pnl', 0)}")
+    print(f"Win Rate: {stats.get('win_rate', 0)}%")
+
+    # Ensure the file is in place for GitHub Pages
+    # (it's already at index.directory/, which is correct)
+    print("Master index is ready at index.directory/trades-index.json")
+
+    # Create a simple trade list HTML for easy browsing (optional)
+    create_trade_list_html(trades)
+
+
+def create_trade_list_html(trades):
+    """
+    Create a simple HTML page listing all trades
+
+    Args:
+        trades (list): List of trade dictionaries
+    """
+    if not trades:
+        return
+
+    # Sort by trade number
+    sorted_trades = sorted(trades, key=lambda t: t.get("trade_number", 0), reverse=True)
+
+    # Each row links to the trade's detail page
+    rows = [
+        (
+            trade,
+            f"trades/trade-{trade.get('trade_number', 0):03d}-"
+            f"{trade.get('ticker', 'UNKNOWN')}.html",
+        )
+        for trade in sorted_trades
+    ]
+
+    template = compile_template(TRADE_LIST_TEMPLATE, "all-trades.html")
+    template.render_to_file(
+        "index.directory/all-trades.html",
+        navbar=get_navbar_html("directory"),
+        rows=rows,
+    )
 
     print("Trade list HTML created at index.directory/all-trades.html")
 
@@ -5,22 +5,96 @@ Generates weekly, monthly, and yearly summaries from parsed trade data
 Enhanced to preserve user reviews and auto-aggregate higher-level summaries
 
 Performance Optimizations:
-- Single-pass calculation of all period statistics
+- Single pass over the trades feeds one mergeable PeriodStatsAccumulator per
+  entry day; weeks and months are merged from (week, month) cells of days,
+  years and quarters from months, so no trade is read twice
 - Combined winner/loser tracking with strategy breakdown
 - Efficient best/worst trade tracking without separate max/min operations
 - Reduced file I/O with smart caching of summary content
-- Optimized date parsing with string operations
+- Per-period content manifest: only periods whose stats or review inputs
+  changed are re-rendered, and unchanged files are never re-read
+- One in-memory index of the summaries directory, with each weekly file
+  filed under its month, replaces a directory scan per month and per year
+- The manifest doubles as a review-section index keyed by path and output
+  hash, shared by both insight aggregators, so the section regexes only run
+  on files whose content changed since the last run; it stores content
+  hashes only, so a fresh checkout does not rewrite it
+- Custom ranges (--range, --last-days, --quarter, --since) are located in
+  the sorted day index by binary search and merged from daily accumulators
+- No date parsing: week/month/year keys come from the entry_week and
+  entry_month columns precomputed by parse_trades.py
 """
 
+import argparse
+import bisect
+import hashlib
 import json
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
 
+from accumulators import PeriodStatsAccumulator, merge_accumulators
+from template_engine import compile_template
+
 # Regex patterns for file matching
-WEEKLY_PATTERN = r"weekly-\d{4}-W(\d{2})\.md"
-MONTHLY_PATTERN = r"monthly-\d{4}-(\d{2})\.md"
+WEEKLY_PATTERN = r"weekly-(\d{4})-W(\d{2})\.md"
+MONTHLY_PATTERN = r"monthly-(\d{4})-(\d{2})\.md"
+
+# Period summary layout (review sections fall back to placeholders)
+SUMMARY_TEMPLATE = """# {{ title }}
+
+**Period**: {{ period_key }}
+
+## Statistics
+
+- **Total Trades**: {{ stats['total_trades'] }}
+- **Winning Trades**: {{ stats['winning_trades'] }}
+- **Losing Trades**: {{ stats['losing_trades'] }}
+- **Win Rate**: {{ stats['win_rate'] }}%
+- **Total P&L**: ${{ stats['total_pnl']:.2f }}
+- **Average P&L per Trade**: ${{ stats['avg_pnl']:.2f }}
+- **Best Trade**: {{ stats['best_trade']['ticker'] }} (+${{ stats['best_trade']['pnl']:.2f }})
+- **Worst Trade**: {{ stats['worst_trade']['ticker'] }} (${{ stats['worst_trade']['pnl']:.2f }})
+- **Total Volume Traded**: {{ stats['total_volume']:, }} shares
+
+## Performance Analysis
+
+### What Went Well
+
+{{ review.get('what_went_well') or '_To be filled in manually during review_' }}
+
+### What Needs Improvement
+
+{{ review.get('needs_improvement') or '_To be filled in manually during review_' }}
+
+### Key Lessons Learned
+
+{{ review.get('key_lessons') or '_To be filled in manually during review_' }}
+
+## Strategy Breakdown
+
+{% for strategy, data in strategies.items() %}
+- **{{ strategy }}**: {{ data['count'] }} trades, ${{ data['pnl']:.2f }} P&L
+{% endfor %}
+{% if not strategies %}
+- No strategies recorded
+{% endif %}
+
+## Next Period Goals
+
+{{ review.get('next_goals') or '- _Goal 1_\\n- _Goal 2_\\n- _Goal 3_' }}
+
+---
+
+**Generated**: {{ generated }}
+"""
+
+# Per-file record of what each summary was rendered from
+SUMMARIES_MANIFEST_FILE = "index.directory/summaries/summaries-manifest.json"
+
+# Bump when the summary markdown layout changes to re-render every file
+SUMMARY_FORMAT_VERSION = 1
 
 
 def load_trades_index():
@@ -33,6 +107,63 @@ def load_trades_index():
         return None
 
 
+def extract_review_sections(content):
+    """
+    Extract the user-filled review sections from summary markdown
+
+    Args:
+        content (str): Summary markdown
+
+    Returns:
+        dict: Review sections (empty strings for unfilled placeholders)
+    """
+    # Extract review sections
+    review = {
+        "what_went_well": "",
+        "needs_improvement": "",
+        "key_lessons": "",
+        "next_goals": "",
+    }
+
+    # Extract "What Went Well" section
+    match = re.search(
+        r"### What Went Well\s*\n\s*\n(.*?)(?=\n###|\n##|$)", content, re.DOTALL
+    )
+    if match and not match.group(1).strip().startswith(
+        "_To be filled in manually during review"
+    ):
+        review["what_went_well"] = match.group(1).strip()
+
+    # Extract "What Needs Improvement" section
+    match = re.search(
+        r"### What Needs Improvement\s*\n\s*\n(.*?)(?=\n###|\n##|$)",
+        content,
+        re.DOTALL,
+    )
+    if match and not match.group(1).strip().startswith(
+        "_To be filled in manually during review"
+    ):
+        review["needs_improvement"] = match.group(1).strip()
+
+    # Extract "Key Lessons Learned" section
+    match = re.search(
+        r"### Key Lessons Learned\s*\n\s*\n(.*?)(?=\n##|$)", content, re.DOTALL
+    )
+    if match and not match.group(1).strip().startswith(
+        "_To be filled in manually during review"
+    ):
+        review["key_lessons"] = match.group(1).strip()
+
+    # Extract "Next Period Goals" section
+    match = re.search(
+        r"## Next Period Goals\s*\n\s*\n(.*?)(?=\n---|$)", content, re.DOTALL
+    )
+    if match and not match.group(1).strip().startswith("- _Goal"):
+        review["next_goals"] = match.group(1).strip()
+
+    return review
+
+
 def load_existing_summary(filepath):
     """
     Load existing summary and extract user-filled review sections
@@ -48,175 +179,306 @@ def load_existing_summary(filepath):
 
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract review sections
-        review = {
-            "what_went_well": "",
-            "needs_improvement": "",
-            "key_lessons": "",
-            "next_goals": "",
-        }
-
-        # Extract "What Went Well" section
-        match = re.search(
-            r"### What Went Well\s*\n\s*\n(.*?)(?=\n###|\n##|$)", content, re.DOTALL
-        )
-        if match and not match.group(1).strip().startswith(
-            "_To be filled in manually during review"
-        ):
-            review["what_went_well"] = match.group(1).strip()
-
-        # Extract "What Needs Improvement" section
-        match = re.search(
-            r"### What Needs Improvement\s*\n\s*\n(.*?)(?=\n###|\n##|$)",
-            content,
-            re.DOTALL,
-        )
-        if match and not match.group(1).strip().startswith(
-            "_To be filled in manually during review"
-        ):
-            review["needs_improvement"] = match.group(1).strip()
-
-        # Extract "Key Lessons Learned" section
-        match = re.search(
-            r"### Key Lessons Learned\s*\n\s*\n(.*?)(?=\n##|$)", content, re.DOTALL
-        )
-        if match and not match.group(1).strip().startswith(
-            "_To be filled in manually during review"
-        ):
-            review["key_lessons"] = match.group(1).strip()
-
-        # Extract "Next Period Goals" section
-        match = re.search(
-            r"## Next Period Goals\s*\n\s*\n(.*?)(?=\n---|$)", content, re.DOTALL
-        )
-        if match and not match.group(1).strip().startswith("- _Goal"):
-            review["next_goals"] = match.group(1).strip()
-
-        return review
+            return extract_review_sections(f.read())
     except Exception as e:
         print(f"Warning: Error loading existing summary {filepath}: {e}")
         return None
 
 
-def group_trades_by_period(trades, period="week"):
+def calculate_period_stats(trades):
     """
-    Group trades by time period (week, month, year)
+    Calculate statistics for a group of trades
 
     Args:
         trades (list): List of trade dictionaries
-        period (str): 'week', 'month', or 'year'
 
     Returns:
-        dict: Dictionary with period keys and trade lists as values
+        dict: Period statistics
     """
-    grouped = defaultdict(list)
+    return PeriodStatsAccumulator.from_trades(trades).to_period_stats()
 
-    for trade in trades:
-        try:
-            # Parse date only once
-            entry_date_str = str(trade.get("entry_date"))
-            entry_date = datetime.fromisoformat(entry_date_str)
-
-            # Generate key based on period type
-            if period == "week":
-                key = f"{entry_date.year}-W{entry_date.isocalendar()[1]:02d}"
-            elif period == "month":
-                key = f"{entry_date.year}-{entry_date.month:02d}"
-            elif period == "year":
-                key = str(entry_date.year)
-            else:
-                key = "unknown"
-
-            grouped[key].append(trade)
-        except (ValueError, TypeError) as e:
-            print(
-                f"Warning: Could not parse date for trade {trade.get('trade_number')}: {e}"
-            )
-            continue
 
-    return dict(grouped)
+class PeriodRollup:
+    """
+    Hierarchical period statistics built from per-day accumulators
 
+    Trades are added once, to the accumulator of their entry day. Days
+    merge into (ISO week, month) cells, so a week that straddles two months
+    contributes exactly its own days to each. Cells merge into weeks and
+    months, months into years and quarters, and days into arbitrary date
+    ranges, all through the same merge_accumulators() API.
 
-def calculate_period_stats(trades):
+    Days are kept in a sorted index, so a date range is located with two
+    binary searches and answered by merging only the days inside it.
     """
-    Calculate statistics for a group of trades
+
+    def __init__(self):
+        self.days = {}  # {YYYY-MM-DD: PeriodStatsAccumulator}
+        self.day_periods = {}  # {YYYY-MM-DD: (week, month)}
+        self._cells = None
+        self._day_index = None
+
+    @classmethod
+    def from_trades(cls, trades):
+        """Build a roll-up from trades in a single pass"""
+        rollup = cls()
+        for trade in trades:
+            rollup.add_trade(trade)
+        return rollup
+
+    def add_trade(self, trade):
+        """Add one trade to its entry day"""
+        # Calendar keys are precomputed by parse_trades.py (ISO week year)
+        week = trade.get("entry_week")
+        month = trade.get("entry_month")
+        if not week or not month:
+            print(f"Warning: No entry date for trade {trade.get('trade_number')}")
+            return
+
+        day = str(trade.get("entry_date"))[:10]
+        if day not in self.days:
+            self.days[day] = PeriodStatsAccumulator()
+            self.day_periods[day] = (week, month)
+        self.days[day].add_trade(trade)
+        self._cells = None
+        self._day_index = None
+
+    def _merge_into(self, groups, key, acc):
+        if key not in groups:
+            groups[key] = PeriodStatsAccumulator()
+        groups[key].merge(acc)
+
+    def cells(self):
+        """{(week, month): accumulator} merged from days in date order"""
+        if self._cells is None:
+            self._cells = {}
+            for day in sorted(self.days):
+                self._merge_into(self._cells, self.day_periods[day], self.days[day])
+        return self._cells
+
+    def weeks(self):
+        """{YYYY-Www: accumulator} merged from (week, month) cells"""
+        weeks = {}
+        for (week, _), acc in sorted(self.cells().items()):
+            self._merge_into(weeks, week, acc)
+        return weeks
+
+    def months(self):
+        """{YYYY-MM: accumulator} merged from (week, month) cells"""
+        months = {}
+        for (_, month), acc in sorted(self.cells().items(), key=lambda c: c[0][::-1]):
+            self._merge_into(months, month, acc)
+        return months
+
+    def years(self, months=None):
+        """{YYYY: accumulator} merged from months"""
+        years = {}
+        for month, acc in sorted((months or self.months()).items()):
+            self._merge_into(years, month[:4], acc)
+        return years
+
+    def quarters(self, months=None):
+        """{YYYY-Qn: accumulator} merged from months"""
+        quarters = {}
+        for month, acc in sorted((months or self.months()).items()):
+            quarter = f"{month[:4]}-Q{(int(month[5:7]) - 1) // 3 + 1}"
+            self._merge_into(quarters, quarter, acc)
+        return quarters
+
+    def day_index(self):
+        """Sorted list of the days that have trades"""
+        if self._day_index is None:
+            self._day_index = sorted(self.days)
+        return self._day_index
+
+    def date_range(self, start, end):
+        """
+        Merge the days in an inclusive date range
+
+        Args:
+            start (str): First day (YYYY-MM-DD)
+            end (str): Last day (YYYY-MM-DD)
+
+        Returns:
+            PeriodStatsAccumulator: Statistics for trades entered in the range
+        """
+        days = self.day_index()
+        lo = bisect.bisect_left(days, start)
+        hi = bisect.bisect_right(days, end)
+        return merge_accumulators(
+            (self.days[day] for day in days[lo:hi]), PeriodStatsAccumulator
+        )
+
+
+def content_hash(value):
+    """
+    Stable hash of a JSON-serialisable value
+
+    Keys are not sorted (strategy names may be None); the stats and review
+    dicts are always built in the same order for the same trades.
 
     Args:
-        trades (list): List of trade dictionaries
+        value: Stats, review sections or any nesting of them
 
     Returns:
-        dict: Period statistics
+        str: Hex digest
+    """
+    payload = json.dumps(value, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def file_digest(filepath):
+    """Hash of a file's bytes, or None if it does not exist"""
+    try:
+        with open(filepath, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def review_hash(review):
+    """Hash of the filled-in review sections (placeholders count as empty)"""
+    return content_hash({key: text for key, text in (review or {}).items() if text})
+
+
+class SummaryManifest:
+    """
+    Record of the inputs each summary file was rendered from
+
+    Entries are keyed by file path and hold the hash of everything the file
+    was rendered from (period stats, the review sections found in the file
+    and the reviews it aggregates), the review sections the file now contains
+    and their hash, and a hash of the file's bytes when they were extracted.
+    Only content hashes are stored, so a fresh checkout that resets every
+    mtime leaves the manifest unchanged. The sections double as a review
+    index shared by the period loop and both insight aggregators: a file
+    whose output hash still matches is not re-parsed, and a period whose
+    inputs hash matches is not re-rendered. Entries not touched during a run
+    are dropped on save.
     """
-    if not trades:
-        return {}
-
-    total_trades = len(trades)
-    
-    # Single pass to calculate all metrics
-    win_count = 0
-    loss_count = 0
-    total_pnl = 0.0
-    total_volume = 0
-    best_trade = None
-    worst_trade = None
-    best_pnl = float('-inf')
-    worst_pnl = float('inf')
-    
-    # Strategy breakdown using defaultdict for efficiency
-    strategies = defaultdict(lambda: {"count": 0, "pnl": 0.0})
-    
-    for trade in trades:
-        pnl = trade.get("pnl_usd", 0)
-        total_pnl += pnl
-        total_volume += trade.get("position_size", 0)
-        
-        # Track wins/losses
-        if pnl > 0:
-            win_count += 1
-        elif pnl < 0:
-            loss_count += 1
-        
-        # Track best/worst trades
-        if pnl > best_pnl:
-            best_pnl = pnl
-            best_trade = trade
-        if pnl < worst_pnl:
-            worst_pnl = pnl
-            worst_trade = trade
-        
-        # Update strategy breakdown
-        strategy = trade.get("strategy", "Unknown")
-        strategies[strategy]["count"] += 1
-        strategies[strategy]["pnl"] += pnl
-
-    # Use first trade as fallback if no best/worst found (shouldn't happen with valid data)
-    if best_trade is None:
-        best_trade = trades[0]
-    if worst_trade is None:
-        worst_trade = trades[0]
-
-    return {
-        "total_trades": total_trades,
-        "winning_trades": win_count,
-        "losing_trades": loss_count,
-        "win_rate": round(win_count / total_trades * 100, 2) if total_trades > 0 else 0,
-        "total_pnl": round(total_pnl, 2),
-        "avg_pnl": round(total_pnl / total_trades, 2) if total_trades > 0 else 0,
-        "best_trade": {
-            "ticker": best_trade.get("ticker"),
-            "pnl": round(best_trade.get("pnl_usd", 0), 2),
-            "trade_number": best_trade.get("trade_number"),
-        },
-        "worst_trade": {
-            "ticker": worst_trade.get("ticker"),
-            "pnl": round(worst_trade.get("pnl_usd", 0), 2),
-            "trade_number": worst_trade.get("trade_number"),
-        },
-        "total_volume": total_volume,
-        "strategies": dict(strategies),
-    }
+
+    def __init__(self, entries=None):
+        self.entries = entries or {}
+        self.saved = json.dumps(self.entries, sort_keys=True)
+        self.reviews = {}
+        self.touched = set()
+
+    @classmethod
+    def load(cls):
+        """Load the manifest (empty if missing or unreadable)"""
+        try:
+            with open(SUMMARIES_MANIFEST_FILE, "r", encoding="utf-8") as f:
+                return cls(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls()
+
+    def save(self):
+        """Persist the manifest, writing only if an entry changed"""
+        self.entries = {
+            path: entry for path, entry in self.entries.items() if path in self.touched
+        }
+        serialised = json.dumps(self.entries, sort_keys=True)
+        if serialised == self.saved:
+            return False
+        with open(SUMMARIES_MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        self.saved = serialised
+        return True
+
+    def review(self, filepath):
+        """
+        Review sections of a summary file
+
+        The file is read once and its bytes hashed; the sections are served
+        from the index while that hash matches the stored output hash and are
+        only re-extracted from the same bytes when it doesn't, so new mtimes
+        alone never trigger the section regexes. Either way at most once per
+        run.
+
+        Args:
+            filepath (str): Summary file path
+
+        Returns:
+            dict: Review sections or None if the file doesn't exist
+        """
+        if filepath not in self.reviews:
+            try:
+                with open(filepath, "rb") as f:
+                    content = f.read()
+            except OSError:
+                content = None
+            output = hashlib.sha1(content).hexdigest() if content is not None else None
+            entry = self.entries.get(filepath, {})
+            if "sections" not in entry or entry.get("output") != output:
+                sections = None
+                if content is not None:
+                    try:
+                        sections = extract_review_sections(content.decode("utf-8"))
+                    except UnicodeDecodeError as e:
+                        print(
+                            f"Warning: Error loading existing summary {filepath}: {e}"
+                        )
+                entry = {
+                    "inputs": entry.get("inputs"),
+                    "output": output,
+                    "sections": sections,
+                    "review": review_hash(sections),
+                }
+                self.entries[filepath] = entry
+            self.reviews[filepath] = entry["sections"]
+            self.touched.add(filepath)
+        return self.reviews[filepath]
+
+    def review_hash(self, filepath):
+        """Hash of a file's review sections, reading it only if it changed"""
+        self.review(filepath)
+        return self.entries[filepath]["review"]
+
+    def inputs_hash(self, filepath, inputs):
+        """Hash of a period's inputs combined with the file's own review"""
+        return content_hash(
+            [SUMMARY_FORMAT_VERSION, inputs, self.review_hash(filepath)]
+        )
+
+    def is_current(self, filepath, inputs):
+        """
+        Check whether a summary file is up to date
+
+        Args:
+            filepath (str): Summary file path
+            inputs (list): Period stats and hashes of aggregated reviews
+
+        Returns:
+            bool: True if the file exists and was rendered from these inputs
+        """
+        inputs = self.inputs_hash(filepath, inputs)
+        entry = self.entries.get(filepath, {})
+        return entry.get("output") is not None and entry.get("inputs") == inputs
+
+    def write(self, filepath, markdown, inputs):
+        """
+        Write a rendered summary and record what it was rendered from
+
+        The recorded inputs hash uses the review sections of the new file, so
+        a review merged in from lower-level summaries doesn't make the next
+        run render the period again.
+
+        Args:
+            filepath (str): Summary file path
+            markdown (str): Rendered markdown
+            inputs (list): Period stats and hashes of aggregated reviews
+        """
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(markdown)
+        review = extract_review_sections(markdown)
+        self.reviews[filepath] = review
+        self.entries[filepath] = {
+            "sections": review,
+            "review": review_hash(review),
+            "output": file_digest(filepath),
+        }
+        self.entries[filepath]["inputs"] = self.inputs_hash(filepath, inputs)
+        self.touched.add(filepath)
 
 
 def generate_summary_markdown(
@@ -228,7 +490,7 @@ def generate_summary_markdown(
     Args:
         period_key (str): Period identifier (e.g., '2025-W42')
         period_stats (dict): Statistics for the period
-        period_type (str): 'week', 'month', or 'year'
+        period_type (str): 'week', 'month', 'year', 'quarter' or 'range'
         existing_review (dict): Existing review content to preserve
 
     Returns:
@@ -243,86 +505,165 @@ def generate_summary_markdown(
     else:
         title = f"{period_key} Summary"
 
-    # Strategy breakdown
-    strategy_lines = []
-    for strategy, data in period_stats.get("strategies", {}).items():
-        strategy_lines.append(
-            f"- **{strategy}**: {data['count']} trades, ${data['pnl']:.2f} P&L"
-        )
-    strategy_breakdown = (
-        "\n".join(strategy_lines) if strategy_lines else "- No strategies recorded"
+    template = compile_template(SUMMARY_TEMPLATE, "summary.md")
+    return template.render(
+        title=title,
+        period_key=period_key,
+        stats=period_stats,
+        strategies=period_stats.get("strategies", {}),
+        review=existing_review or {},
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     )
 
-    # Use existing review content if available, otherwise use placeholders
-    if existing_review:
-        what_went_well = (
-            existing_review.get("what_went_well")
-            or "_To be filled in manually during review_"
-        )
-        needs_improvement = (
-            existing_review.get("needs_improvement")
-            or "_To be filled in manually during review_"
-        )
-        key_lessons = (
-            existing_review.get("key_lessons")
-            or "_To be filled in manually during review_"
-        )
-        next_goals = (
-            existing_review.get("next_goals") or "- _Goal 1_\n- _Goal 2_\n- _Goal 3_"
-        )
-    else:
-        what_went_well = "_To be filled in manually during review_"
-        needs_improvement = "_To be filled in manually during review_"
-        key_lessons = "_To be filled in manually during review_"
-        next_goals = "- _Goal 1_\n- _Goal 2_\n- _Goal 3_"
-
-    markdown = f"""# {title}
-
-**Period**: {period_key}
 
-## Statistics
+def trading_days_back(end, count):
+    """
+    First day of a window of trading days ending on a given day
 
-- **Total Trades**: {period_stats['total_trades']}
-- **Winning Trades**: {period_stats['winning_trades']}
-- **Losing Trades**: {period_stats['losing_trades']}
-- **Win Rate**: {period_stats['win_rate']}%
-- **Total P&L**: ${period_stats['total_pnl']:.2f}
-- **Average P&L per Trade**: ${period_stats['avg_pnl']:.2f}
-- **Best Trade**: {period_stats['best_trade']['ticker']} (+${period_stats['best_trade']['pnl']:.2f})
-- **Worst Trade**: {period_stats['worst_trade']['ticker']} (${period_stats['worst_trade']['pnl']:.2f})
-- **Total Volume Traded**: {period_stats['total_volume']:,} shares
+    Trading days are approximated as weekdays (exchange holidays are not
+    excluded).
 
-## Performance Analysis
-
-### What Went Well
+    Args:
+        end (date): Last day of the window
+        count (int): Number of trading days in the window
 
-{what_went_well}
+    Returns:
+        date: First day of the window
+    """
+    day = end
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    remaining = count - 1
+    while remaining > 0:
+        day -= timedelta(days=1)
+        if day.weekday() < 5:
+            remaining -= 1
+    return day
+
+
+def resolve_summary_range(args, today=None):
+    """
+    Turn the range options into a period key and inclusive date bounds
 
-### What Needs Improvement
+    Args:
+        args (argparse.Namespace): Parsed --range/--last-days/--quarter/--since
+        today (date): End of open-ended ranges (defaults to today)
 
-{needs_improvement}
+    Returns:
+        tuple: (period_key, period_type, start, end) with YYYY-MM-DD bounds
 
-### Key Lessons Learned
+    Raises:
+        ValueError: If a date or quarter is malformed or the range is empty
+    """
+    today = today or date.today()
+
+    if args.quarter:
+        match = re.fullmatch(r"(\d{4})-Q([1-4])", args.quarter.upper())
+        if not match:
+            raise ValueError("--quarter expects YYYY-Qn (e.g. 2025-Q3)")
+        year, quarter = int(match.group(1)), int(match.group(2))
+        start = date(year, 3 * quarter - 2, 1)
+        next_start = date(year + quarter // 4, 3 * quarter % 12 + 1, 1)
+        end = next_start - timedelta(days=1)
+        return f"{year}-Q{quarter}", "quarter", start.isoformat(), end.isoformat()
+
+    if args.last_days is not None:
+        if args.last_days < 1:
+            raise ValueError("--last-days must be at least 1")
+        start = trading_days_back(today, args.last_days)
+        end = today
+    elif args.since:
+        start = datetime.strptime(args.since, "%Y-%m-%d").date()
+        end = today
+    else:
+        start = datetime.strptime(args.range[0], "%Y-%m-%d").date()
+        end = datetime.strptime(args.range[1], "%Y-%m-%d").date()
 
-{key_lessons}
+    if start > end:
+        raise ValueError(f"Range starts after it ends ({start} > {end})")
+    return f"{start} to {end}", "range", start.isoformat(), end.isoformat()
 
-## Strategy Breakdown
 
-{strategy_breakdown}
+def generate_range_summary(rollup, period_key, period_type, start, end, output):
+    """
+    Render the summary of an arbitrary date range
 
-## Next Period Goals
+    Args:
+        rollup (PeriodRollup): Daily accumulators of all trades
+        period_key (str): Title key (e.g. '2025-Q3')
+        period_type (str): 'quarter' or 'range'
+        start (str): First day (YYYY-MM-DD)
+        end (str): Last day (YYYY-MM-DD)
+        output (str): Markdown file to write (review sections are preserved)
 
-{next_goals}
+    Returns:
+        bool: False if no trades were entered in the range
+    """
+    if period_type == "quarter":
+        # Quarters are whole months, so they merge from the monthly roll-up
+        acc = rollup.quarters().get(period_key, PeriodStatsAccumulator())
+    else:
+        acc = rollup.date_range(start, end)
+    stats = acc.to_period_stats()
+    if not stats:
+        print(f"No trades between {start} and {end}")
+        return False
+
+    existing_review = load_existing_summary(output)
+    markdown = generate_summary_markdown(
+        period_key, stats, period_type, existing_review
+    )
 
----
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(markdown)
 
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-    return markdown
+    print(f"  Wrote {output} ({stats['total_trades']} trades, {start} to {end})")
+    return True
 
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description="Generate weekly, monthly and yearly trade summaries"
+    )
+    period = parser.add_mutually_exclusive_group()
+    period.add_argument(
+        "--range",
+        nargs=2,
+        metavar=("START", "END"),
+        help="Summarize an inclusive date range (YYYY-MM-DD YYYY-MM-DD)",
+    )
+    period.add_argument(
+        "--last-days",
+        type=int,
+        metavar="N",
+        help="Summarize the last N trading days (weekdays) up to today",
+    )
+    period.add_argument("--quarter", help="Summarize a quarter (YYYY-Qn)")
+    period.add_argument(
+        "--since", metavar="DATE", help="Summarize from DATE (YYYY-MM-DD) to today"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Output file for a range summary "
+        "(default: index.directory/summaries/range-<start>-to-<end>.md, "
+        "or quarterly-<YYYY-Qn>.md for --quarter)",
+    )
+    args = parser.parse_args()
+
+    range_requested = bool(
+        args.range or args.last_days is not None or args.quarter or args.since
+    )
+    if range_requested:
+        try:
+            period_key, period_type, start, end = resolve_summary_range(args)
+        except ValueError as e:
+            parser.error(str(e))
+
     print("Generating summaries...")
 
     # Load trades index
@@ -340,20 +681,47 @@ def main():
     # Create summaries directory in index.directory/
     os.makedirs("index.directory/summaries", exist_ok=True)
 
+    # One pass over the trades fills the daily accumulators; weeks, months
+    # and years are merged from them instead of re-reading trades
+    rollup = PeriodRollup.from_trades(trades)
+
+    if range_requested:
+        # Custom ranges are answered from the daily accumulators alone
+        if period_type == "quarter":
+            default_output = f"quarterly-{period_key}.md"
+        else:
+            default_output = f"range-{start}-to-{end}.md"
+        output = args.output or os.path.join(
+            "index.directory/summaries", default_output
+        )
+        print(f"Generating summary for {period_key}...")
+        generate_range_summary(rollup, period_key, period_type, start, end, output)
+        return
+    weekly_stats = rollup.weeks()
+    monthly_stats = rollup.months()
+    yearly_stats = rollup.years(monthly_stats)
+
+    # Only periods whose stats or review inputs changed are re-rendered
+    manifest = SummaryManifest.load()
+    directory = SummaryDirectory()
+    unchanged = 0
+
     # Generate weekly summaries
     print("Generating weekly summaries...")
-    weekly_groups = group_trades_by_period(trades, "week")
-    for week_key, week_trades in weekly_groups.items():
-        stats = calculate_period_stats(week_trades)
+    for week_key, acc in weekly_stats.items():
+        stats = acc.to_period_stats()
+        filename = f"index.directory/summaries/weekly-{week_key}.md"
+        inputs = [stats]
+        if manifest.is_current(filename, inputs):
+            unchanged += 1
+            continue
 
         # Load existing review content to preserve user input
-        filename = f"index.directory/summaries/weekly-{week_key}.md"
-        existing_review = load_existing_summary(filename)
+        existing_review = manifest.review(filename)
 
         markdown = generate_summary_markdown(week_key, stats, "week", existing_review)
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        manifest.write(filename, markdown, inputs)
+        directory.add(filename)
 
         if existing_review and any(existing_review.values()):
             print(f"  Updated {filename} (preserved user review)")
@@ -362,17 +730,29 @@ def main():
 
     # Generate monthly summaries from weekly data
     print("Generating monthly summaries (aggregated from weekly data)...")
-    monthly_groups = group_trades_by_period(trades, "month")
-    for month_key, month_trades in monthly_groups.items():
-        stats = calculate_period_stats(month_trades)
+    for month_key, acc in monthly_stats.items():
+        stats = acc.to_period_stats()
+        filename = f"index.directory/summaries/monthly-{month_key}.md"
+        year, month = month_key.split("-")
+        inputs = [
+            stats,
+            [
+                manifest.review_hash(path)
+                for _, path in directory.weekly_files(year, month)
+            ],
+        ]
+        if manifest.is_current(filename, inputs):
+            unchanged += 1
+            continue
 
         # Load existing review content to preserve user input
-        filename = f"index.directory/summaries/monthly-{month_key}.md"
-        existing_review = load_existing_summary(filename)
+        existing_review = manifest.review(filename)
+        existing_review = dict(existing_review) if existing_review else None
 
         # Aggregate insights from weekly summaries if available
-        year, month = month_key.split("-")
-        weekly_insights = aggregate_weekly_insights(year, month)
+        weekly_insights = aggregate_weekly_insights(
+            year, month, manifest.review, directory
+        )
 
         # Merge weekly insights with existing review
         if weekly_insights and not existing_review:
@@ -384,9 +764,8 @@ def main():
                     existing_review[key] = weekly_insights[key]
 
         markdown = generate_summary_markdown(month_key, stats, "month", existing_review)
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        manifest.write(filename, markdown, inputs)
+        directory.add(filename)
 
         if existing_review and any(existing_review.values()):
             print(f"  Updated {filename} (with weekly insights)")
@@ -395,16 +774,28 @@ def main():
 
     # Generate yearly summaries from monthly data
     print("Generating yearly summaries (aggregated from monthly data)...")
-    yearly_groups = group_trades_by_period(trades, "year")
-    for year_key, year_trades in yearly_groups.items():
-        stats = calculate_period_stats(year_trades)
+    for year_key, acc in yearly_stats.items():
+        stats = acc.to_period_stats()
+        filename = f"index.directory/summaries/yearly-{year_key}.md"
+        inputs = [
+            stats,
+            [
+                manifest.review_hash(path)
+                for _, path in directory.monthly_files(year_key)
+            ],
+        ]
+        if manifest.is_current(filename, inputs):
+            unchanged += 1
+            continue
 
         # Load existing review content to preserve user input
-        filename = f"index.directory/summaries/yearly-{year_key}.md"
-        existing_review = load_existing_summary(filename)
+        existing_review = manifest.review(filename)
+        existing_review = dict(existing_review) if existing_review else None
 
         # Aggregate insights from monthly summaries if available
-        monthly_insights = aggregate_monthly_insights(year_key)
+        monthly_insights = aggregate_monthly_insights(
+            year_key, manifest.review, directory
+        )
 
         # Merge monthly insights with existing review
         if monthly_insights and not existing_review:
@@ -416,15 +807,17 @@ def main():
                     existing_review[key] = monthly_insights[key]
 
         markdown = generate_summary_markdown(year_key, stats, "year", existing_review)
-
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        manifest.write(filename, markdown, inputs)
 
         if existing_review and any(existing_review.values()):
             print(f"  Updated {filename} (with monthly insights)")
         else:
             print(f"  Created {filename}")
 
+    manifest.save()
+    if unchanged:
+        print(f"  {unchanged} summaries unchanged")
+
     print("Summary generation complete!")
 
 
@@ -474,18 +867,90 @@ def get_week_month(week_number, year):
         return None
 
 
-def aggregate_weekly_insights(year, month):
+class SummaryDirectory:
+    """
+    In-memory index of the summary files by period
+
+    The directory is listed once; each weekly file is filed under the month
+    `get_week_month` assigns it to, so finding the weeks of a month or the
+    months of a year is a dictionary lookup instead of a directory scan.
+    """
+
+    def __init__(self, summaries_dir="index.directory/summaries"):
+        self.summaries_dir = summaries_dir
+        self.weeks = defaultdict(dict)  # (year, month) -> {week_num: path}
+        self.months = defaultdict(dict)  # year -> {month_num: path}
+        if os.path.exists(summaries_dir):
+            for filename in os.listdir(summaries_dir):
+                self.add(os.path.join(summaries_dir, filename))
+
+    def add(self, filepath):
+        """
+        Index a summary file (other files are ignored)
+
+        Args:
+            filepath (str): Path of a file in the summaries directory
+        """
+        filename = os.path.basename(filepath)
+        week_match = re.match(WEEKLY_PATTERN, filename)
+        if week_match:
+            year, week_num = int(week_match.group(1)), int(week_match.group(2))
+            # Check which month this week belongs to
+            week_month = get_week_month(week_num, year)
+            if week_month is not None:
+                self.weeks[(year, week_month)][week_num] = filepath
+            return
+
+        month_match = re.match(MONTHLY_PATTERN, filename)
+        if month_match:
+            year, month_num = int(month_match.group(1)), int(month_match.group(2))
+            if 1 <= month_num <= 12:
+                self.months[year][month_num] = filepath
+
+    def weekly_files(self, year, month):
+        """
+        List the weekly summary files that fall in a month
+
+        Args:
+            year (str): Year string
+            month (str): Month string (01-12)
+
+        Returns:
+            list: (week_number, filepath) tuples sorted by week number
+        """
+        return sorted(self.weeks.get((int(year), int(month)), {}).items())
+
+    def monthly_files(self, year):
+        """
+        List the monthly summary files of a year
+
+        Args:
+            year (str): Year string
+
+        Returns:
+            list: (month_name, filepath) tuples in calendar order
+        """
+        return [
+            (datetime(int(year), month_num, 1).strftime("%B"), filepath)
+            for month_num, filepath in sorted(self.months.get(int(year), {}).items())
+        ]
+
+
+def aggregate_weekly_insights(
+    year, month, load_review=load_existing_summary, directory=None
+):
     """
     Aggregate insights from weekly summaries for a given month
 
     Args:
         year (str): Year string
         month (str): Month string (01-12)
+        load_review (callable): Returns the review sections of a summary file
+        directory (SummaryDirectory): Summary file index (listed if omitted)
 
     Returns:
         dict: Aggregated review sections
     """
-    summaries_dir = "index.directory/summaries"
     aggregated = {
         "what_went_well": "",
         "needs_improvement": "",
@@ -495,30 +960,15 @@ def aggregate_weekly_insights(year, month):
 
     # Find all weekly summaries for this month
     weekly_reviews = []
-    if os.path.exists(summaries_dir):
-        for filename in os.listdir(summaries_dir):
-            if filename.startswith(f"weekly-{year}-W") and filename.endswith(".md"):
-                # Extract week number from filename
-                try:
-                    week_match = re.match(WEEKLY_PATTERN, filename)
-                    if week_match:
-                        week_num = int(week_match.group(1))
-                        # Check if this week belongs to the target month
-                        week_month = get_week_month(week_num, int(year))
-                        if week_month == int(month):
-                            filepath = os.path.join(summaries_dir, filename)
-                            review = load_existing_summary(filepath)
-                            if review and any(review.values()):
-                                weekly_reviews.append((week_num, review))
-                except (ValueError, AttributeError):
-                    continue
+    directory = directory or SummaryDirectory()
+    for week_num, filepath in directory.weekly_files(year, month):
+        review = load_review(filepath)
+        if review and any(review.values()):
+            weekly_reviews.append((week_num, review))
 
     if not weekly_reviews:
         return None
 
-    # Sort by week number
-    weekly_reviews.sort(key=lambda x: x[0])
-
     # Aggregate each section using the helper function
     aggregated["what_went_well"] = aggregate_section(
         weekly_reviews, "what_went_well", "**Week {}**"
@@ -533,17 +983,18 @@ def aggregate_weekly_insights(year, month):
     return aggregated if any(aggregated.values()) else None
 
 
-def aggregate_monthly_insights(year):
+def aggregate_monthly_insights(year, load_review=load_existing_summary, directory=None):
     """
     Aggregate insights from monthly summaries for a given year
 
     Args:
         year (str): Year string
+        load_review (callable): Returns the review sections of a summary file
+        directory (SummaryDirectory): Summary file index (listed if omitted)
 
     Returns:
         dict: Aggregated review sections
     """
-    summaries_dir = "index.directory/summaries"
     aggregated = {
         "what_went_well": "",
         "needs_improvement": "",
@@ -553,24 +1004,11 @@ def aggregate_monthly_insights(year):
 
     # Find all monthly summaries for this year
     monthly_reviews = []
-    if os.path.exists(summaries_dir):
-        for filename in sorted(os.listdir(summaries_dir)):
-            if filename.startswith(f"monthly-{year}-") and filename.endswith(".md"):
-                # Extract month number from filename
-                month_match = re.match(MONTHLY_PATTERN, filename)
-                if not month_match:
-                    continue
-                month_num = int(month_match.group(1))
-                if not (1 <= month_num <= 12):
-                    continue
-                try:
-                    month_name = datetime(int(year), month_num, 1).strftime("%B")
-                except ValueError:
-                    continue
-                filepath = os.path.join(summaries_dir, filename)
-                review = load_existing_summary(filepath)
-                if review and any(review.values()):
-                    monthly_reviews.append((month_name, review))
+    directory = directory or SummaryDirectory()
+    for month_name, filepath in directory.monthly_files(year):
+        review = load_review(filepath)
+        if review and any(review.values()):
+            monthly_reviews.append((month_name, review))
 
     if not monthly_reviews:
         return None
@@ -11,138 +11,50 @@ Features:
 - Mobile-friendly design with dark theme
 
 Performance Optimizations:
-- List comprehensions for gallery and tag rendering
-- Efficient string joining instead of concatenation in loops
-- Pre-computed formatting with f-strings
+- Page layout is a template_engine template compiled once per process
+- Pages are streamed straight into their files instead of built as strings
+- Gallery entries are filtered and their paths rewritten once per trade
+- Page manifest (trade-pages-manifest.json) maps each trade's identity to
+  the hash of its page context and its output file; only new or changed
+  pages are rendered, and trade-*.html files no trade produces any more
+  (removed or renumbered trades) are deleted
+- When many pages change at once they are rendered in batches across a
+  process pool
 
 Output: index.directory/trades/{trade-id}.html
 """
 
+import argparse
+import hashlib
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from navbar_template import get_navbar_html
+from template_engine import compile_template
 
+# Page hashes and output files from the last run, keyed by trade identity
+PAGES_MANIFEST_FILE = "trade-pages-manifest.json"
 
-def load_trades_index():
-    """Load the trades index JSON file"""
-    try:
-        with open("index.directory/trades-index.json", "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print("Error: index.directory/trades-index.json not found")
-        return None
+# Bump to re-render every page (e.g. after a context change)
+PAGE_FORMAT_VERSION = 1
 
+# Changed pages needed before rendering fans out to a process pool
+PARALLEL_PAGE_THRESHOLD = 200
 
-def generate_trade_html(trade):
-    """
-    Generate HTML for a single trade detail page with full details
+# Pages handed to a worker at a time
+PAGE_BATCH_SIZE = 50
 
-    Args:
-        trade (dict): Trade dictionary
-
-    Returns:
-        str: HTML content
-    """
-    # Extract trade data
-    trade_number = trade.get("trade_number", 0)
-    ticker = trade.get("ticker", "UNKNOWN")
-    entry_date = trade.get("entry_date", "")
-    entry_time = trade.get("entry_time", "")
-    exit_date = trade.get("exit_date", "")
-    exit_time = trade.get("exit_time", "")
-    entry_price = trade.get("entry_price", 0)
-    exit_price = trade.get("exit_price", 0)
-    position_size = trade.get("position_size", 0)
-    pnl_usd = trade.get("pnl_usd", 0)
-    pnl_percent = trade.get("pnl_percent", 0)
-    direction = trade.get("direction", "LONG")
-    strategy = trade.get("strategy", "Unknown")
-    stop_loss = trade.get("stop_loss", 0)
-    target_price = trade.get("target_price", 0)
-    risk_reward_ratio = trade.get("risk_reward_ratio", 0)
-    broker = trade.get("broker", "Unknown")
-    notes = trade.get("notes", "No notes recorded.")
-
-    # Get tags (v1.1 schema)
-    strategy_tags = trade.get("strategy_tags", [])
-    setup_tags = trade.get("setup_tags", [])
-    session_tags = trade.get("session_tags", [])
-    market_condition_tags = trade.get("market_condition_tags", [])
-
-    # Get images
-    images = trade.get("images", [])
-    screenshots = trade.get("screenshots", [])
-    if not images and screenshots:
-        images = screenshots if isinstance(screenshots, list) else []
-
-    # Calculate additional metrics
-    time_in_trade = ""
-    if entry_date and exit_date and entry_time and exit_time:
-        try:
-            entry_dt = datetime.strptime(f"{entry_date} {entry_time}", "%Y-%m-%d %H:%M")
-            exit_dt = datetime.strptime(f"{exit_date} {exit_time}", "%Y-%m-%d %H:%M")
-            duration = exit_dt - entry_dt
-            hours = duration.total_seconds() / 3600
-            if hours < 1:
-                time_in_trade = f"{int(duration.total_seconds() / 60)} minutes"
-            else:
-                time_in_trade = f"{hours:.1f} hours"
-        except:
-            time_in_trade = "Unknown"
-
-    # Generate tag badges HTML
-    def render_tags(tags, color):
-        if not tags:
-            return '<span style="color: var(--text-secondary); font-style: italic;">None</span>'
-        # Use list comprehension and join for better performance
-        return "".join([
-            f'<span style="display: inline-block; padding: 0.25rem 0.75rem; background: {color}; color: white; border-radius: 4px; font-size: 0.875rem; margin-right: 0.5rem; margin-bottom: 0.5rem;">{tag}</span>'
-            for tag in tags
-        ])
-
-    # Generate image gallery HTML
-    gallery_html = ""
-    if images and len(images) > 0:
-        # Use list comprehension with pre-computed paths to avoid duplicate operations
-        gallery_items = []
-        for idx, img in enumerate(images):
-            if img and img != "None" and img.strip():
-                img_path = img.replace("../../assets/", "../assets/")
-                gallery_items.append(f"""
-                <a href="{img_path}" class="glightbox" data-gallery="trade-{trade_number}">
-                    <img src="{img_path}" alt="Trade screenshot {idx+1}" style="width: 200px; height: 150px; object-fit: cover; border-radius: 8px; cursor: pointer; border: 2px solid var(--border-color); transition: all 0.3s;">
-                </a>
-                """)
-
-        if gallery_items:
-            gallery_html = f"""
-            <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-                <h2 style="margin-bottom: 1rem;">📸 Screenshots</h2>
-                <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 1rem;">
-                    {''.join(gallery_items)}
-                </div>
-            </div>
-            """
-        else:
-            gallery_html = """
-            <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
-                <h2 style="margin-bottom: 1rem;">📸 Screenshots</h2>
-                <p style="color: var(--text-secondary); margin: 0;">No screenshots available for this trade.</p>
-            </div>
-            """
-
-    # Generate full HTML template
-    html = f"""<!DOCTYPE html>
+# Trade detail page layout
+TRADE_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <meta name="description" content="Trade #{trade_number} - {ticker} details and analysis">
+  <meta name="description" content="Trade #{{ trade_number }} - {{ ticker }} details and analysis">
   <meta name="theme-color" content="#00ff88">
   
-  <title>Trade #{trade_number} - {ticker} - SFTi-Pennies</title>
+  <title>Trade #{{ trade_number }} - {{ ticker }} - SFTi-Pennies</title>
   
   <!-- Fonts -->
   <link rel="preconnect" href="https://fonts.googleapis.com">
@@ -169,7 +81,7 @@ def generate_trade_html(trade):
 <body>
   <canvas id="bg-canvas"></canvas>
   
-{get_navbar_html("subdirectory")}
+{{ navbar }}
   
   <!-- Main Content -->
   <main class="container">
@@ -177,42 +89,42 @@ def generate_trade_html(trade):
       <!-- Header -->
       <div style="margin-bottom: 2rem;">
         <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 0.5rem; flex-wrap: wrap;">
-          <h1 style="margin: 0;">Trade #{trade_number}: {ticker}</h1>
-          <span style="padding: 0.375rem 1rem; background: {'rgba(0,255,136,0.2)' if pnl_usd >= 0 else 'rgba(255,71,87,0.2)'}; color: {'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)'}; border-radius: 6px; font-weight: 700; font-size: 0.875rem; text-transform: uppercase; letter-spacing: 0.05em;">
-            {'🎯 WIN' if pnl_usd >= 0 else '❌ LOSS'}
+          <h1 style="margin: 0;">Trade #{{ trade_number }}: {{ ticker }}</h1>
+          <span style="padding: 0.375rem 1rem; background: {{ 'rgba(0,255,136,0.2)' if pnl_usd >= 0 else 'rgba(255,71,87,0.2)' }}; color: {{ 'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)' }}; border-radius: 6px; font-weight: 700; font-size: 0.875rem; text-transform: uppercase; letter-spacing: 0.05em;">
+            {{ '🎯 WIN' if pnl_usd >= 0 else '❌ LOSS' }}
           </span>
         </div>
         <div style="display: flex; gap: 1rem; align-items: center; flex-wrap: wrap;">
-          <p style="color: var(--text-secondary); margin: 0;">{strategy} | {direction}</p>
+          <p style="color: var(--text-secondary); margin: 0;">{{ strategy }} | {{ direction }}</p>
           <span style="color: var(--text-secondary);">•</span>
-          <p style="color: var(--text-secondary); margin: 0;">{broker}</p>
+          <p style="color: var(--text-secondary); margin: 0;">{{ broker }}</p>
         </div>
       </div>
       
       <!-- Key Metrics Grid -->
       <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 1rem; margin-bottom: 2rem;">
-        <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px; border: 2px solid {'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)'};">
+        <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px; border: 2px solid {{ 'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)' }};">
           <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">P&L (USD)</div>
-          <div style="font-family: var(--font-mono); font-size: 2rem; font-weight: 700; color: {'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)'};">
-            ${pnl_usd:.2f}
+          <div style="font-family: var(--font-mono); font-size: 2rem; font-weight: 700; color: {{ 'var(--accent-green)' if pnl_usd >= 0 else 'var(--accent-red)' }};">
+            ${{ pnl_usd:.2f }}
           </div>
         </div>
         <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px;">
           <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">P&L (%)</div>
-          <div style="font-family: var(--font-mono); font-size: 2rem; font-weight: 700; color: {'var(--accent-green)' if pnl_percent >= 0 else 'var(--accent-red)'};">
-            {'+' if pnl_percent >= 0 else ''}{pnl_percent:.2f}%
+          <div style="font-family: var(--font-mono); font-size: 2rem; font-weight: 700; color: {{ 'var(--accent-green)' if pnl_percent >= 0 else 'var(--accent-red)' }};">
+            {{ '+' if pnl_percent >= 0 else '' }}{{ pnl_percent:.2f }}%
           </div>
         </div>
         <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px;">
           <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">Position Size</div>
           <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 600;">
-            {position_size} shares
+            {{ position_size }} shares
           </div>
         </div>
         <div style="background: var(--bg-secondary); padding: 1.25rem; border-radius: 8px;">
           <div style="font-size: 0.75rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.5rem;">Time in Trade</div>
           <div style="font-family: var(--font-mono); font-size: 1.5rem; font-weight: 600;">
-            {time_in_trade}
+            {{ time_in_trade }}
           </div>
         </div>
       </div>
@@ -226,15 +138,15 @@ def generate_trade_html(trade):
             <div style="display: flex; flex-direction: column; gap: 0.5rem;">
               <div style="display: flex; justify-content: space-between;">
                 <span style="color: var(--text-secondary);">Price:</span>
-                <span style="font-family: var(--font-mono); font-weight: 600;">${entry_price:.2f}</span>
+                <span style="font-family: var(--font-mono); font-weight: 600;">${{ entry_price:.2f }}</span>
               </div>
               <div style="display: flex; justify-content: space-between;">
                 <span style="color: var(--text-secondary);">Date:</span>
-                <span style="font-family: var(--font-mono);">{entry_date}</span>
+                <span style="font-family: var(--font-mono);">{{ entry_date }}</span>
               </div>
               <div style="display: flex; justify-content: space-between;">
                 <span style="color: var(--text-secondary);">Time:</span>
-                <span style="font-family: var(--font-mono);">{entry_time}</span>
+                <span style="font-family: var(--font-mono);">{{ entry_time }}</span>
               </div>
             </div>
           </div>
@@ -243,15 +155,15 @@ def generate_trade_html(trade):
             <div style="display: flex; flex-direction: column; gap: 0.5rem;">
               <div style="display: flex; justify-content: space-between;">
                 <span style="color: var(--text-secondary);">Price:</span>
-                <span style="font-family: var(--font-mono); font-weight: 600;">${exit_price:.2f}</span>
+                <span style="font-family: var(--font-mono); font-weight: 600;">${{ exit_price:.2f }}</span>
               </div>
               <div style="display: flex; justify-content: space-between;">
                 <span style="color: var(--text-secondary);">Date:</span>
-                <span style="font-family: var(--font-mono);">{exit_date}</span>
+                <span style="font-family: var(--font-mono);">{{ exit_date }}</span>
               </div>
               <div style="display: flex; justify-content: space-between;">
                 <span style="color: var(--text-secondary);">Time:</span>
-                <span style="font-family: var(--font-mono);">{exit_time}</span>
+                <span style="font-family: var(--font-mono);">{{ exit_time }}</span>
               </div>
             </div>
           </div>
@@ -265,19 +177,19 @@ def generate_trade_html(trade):
           <div>
             <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Stop Loss</div>
             <div style="font-family: var(--font-mono); font-size: 1.25rem; font-weight: 600; color: var(--accent-red);">
-              ${stop_loss:.2f}
+              ${{ stop_loss:.2f }}
             </div>
           </div>
           <div>
             <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Target Price</div>
             <div style="font-family: var(--font-mono); font-size: 1.25rem; font-weight: 600; color: var(--accent-green);">
-              ${target_price:.2f}
+              ${{ target_price:.2f }}
             </div>
           </div>
           <div>
             <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Risk:Reward Ratio</div>
             <div style="font-family: var(--font-mono); font-size: 1.25rem; font-weight: 600; color: var(--accent-yellow);">
-              1:{risk_reward_ratio:.2f}
+              1:{{ risk_reward_ratio:.2f }}
             </div>
           </div>
         </div>
@@ -287,33 +199,38 @@ def generate_trade_html(trade):
       <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
         <h2 style="margin-bottom: 1.5rem;">🏷️ Tags & Classification</h2>
         <div style="display: grid; gap: 1rem;">
+          {% for label, tags, color in tag_groups %}
           <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Strategy Tags:</div>
-            <div>{render_tags(strategy_tags, 'var(--accent-green)')}</div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Setup Tags:</div>
-            <div>{render_tags(setup_tags, 'var(--accent-blue)')}</div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Session Tags:</div>
-            <div>{render_tags(session_tags, 'var(--accent-yellow)')}</div>
-          </div>
-          <div>
-            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">Market Condition Tags:</div>
-            <div>{render_tags(market_condition_tags, 'var(--accent-red)')}</div>
+            <div style="font-size: 0.875rem; color: var(--text-secondary); margin-bottom: 0.5rem;">{{ label }}:</div>
+            <div>{% for tag in tags %}<span style="display: inline-block; padding: 0.25rem 0.75rem; background: {{ color }}; color: white; border-radius: 4px; font-size: 0.875rem; margin-right: 0.5rem; margin-bottom: 0.5rem;">{{ tag }}</span>{% endfor %}{% if not tags %}<span style="color: var(--text-secondary); font-style: italic;">None</span>{% endif %}</div>
           </div>
+          {% endfor %}
         </div>
       </div>
       
       <!-- Screenshots Gallery -->
-      {gallery_html}
+      {% if images %}
+      <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
+        <h2 style="margin-bottom: 1rem;">📸 Screenshots</h2>
+        {% if gallery %}
+        <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 1rem;">
+          {% for number, img_path in gallery %}
+          <a href="{{ img_path }}" class="glightbox" data-gallery="trade-{{ trade_number }}">
+            <img src="{{ img_path }}" alt="Trade screenshot {{ number }}" style="width: 200px; height: 150px; object-fit: cover; border-radius: 8px; cursor: pointer; border: 2px solid var(--border-color); transition: all 0.3s;">
+          </a>
+          {% endfor %}
+        </div>
+        {% else %}
+        <p style="color: var(--text-secondary); margin: 0;">No screenshots available for this trade.</p>
+        {% endif %}
+      </div>
+      {% endif %}
       
       <!-- Notes Section -->
       <div style="background: var(--bg-secondary); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
         <h2 style="margin-bottom: 1rem;">📝 Notes & Journal</h2>
         <div style="line-height: 1.8; color: var(--text-primary);">
-          {notes.replace(chr(10), '<br>')}
+          {{ notes.replace(chr(10), '<br>') }}
         </div>
       </div>
       
@@ -326,12 +243,12 @@ def generate_trade_html(trade):
   <script src="https://cdn.jsdelivr.net/gh/mcstudios/glightbox/dist/js/glightbox.min.js"></script>
   <script>
     // Initialize GLightbox for image gallery
-    const lightbox = GLightbox({{
+    const lightbox = GLightbox({
       selector: '.glightbox',
       touchNavigation: true,
       loop: true,
       autoplayVideos: true
-    }});
+    });
   </script>
   
   <!-- Load shared utilities first -->
@@ -349,11 +266,240 @@ def generate_trade_html(trade):
 </html>
 """
 
-    return html
+
+def load_trades_index():
+    """Load the trades index JSON file"""
+    try:
+        with open("index.directory/trades-index.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print("Error: index.directory/trades-index.json not found")
+        return None
+
+
+def trade_page_context(trade):
+    """
+    Collect the template variables for a trade detail page
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        dict: Context for TRADE_PAGE_TEMPLATE
+    """
+    # Extract trade data
+    trade_number = trade.get("trade_number", 0)
+    ticker = trade.get("ticker", "UNKNOWN")
+    entry_date = trade.get("entry_date", "")
+    entry_time = trade.get("entry_time", "")
+    exit_date = trade.get("exit_date", "")
+    exit_time = trade.get("exit_time", "")
+    entry_price = trade.get("entry_price", 0)
+    exit_price = trade.get("exit_price", 0)
+    position_size = trade.get("position_size", 0)
+    pnl_usd = trade.get("pnl_usd", 0)
+    pnl_percent = trade.get("pnl_percent", 0)
+    direction = trade.get("direction", "LONG")
+    strategy = trade.get("strategy", "Unknown")
+    stop_loss = trade.get("stop_loss", 0)
+    target_price = trade.get("target_price", 0)
+    risk_reward_ratio = trade.get("risk_reward_ratio", 0)
+    broker = trade.get("broker", "Unknown")
+    notes = trade.get("notes", "No notes recorded.")
+
+    # Get tags (v1.1 schema)
+    strategy_tags = trade.get("strategy_tags", [])
+    setup_tags = trade.get("setup_tags", [])
+    session_tags = trade.get("session_tags", [])
+    market_condition_tags = trade.get("market_condition_tags", [])
+
+    # Get images
+    images = trade.get("images", [])
+    screenshots = trade.get("screenshots", [])
+    if not images and screenshots:
+        images = screenshots if isinstance(screenshots, list) else []
+
+    # Holding time is computed once by parse_trades.py from entry/exit timestamps
+    time_in_trade = trade.get("time_in_trade", "")
+    if not time_in_trade and entry_time and exit_time:
+        time_in_trade = "Unknown"
+
+    # Screenshots that exist, numbered by their position in the list
+    gallery = [
+        (idx + 1, img.replace("../../assets/", "../assets/"))
+        for idx, img in enumerate(images)
+        if img and img != "None" and img.strip()
+    ]
+
+    return {
+        "navbar": get_navbar_html("subdirectory"),
+        "trade_number": trade_number,
+        "ticker": ticker,
+        "entry_date": entry_date,
+        "entry_time": entry_time,
+        "exit_date": exit_date,
+        "exit_time": exit_time,
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "position_size": position_size,
+        "pnl_usd": pnl_usd,
+        "pnl_percent": pnl_percent,
+        "direction": direction,
+        "strategy": strategy,
+        "stop_loss": stop_loss,
+        "target_price": target_price,
+        "risk_reward_ratio": risk_reward_ratio,
+        "broker": broker,
+        "notes": notes,
+        "time_in_trade": time_in_trade,
+        "tag_groups": [
+            ("Strategy Tags", strategy_tags, "var(--accent-green)"),
+            ("Setup Tags", setup_tags, "var(--accent-blue)"),
+            ("Session Tags", session_tags, "var(--accent-yellow)"),
+            ("Market Condition Tags", market_condition_tags, "var(--accent-red)"),
+        ],
+        "images": images,
+        "gallery": gallery,
+    }
+
+
+def generate_trade_html(trade):
+    """
+    Generate HTML for a single trade detail page with full details
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        str: HTML content
+    """
+    template = compile_template(TRADE_PAGE_TEMPLATE, "trade-page.html")
+    return template.render(trade_page_context(trade))
+
+
+def write_trade_page(trade, filepath):
+    """
+    Stream a trade detail page straight into its file
+
+    Args:
+        trade (dict): Trade dictionary
+        filepath (str): Output HTML path
+    """
+    template = compile_template(TRADE_PAGE_TEMPLATE, "trade-page.html")
+    template.render_to_file(filepath, trade_page_context(trade))
+
+
+def trade_page_filename(trade):
+    """Output file name of a trade's detail page"""
+    return f"trade-{trade.get('trade_number', 0):03d}-{trade.get('ticker', 'UNKNOWN')}.html"
+
+
+def trade_identity(trade):
+    """
+    Stable key for a trade across runs
+
+    The source file survives renumbering, so it is preferred; trades without
+    one fall back to their number and ticker.
+
+    Args:
+        trade (dict): Trade dictionary
+
+    Returns:
+        str: Identity key
+    """
+    if trade.get("file_path"):
+        return trade["file_path"]
+    return f"{trade.get('trade_number', 0)}-{trade.get('ticker', 'UNKNOWN')}"
+
+
+def trade_page_hash(context):
+    """
+    Hash everything that affects a rendered page
+
+    Args:
+        context (dict): trade_page_context() result
+
+    Returns:
+        str: Hex digest
+    """
+    payload = json.dumps(
+        [PAGE_FORMAT_VERSION, TRADE_PAGE_TEMPLATE, context],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_pages_manifest(output_dir):
+    """Load {identity: {'path', 'hash'}} for previously rendered pages"""
+    try:
+        with open(output_dir / PAGES_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_pages_manifest(output_dir, manifest):
+    """Persist the page manifest"""
+    with open(output_dir / PAGES_MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def write_trade_page_batch(batch):
+    """
+    Worker entry point: render a batch of pages
+
+    Args:
+        batch (list): (context, filepath) pairs
+
+    Returns:
+        int: Pages written
+    """
+    template = compile_template(TRADE_PAGE_TEMPLATE, "trade-page.html")
+    for context, filepath in batch:
+        template.render_to_file(filepath, context)
+    return len(batch)
+
+
+def render_trade_pages(pages, workers=None):
+    """
+    Render pages, across a process pool when there are many of them
+
+    Args:
+        pages (list): (context, filepath) pairs
+        workers (int): Process count (default: one per CPU)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(pages) < PARALLEL_PAGE_THRESHOLD:
+        write_trade_page_batch(pages)
+        return
+
+    batches = [
+        pages[i : i + PAGE_BATCH_SIZE] for i in range(0, len(pages), PAGE_BATCH_SIZE)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(write_trade_page_batch, batches):
+            pass
 
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Generate trade detail pages")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used when many pages change (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every page even if its trade has not changed",
+    )
+    args = parser.parse_args()
+
     print("Generating trade detail pages...")
 
     # Load trades
@@ -372,24 +518,46 @@ def main():
     output_dir = Path("index.directory/trades")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate pages
+    # One page per output file; a later trade with the same file name wins
+    pages = {}
     for trade in trades:
-        trade_number = trade.get("trade_number", 0)
-        ticker = trade.get("ticker", "UNKNOWN")
-
-        # Generate HTML
-        html_content = generate_trade_html(trade)
-
-        # Write file
-        filename = f"trade-{trade_number:03d}-{ticker}.html"
+        context = trade_page_context(trade)
+        pages[trade_page_filename(trade)] = (
+            trade_identity(trade),
+            context,
+            trade_page_hash(context),
+        )
+
+    # Render only pages that are new, changed, moved or missing
+    previous = load_pages_manifest(output_dir)
+    manifest = {}
+    to_render = []
+    for filename, (identity, context, digest) in pages.items():
+        entry = {"path": filename, "hash": digest}
+        manifest[identity] = entry
         filepath = output_dir / filename
+        if args.force or previous.get(identity) != entry or not filepath.exists():
+            to_render.append((context, filepath))
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
+    render_trade_pages(to_render, args.workers)
+    for _, filepath in to_render:
         print(f"Generated: {filepath}")
 
-    print(f"\n✓ Generated {len(trades)} trade detail page(s)")
+    # Remove pages of trades that were deleted or renumbered
+    removed = 0
+    for stale in output_dir.glob("trade-*.html"):
+        if stale.name not in pages:
+            stale.unlink()
+            removed += 1
+            print(f"Removed stale page: {stale}")
+
+    if manifest != previous:
+        save_pages_manifest(output_dir, manifest)
+
+    print(
+        f"\n✓ Generated {len(to_render)} trade detail page(s) "
+        f"({len(pages) - len(to_render)} unchanged, {removed} stale removed)"
+    )
     print(f"Output directory: {output_dir}")
 
 
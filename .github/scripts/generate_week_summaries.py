@@ -5,25 +5,110 @@ Creates master.trade.md files for each week folder
 
 This script:
 1. Scans all week folders in SFTi.Tradez/
-2. Aggregates trade data for each week
+2. Aggregates trade data for each week from trades-index.json
 3. Generates a master.trade.md file with week summary
 4. Includes statistics, trade list, and images
 
 Performance Optimizations:
+- Trades come from the records parse_trades.py already wrote to
+  trades-index.json, grouped by week folder; only trade files missing from
+  the index are opened and parsed
+- Per-folder fingerprint (trade file names and content hashes, the
+  folder's index records, image names and sizes, template version) kept in
+  master-manifest.json; folders whose fingerprint is unchanged are skipped,
+  and the manifest holds only fingerprints, so a fresh checkout (new
+  mtimes) neither re-renders a week nor rewrites the manifest
+- Changed week folders rendered in parallel in a process pool
 - Single-pass calculation for week statistics
 - Efficient tracking of wins/losses without intermediate lists
 - Combined calculation of totals and extremes
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
 import os
 import sys
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 import yaml
 
+from template_engine import compile_template
+
+# Notes section of a trade body (same pattern as parse_trades.py)
+NOTES_PATTERN = re.compile(r"## Notes\s*\n+(.*?)(?=\n##|\Z)", re.DOTALL)
+
+# Placeholder parse_trades.py stores when a trade has no notes
+NO_NOTES = "No notes recorded."
+
+# Fingerprints of the week folders each master.trade.md was built from
+MASTER_MANIFEST_FILE = "master-manifest.json"
+
+# Bump to invalidate every master.trade.md (e.g. after a stats change)
+MASTER_FORMAT_VERSION = 1
+
+# master.trade.md layout
+MASTER_TEMPLATE = """# {{ title }} - Trading Summary
+
+## Overview
+
+This week's trading session included **{{ stats['total_trades'] }} trades** with a total P&L of **${{ stats['total_pnl']:.2f }}**.
+
+## Performance Metrics
+
+| Metric | Value |
+|--------|-------|
+| Total Trades | {{ stats['total_trades'] }} |
+| Total P&L | ${{ stats['total_pnl']:.2f }} |
+| Win Rate | {{ stats['win_rate']:.1f }}% |
+| Wins | {{ stats['wins'] }} |
+| Losses | {{ stats['losses'] }} |
+| Breakeven | {{ stats['breakeven'] }} |
+| Average Win | ${{ stats['avg_win']:.2f }} |
+| Average Loss | ${{ stats['avg_loss']:.2f }} |
+| Largest Win | ${{ stats['largest_win']:.2f }} |
+| Largest Loss | ${{ stats['largest_loss']:.2f }} |
+| Profit Factor | {{ stats['profit_factor']:.2f }} |
+| Gross Profit | ${{ stats['gross_profit']:.2f }} |
+| Gross Loss | ${{ stats['gross_loss']:.2f }} |
+
+## Trade List
+
+{% for i, trade in enumerate(trades, 1) %}
+
+### {{ i }}. {{ trade.get('ticker', 'N/A') }} - {{ trade.get('entry_date', 'N/A') }}
+
+- **Direction**: {{ trade.get('direction', 'LONG') }}
+- **Entry**: ${{ float(trade.get('entry_price', 0) or 0):.2f }}
+- **Exit**: ${{ float(trade.get('exit_price', 0) or 0):.2f }}
+- **P&L**: ${{ float(trade.get('pnl_usd', 0) or 0):.2f }}
+{% if trade.get('strategy_tags') %}
+- **Strategy**: {{ join_tags(trade['strategy_tags']) }}
+{% endif %}
+{% if trade.get('setup_tags') %}
+- **Setup**: {{ join_tags(trade['setup_tags']) }}
+{% endif %}
+{% if trade.get('notes') and trade['notes'].strip() %}
+
+**Notes**: {{ trade['notes'].strip() }}
+{% endif %}
+{% endfor %}
+
+
+## Weekly Reflection
+
+_Add your weekly reflection, lessons learned, and improvements for next week..._
+
+---
+
+*Generated on {{ generated }}*
+"""
+
 
 def get_repo_root():
     """Get the repository root directory"""
@@ -57,36 +142,80 @@ def parse_trade_file(file_path: Path) -> Dict:
         data = yaml.safe_load(frontmatter_text) or {}
         data["body"] = body_text.strip()
 
+        # Notes live in the body unless the frontmatter sets them
+        if not data.get("notes"):
+            notes_match = NOTES_PATTERN.search(data["body"])
+            if notes_match:
+                data["notes"] = notes_match.group(1).strip()
+
         return data
     except Exception as e:
         print(f"Error parsing {file_path}: {e}")
         return {}
 
 
-def collect_week_trades(week_folder: Path) -> List[Dict]:
+def load_indexed_trades(repo_root: Path) -> Dict[Path, Dict[str, Dict]]:
+    """
+    Group the parsed trade records in trades-index.json by week folder
+
+    Args:
+        repo_root (Path): Repository root (trade file paths are relative to it)
+
+    Returns:
+        Dict[Path, Dict[str, Dict]]: Folder path -> file name -> trade record
+            (empty if the index is missing or unreadable)
+    """
+    index_file = repo_root / "index.directory" / "trades-index.json"
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            index_data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not load {index_file} ({e}); parsing trade files")
+        return {}
+
+    by_folder = {}
+    for trade in index_data.get("trades", []):
+        file_path = trade.get("file_path")
+        if not file_path:
+            continue
+        path = Path(os.path.normpath(repo_root / file_path))
+        by_folder.setdefault(path.parent, {})[path.name] = trade
+    return by_folder
+
+
+def collect_week_trades(week_folder: Path, indexed=None) -> List[Dict]:
     """
     Collect all trades from a week folder
 
     Args:
         week_folder (Path): Path to week folder
+        indexed (Dict[str, Dict]): Index records for this folder by file name;
+            files without a record are parsed from disk
 
     Returns:
         List[Dict]: List of trade data
     """
     trades = []
+    indexed = indexed or {}
 
     # Find all .md files except master.trade.md
     for trade_file in week_folder.glob("*.md"):
         if trade_file.name == "master.trade.md":
             continue
 
-        trade_data = parse_trade_file(trade_file)
+        record = indexed.get(trade_file.name)
+        if record is not None:
+            trade_data = dict(record)
+            if trade_data.get("notes") == NO_NOTES:
+                del trade_data["notes"]
+        else:
+            trade_data = parse_trade_file(trade_file)
         if trade_data:
             trade_data["file_name"] = trade_file.name
             trades.append(trade_data)
 
-    # Sort by date
-    trades.sort(key=lambda x: x.get("entry_date", ""))
+    # Sort by date (index records hold strings, parsed files date objects)
+    trades.sort(key=lambda x: str(x.get("entry_date", "")))
 
     return trades
 
@@ -170,6 +299,11 @@ def calculate_week_stats(trades: List[Dict]) -> Dict:
     }
 
 
+def join_tags(tags) -> str:
+    """Render a tag list (or a single tag string) as comma-separated text"""
+    return ", ".join(tags) if isinstance(tags, list) else str(tags)
+
+
 def generate_master_markdown(week_name: str, stats: Dict, trades: List[Dict]) -> str:
     """
     Generate master.trade.md content
@@ -190,88 +324,99 @@ def generate_master_markdown(week_name: str, stats: Dict, trades: List[Dict]) ->
     else:
         title = f"Week {week_name}"
 
-    # Generate markdown
-    md = f"""# {title} - Trading Summary
+    template = compile_template(MASTER_TEMPLATE, "master.trade.md")
+    return template.render(
+        title=title,
+        stats=stats,
+        trades=trades,
+        join_tags=join_tags,
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
 
-## Overview
 
-This week's trading session included **{stats['total_trades']} trades** with a total P&L of **${stats['total_pnl']:.2f}**.
+def file_digest(path: Path) -> str:
+    """
+    SHA-1 of a file's contents
 
-## Performance Metrics
+    Args:
+        path (Path): File to hash
 
-| Metric | Value |
-|--------|-------|
-| Total Trades | {stats['total_trades']} |
-| Total P&L | ${stats['total_pnl']:.2f} |
-| Win Rate | {stats['win_rate']:.1f}% |
-| Wins | {stats['wins']} |
-| Losses | {stats['losses']} |
-| Breakeven | {stats['breakeven']} |
-| Average Win | ${stats['avg_win']:.2f} |
-| Average Loss | ${stats['avg_loss']:.2f} |
-| Largest Win | ${stats['largest_win']:.2f} |
-| Largest Loss | ${stats['largest_loss']:.2f} |
-| Profit Factor | {stats['profit_factor']:.2f} |
-| Gross Profit | ${stats['gross_profit']:.2f} |
-| Gross Loss | ${stats['gross_loss']:.2f} |
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-## Trade List
 
-"""
+def week_fingerprint(week_folder: Path, assets_folder: Path, indexed=None) -> str:
+    """
+    Fingerprint everything a week's master.trade.md is built from
 
-    # Add trade list
-    for i, trade in enumerate(trades, 1):
-        ticker = trade.get("ticker", "N/A")
-        date = trade.get("entry_date", "N/A")
-        pnl = float(trade.get("pnl_usd", 0) or 0)
-        pnl_str = f"${pnl:.2f}"
-        direction = trade.get("direction", "LONG")
-        entry = float(trade.get("entry_price", 0) or 0)
-        exit_val = float(trade.get("exit_price", 0) or 0)
-
-        md += f"\n### {i}. {ticker} - {date}\n\n"
-        md += f"- **Direction**: {direction}\n"
-        md += f"- **Entry**: ${entry:.2f}\n"
-        md += f"- **Exit**: ${exit_val:.2f}\n"
-        md += f"- **P&L**: {pnl_str}\n"
-
-        # Add strategy tags if available
-        if trade.get("strategy_tags"):
-            tags = trade["strategy_tags"]
-            if isinstance(tags, list):
-                md += f"- **Strategy**: {', '.join(tags)}\n"
-            else:
-                md += f"- **Strategy**: {tags}\n"
+    Trade files are identified by content, since a fresh checkout gives every
+    file a new mtime. Images are not embedded in the master, so their names
+    and sizes suffice.
 
-        # Add setup tags if available
-        if trade.get("setup_tags"):
-            tags = trade["setup_tags"]
-            if isinstance(tags, list):
-                md += f"- **Setup**: {', '.join(tags)}\n"
-            else:
-                md += f"- **Setup**: {tags}\n"
+    Args:
+        week_folder (Path): Path to week folder
+        assets_folder (Path): The week's image folder (may not exist)
+        indexed (Dict[str, Dict]): Index records for this folder by file name
 
-        # Add notes if available
-        if trade.get("notes"):
-            notes = trade["notes"].strip()
-            if notes:
-                md += f"\n**Notes**: {notes}\n"
+    Returns:
+        str: Hex digest
+    """
+    files = [
+        [trade_file.name, file_digest(trade_file)]
+        for trade_file in sorted(week_folder.glob("*.md"))
+        if trade_file.name != "master.trade.md"
+    ]
+
+    images = []
+    if assets_folder.is_dir():
+        for image in sorted(assets_folder.rglob("*")):
+            if image.is_file():
+                images.append(
+                    [image.relative_to(assets_folder).as_posix(), image.stat().st_size]
+                )
+
+    payload = json.dumps(
+        [
+            MASTER_FORMAT_VERSION,
+            MASTER_TEMPLATE,
+            files,
+            indexed or {},
+            images,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
 
-    md += "\n\n## Weekly Reflection\n\n"
-    md += "_Add your weekly reflection, lessons learned, and improvements for next week..._\n\n"
 
-    md += "---\n\n"
-    md += f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+def load_master_manifest(trades_dir: Path) -> Dict:
+    """Load {week folder name: fingerprint} from the last run"""
+    try:
+        with open(trades_dir / MASTER_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
 
-    return md
+def save_master_manifest(trades_dir: Path, manifest: Dict):
+    """Persist the week folder fingerprints"""
+    with open(trades_dir / MASTER_MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
 
 
-def process_week_folder(week_folder: Path) -> bool:
+def process_week_folder(week_folder: Path, indexed=None) -> bool:
     """
     Process a single week folder and generate master.trade.md
 
     Args:
         week_folder (Path): Path to week folder
+        indexed (Dict[str, Dict]): Index records for this folder by file name
 
     Returns:
         bool: True if successful
@@ -280,7 +425,7 @@ def process_week_folder(week_folder: Path) -> bool:
     print(f"Processing {week_folder.name}...")
 
     # Collect trades
-    trades = collect_week_trades(week_folder)
+    trades = collect_week_trades(week_folder, indexed)
 
     if not trades:
         print(f"  No trades found in {week_folder.name}")
@@ -304,10 +449,68 @@ def process_week_folder(week_folder: Path) -> bool:
         return False
 
 
+def render_week(job) -> Dict:
+    """
+    Worker entry point: generate one master.trade.md, capturing its log
+
+    Args:
+        job (tuple): (week folder, index records for the folder)
+
+    Returns:
+        Dict: {'ok': bool, 'log': printed output}
+    """
+    week_folder, indexed = job
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            ok = process_week_folder(week_folder, indexed)
+        except Exception as e:
+            print(f"  ✗ Error processing {week_folder.name}: {e}")
+            ok = False
+    return {"ok": ok, "log": log.getvalue()}
+
+
+def render_weeks(jobs, workers=None) -> List[Dict]:
+    """
+    Render week jobs, in parallel when there is more than one
+
+    Args:
+        jobs (list): render_week() jobs
+        workers (int): Process count (default: one per job, capped at CPUs)
+
+    Returns:
+        List[Dict]: render_week() results in job order
+    """
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+
+    if workers <= 1 or len(jobs) <= 1:
+        return [render_week(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_week, jobs))
+
+
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Generate week master.trade.md files")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to render changed weeks "
+        "(default: one per changed week, at most one per CPU)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every master.trade.md even if its week has not changed",
+    )
+    args = parser.parse_args()
+
     repo_root = get_repo_root()
     trades_dir = repo_root / "index.directory" / "SFTi.Tradez"
+    assets_dir = repo_root / "index.directory" / "assets" / "sfti.tradez.assets"
 
     if not trades_dir.exists():
         print(f"Error: Trades directory not found: {trades_dir}")
@@ -324,13 +527,43 @@ def main():
 
     print(f"Found {len(week_folders)} week folders\n")
 
-    success_count = 0
+    indexed_trades = load_indexed_trades(repo_root)
+
+    # Fingerprint every folder; only changed ones are regenerated
+    previous = load_master_manifest(trades_dir)
+    manifest = {}
+    jobs = []
     for week_folder in week_folders:
-        if process_week_folder(week_folder):
-            success_count += 1
+        indexed = indexed_trades.get(Path(os.path.normpath(week_folder)))
+        fingerprint = week_fingerprint(
+            week_folder, assets_dir / week_folder.name, indexed
+        )
+        manifest[week_folder.name] = fingerprint
+        if (
+            args.force
+            or previous.get(week_folder.name) != fingerprint
+            or not (week_folder / "master.trade.md").exists()
+        ):
+            jobs.append((week_folder, indexed))
+
+    unchanged = len(week_folders) - len(jobs)
+    success_count = 0
+    if jobs:
+        for (week_folder, _), result in zip(jobs, render_weeks(jobs, args.workers)):
+            print(result["log"], end="")
+            if result["ok"]:
+                success_count += 1
+            else:
+                # Retry next run
+                del manifest[week_folder.name]
+
+    # Written only when a fingerprint or the set of weeks changed
+    if manifest != previous:
+        save_master_manifest(trades_dir, manifest)
 
     print(
-        f"\n✓ Successfully generated {success_count}/{len(week_folders)} master.trade.md files"
+        f"\n✓ Successfully generated {success_count}/{len(jobs)} master.trade.md files"
+        f" ({unchanged} unchanged weeks skipped)"
     )
 
     return 0
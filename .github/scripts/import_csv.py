@@ -19,6 +19,79 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 
+from template_engine import compile_template
+
+# v1.1 schema tag fields, written to the frontmatter when present
+TAG_FIELDS = ["strategy_tags", "setup_tags", "session_tags", "market_condition_tags"]
+
+# Trade markdown layout (frontmatter + body)
+TRADE_MARKDOWN_TEMPLATE = """---
+trade_number: {{ trade.get('trade_number', '') }}
+ticker: {{ trade.get('ticker', '') }}
+entry_date: {{ trade.get('entry_date', '') }}
+entry_time: {{ trade.get('entry_time', '') }}
+exit_date: {{ trade.get('exit_date', '') }}
+exit_time: {{ trade.get('exit_time', '') }}
+entry_price: {{ trade.get('entry_price', '') }}
+exit_price: {{ trade.get('exit_price', '') }}
+position_size: {{ trade.get('position_size', '') }}
+direction: {{ trade.get('direction', 'LONG') }}
+strategy: {{ trade.get('strategy', '') }}
+stop_loss: {{ trade.get('stop_loss', '') }}
+target_price: {{ trade.get('target_price', '') }}
+risk_reward_ratio: {{ trade.get('risk_reward_ratio', '') }}
+broker: {{ trade.get('broker', '') }}
+pnl_usd: {{ trade.get('pnl_usd', '') }}
+pnl_percent: {{ trade.get('pnl_percent', '') }}
+{% for field in tag_fields %}
+{% if field in trade %}
+{{ field }}: {{ trade.get(field, []) }}
+{% endif %}
+{% endfor %}
+screenshots:
+  - {{ screenshots_list[0] if screenshots_list and screenshots_list[0] else 'None' }}
+---
+
+# Trade #{{ trade.get('trade_number', '') }} - {{ trade.get('ticker', '') }}
+
+## Trade Details
+
+- **Ticker**: {{ trade.get('ticker', '') }}
+- **Direction**: {{ trade.get('direction', 'LONG') }}
+- **Entry**: ${{ trade.get('entry_price', '') }} on {{ trade.get('entry_date', '') }} at {{ trade.get('entry_time', '') }}
+- **Exit**: ${{ trade.get('exit_price', '') }} on {{ trade.get('exit_date', '') }} at {{ trade.get('exit_time', '') }}
+- **Position Size**: {{ trade.get('position_size', '') }} shares
+- **Strategy**: {{ trade.get('strategy', '') }}
+- **Broker**: {{ trade.get('broker', '') }}
+
+## Risk Management
+
+- **Stop Loss**: ${{ trade.get('stop_loss', '') }}
+- **Target Price**: ${{ trade.get('target_price', '') }}
+- **Risk:Reward Ratio**: 1:{{ trade.get('risk_reward_ratio', '') }}
+
+## Results
+
+- **P&L (USD)**: ${{ trade.get('pnl_usd', '') }}
+- **P&L (%)**: {{ trade.get('pnl_percent', '') }}%
+
+## Notes
+
+{{ trade.get('notes', 'Imported from CSV') }}
+
+## Screenshots
+
+{% for i, path in enumerate(screenshot_paths) %}
+{% if i %}
+
+{% endif %}
+<img width="2048" height="1679" alt="image" src="{{ path }}"/>
+{% endfor %}
+{% if not screenshot_paths %}
+No screenshots uploaded.
+{% endif %}
+"""
+
 
 def detect_broker(csv_content: str) -> str:
     """
@@ -182,96 +255,22 @@ def create_trade_markdown(trade: Dict, output_dir: str) -> str:
                 else:
                     return absolute_path
 
-        # Load template
-        template_path = ".github/templates/trade.md.template"
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-
-        # Prepare data for template
+        # Screenshot paths relative to the markdown file
         screenshots_list = trade.get("screenshots", [])
         if not screenshots_list or screenshots_list == [""]:
-            screenshots_str = "No screenshots uploaded."
+            screenshot_paths = []
         else:
-            # Convert paths to relative format and generate HTML img tags
-            screenshots_str = "\n\n".join(
-                [
-                    f'<img width="2048" height="1679" alt="image" src="{_convert_to_relative_path(s)}"/>'
-                    for s in screenshots_list
-                ]
-            )
-
-        # Build frontmatter
-        frontmatter = f"""---
-trade_number: {trade.get('trade_number', '')}
-ticker: {trade.get('ticker', '')}
-entry_date: {trade.get('entry_date', '')}
-entry_time: {trade.get('entry_time', '')}
-exit_date: {trade.get('exit_date', '')}
-exit_time: {trade.get('exit_time', '')}
-entry_price: {trade.get('entry_price', '')}
-exit_price: {trade.get('exit_price', '')}
-position_size: {trade.get('position_size', '')}
-direction: {trade.get('direction', 'LONG')}
-strategy: {trade.get('strategy', '')}
-stop_loss: {trade.get('stop_loss', '')}
-target_price: {trade.get('target_price', '')}
-risk_reward_ratio: {trade.get('risk_reward_ratio', '')}
-broker: {trade.get('broker', '')}
-pnl_usd: {trade.get('pnl_usd', '')}
-pnl_percent: {trade.get('pnl_percent', '')}"""
-
-        # Add new fields for v1.1 schema if present
-        if "strategy_tags" in trade:
-            frontmatter += f"\nstrategy_tags: {trade.get('strategy_tags', [])}"
-        if "setup_tags" in trade:
-            frontmatter += f"\nsetup_tags: {trade.get('setup_tags', [])}"
-        if "session_tags" in trade:
-            frontmatter += f"\nsession_tags: {trade.get('session_tags', [])}"
-        if "market_condition_tags" in trade:
-            frontmatter += (
-                f"\nmarket_condition_tags: {trade.get('market_condition_tags', [])}"
-            )
-
-        frontmatter += f"""
-screenshots:
-  - {screenshots_list[0] if screenshots_list and screenshots_list[0] else 'None'}
----
-
-# Trade #{trade.get('trade_number', '')} - {trade.get('ticker', '')}
-
-## Trade Details
-
-- **Ticker**: {trade.get('ticker', '')}
-- **Direction**: {trade.get('direction', 'LONG')}
-- **Entry**: ${trade.get('entry_price', '')} on {trade.get('entry_date', '')} at {trade.get('entry_time', '')}
-- **Exit**: ${trade.get('exit_price', '')} on {trade.get('exit_date', '')} at {trade.get('exit_time', '')}
-- **Position Size**: {trade.get('position_size', '')} shares
-- **Strategy**: {trade.get('strategy', '')}
-- **Broker**: {trade.get('broker', '')}
-
-## Risk Management
-
-- **Stop Loss**: ${trade.get('stop_loss', '')}
-- **Target Price**: ${trade.get('target_price', '')}
-- **Risk:Reward Ratio**: 1:{trade.get('risk_reward_ratio', '')}
-
-## Results
-
-- **P&L (USD)**: ${trade.get('pnl_usd', '')}
-- **P&L (%)**: {trade.get('pnl_percent', '')}%
-
-## Notes
-
-{trade.get('notes', 'Imported from CSV')}
-
-## Screenshots
-
-{screenshots_str}
-"""
-
-        # Write to file
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(frontmatter)
+            screenshot_paths = [_convert_to_relative_path(s) for s in screenshots_list]
+
+        # Stream the rendered markdown to file
+        template = compile_template(TRADE_MARKDOWN_TEMPLATE, "trade.md")
+        template.render_to_file(
+            filepath,
+            trade=trade,
+            tag_fields=TAG_FIELDS,
+            screenshots_list=screenshots_list,
+            screenshot_paths=screenshot_paths,
+        )
 
         print(f"Created trade file: {filepath}")
         return filepath
@@ -9,6 +9,11 @@ Performance Optimizations:
 - Efficient cumulative P&L tracking for drawdown calculation
 - Reduced memory allocation with in-place updates
 - Optimized type conversions and validations
+- Holding time and time-of-day buckets computed once here from integer
+  timestamps, so downstream scripts never re-parse time strings
+- R-multiple columns (initial risk and realized R) computed in one bulk pass
+- Epoch timestamps, ISO week keys, month keys and weekday codes for entry
+  and exit emitted once here, so consumers never parse date strings
 """
 
 import os
@@ -16,8 +21,47 @@ import json
 import yaml
 import glob
 import re
+import calendar
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+
+# Entry time-of-day buckets: (start minute, end minute, label), US/Eastern clock
+TIME_OF_DAY_BUCKETS = [
+    (0, 570, "Premarket"),  # before 09:30
+    (570, 630, "Open"),  # 09:30 - 10:30
+    (630, 900, "Midday"),  # 10:30 - 15:00
+    (900, 960, "Power Hour"),  # 15:00 - 16:00
+    (960, 1440, "After-Hours"),  # 16:00 onwards
+]
+
+# Unquoted clock times that YAML 1.1 would read as base-60 integers
+CLOCK_TIME_PATTERN = re.compile(r"^\d{1,2}:\d{2}(?::\d{2})?$")
+
+
+class FrontmatterLoader(yaml.SafeLoader):
+    """SafeLoader that keeps unquoted clock times (HH:MM, HH:MM:SS) as strings"""
+
+
+# Copy the resolver table so yaml.SafeLoader itself is left untouched, then
+# let the clock-time pattern win over the sexagesimal int resolver
+FrontmatterLoader.yaml_implicit_resolvers = {
+    first: list(resolvers)
+    for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+for _digit in "0123456789":
+    FrontmatterLoader.yaml_implicit_resolvers.setdefault(_digit, []).insert(
+        0, ("tag:yaml.org,2002:str", CLOCK_TIME_PATTERN)
+    )
+
+# Holding-time bands: (upper bound in minutes, label); None = no upper bound
+HOLDING_BANDS = [
+    (5, "< 5 min"),
+    (15, "5-15 min"),
+    (60, "15-60 min"),
+    (240, "1-4 hours"),
+    (1440, "4+ hours"),
+    (None, "Multi-day"),
+]
 
 
 def parse_frontmatter(content):
@@ -39,8 +83,8 @@ def parse_frontmatter(content):
         if len(parts) < 3:
             return {}, content
 
-        # Parse YAML frontmatter
-        frontmatter = yaml.safe_load(parts[1])
+        # Parse YAML frontmatter (clock times stay strings)
+        frontmatter = yaml.load(parts[1], Loader=FrontmatterLoader)
         body = parts[2].strip()
 
         return frontmatter, body
@@ -49,6 +93,180 @@ def parse_frontmatter(content):
         return {}, content
 
 
+def parse_time_of_day(value):
+    """
+    Convert a frontmatter time value to minutes after midnight
+
+    parse_frontmatter() keeps unquoted times as "HH:MM" / "HH:MM:SS" strings,
+    which are parsed explicitly. Integers only arrive from frontmatter loaded
+    with a plain YAML 1.1 loader, which reads 17:24 as base-60 minutes
+    (1044) and 05:24:07 as seconds (19447); that encoding is ambiguous, so
+    integers below 1440 are treated as minutes and larger ones as seconds
+    (an HH:MM:SS time before 00:24:00 is misread).
+
+    Args:
+        value: Raw frontmatter value (str, int or None)
+
+    Returns:
+        tuple: (minutes_after_midnight, seconds) or (None, None) if unparseable
+    """
+    if value is None or value == "":
+        return None, None
+
+    if isinstance(value, int):
+        if 0 <= value < 1440:
+            return value, 0
+        if 0 <= value < 86400:
+            return value // 60, value % 60
+        return None, None
+
+    match = re.match(r"^\s*(\d{1,2}):(\d{2})(?::(\d{2}))?", str(value))
+    if not match:
+        return None, None
+
+    hours, minutes = int(match.group(1)), int(match.group(2))
+    seconds = int(match.group(3) or 0)
+    if hours > 23 or minutes > 59 or seconds > 59:
+        return None, None
+    return hours * 60 + minutes, seconds
+
+
+def _parse_date(value):
+    """Convert a frontmatter date value (date, datetime or str) to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).split("T")[0])
+    except (ValueError, TypeError):
+        return None
+
+
+def _epoch_seconds(day, minute_of_day=0, seconds=0):
+    """Naive journal clock time as integer epoch seconds (no timezone shift)"""
+    return calendar.timegm(day.timetuple()) + minute_of_day * 60 + seconds
+
+
+def date_keys(day):
+    """
+    Calendar bucket keys for a date
+
+    Args:
+        day (date): Trade date
+
+    Returns:
+        tuple: (ISO week key 'YYYY-Www' using the ISO year, month key
+               'YYYY-MM', weekday code 0=Monday .. 6=Sunday)
+    """
+    iso_year, iso_week, iso_weekday = day.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}", f"{day.year}-{day.month:02d}", iso_weekday - 1
+
+
+def format_time_in_trade(holding_minutes):
+    """Human-readable holding time (e.g. '45 minutes', '2.5 hours', '3.0 days')"""
+    if holding_minutes is None:
+        return ""
+    if holding_minutes < 60:
+        return f"{holding_minutes} minutes"
+    if holding_minutes < 1440:
+        return f"{holding_minutes / 60:.1f} hours"
+    return f"{holding_minutes / 1440:.1f} days"
+
+
+def time_of_day_bucket(minute_of_day):
+    """Map an entry minute-of-day to its session bucket label"""
+    if minute_of_day is None:
+        return None
+    for start, end, label in TIME_OF_DAY_BUCKETS:
+        if start <= minute_of_day < end:
+            return label
+    return None
+
+
+def holding_band(holding_minutes, multi_day=False):
+    """Map a holding time in minutes to its band label"""
+    if holding_minutes is None:
+        return None
+    if multi_day:
+        return HOLDING_BANDS[-1][1]
+    for upper, label in HOLDING_BANDS:
+        if upper is None or holding_minutes < upper:
+            return label
+    return HOLDING_BANDS[-1][1]
+
+
+def derive_time_fields(frontmatter):
+    """
+    Compute timestamp, holding-time and time-of-day fields for a trade
+
+    Called once at parse time on the raw frontmatter values; everything
+    downstream reads the resulting integer fields and calendar keys instead
+    of parsing date/time strings again.
+
+    Args:
+        frontmatter (dict): Raw YAML frontmatter
+
+    Returns:
+        dict: entry/exit times normalized to HH:MM[:SS] plus entry_/exit_
+              timestamp, week, month and weekday, entry_minute_of_day,
+              holding_minutes, time_in_trade, time_of_day and holding_band
+              (None when unknown). The exit fields fall back to the entry
+              date when there is no exit date.
+    """
+    entry_day = _parse_date(frontmatter.get("entry_date"))
+    exit_day = _parse_date(frontmatter.get("exit_date")) or entry_day
+    entry_minute, entry_seconds = parse_time_of_day(frontmatter.get("entry_time"))
+    exit_minute, exit_seconds = parse_time_of_day(frontmatter.get("exit_time"))
+
+    fields = {
+        "entry_timestamp": None,
+        "exit_timestamp": None,
+        "entry_week": None,
+        "exit_week": None,
+        "entry_month": None,
+        "exit_month": None,
+        "entry_weekday": None,
+        "exit_weekday": None,
+        "entry_minute_of_day": entry_minute,
+        "holding_minutes": None,
+        "time_in_trade": "",
+        "time_of_day": time_of_day_bucket(entry_minute),
+        "holding_band": None,
+    }
+
+    for prefix, minute, seconds in (
+        ("entry", entry_minute, entry_seconds),
+        ("exit", exit_minute, exit_seconds),
+    ):
+        if minute is not None:
+            clock = f"{minute // 60:02d}:{minute % 60:02d}"
+            fields[f"{prefix}_time"] = f"{clock}:{seconds:02d}" if seconds else clock
+
+    for prefix, day, minute, seconds in (
+        ("entry", entry_day, entry_minute, entry_seconds),
+        ("exit", exit_day, exit_minute, exit_seconds),
+    ):
+        if day:
+            fields[f"{prefix}_timestamp"] = _epoch_seconds(
+                day, minute or 0, seconds or 0
+            )
+            (
+                fields[f"{prefix}_week"],
+                fields[f"{prefix}_month"],
+                fields[f"{prefix}_weekday"],
+            ) = date_keys(day)
+
+    if entry_day and exit_day and entry_minute is not None and exit_minute is not None:
+        holding = (fields["exit_timestamp"] - fields["entry_timestamp"]) // 60
+        if holding >= 0:
+            fields["holding_minutes"] = holding
+            fields["time_in_trade"] = format_time_in_trade(holding)
+            fields["holding_band"] = holding_band(holding, exit_day > entry_day)
+
+    return fields
+
+
 def parse_trade_file(filepath):
     """
     Parse a single trade markdown file
@@ -123,6 +341,12 @@ def parse_trade_file(filepath):
         if "trade_number" in trade_data:
             trade_data["trade_number"] = int(trade_data["trade_number"])
 
+        # Derive timestamps, holding time and time-of-day from the raw values
+        time_fields = derive_time_fields(frontmatter)
+        if not time_fields["time_in_trade"] and frontmatter.get("time_in_trade"):
+            time_fields["time_in_trade"] = str(frontmatter["time_in_trade"])
+        trade_data.update(time_fields)
+
         # Convert date/time fields to strings for JSON serialization
         date_fields = ["entry_date", "exit_date", "entry_time", "exit_time"]
         for field in date_fields:
@@ -136,6 +360,61 @@ def parse_trade_file(filepath):
         return None
 
 
+def compute_r_multiples(trades):
+    """
+    Add initial risk and realized R-multiple columns to every trade
+
+    Initial risk is the distance from entry to stop_loss times position size
+    (entry - stop for LONG, stop - entry for SHORT). Trades without a usable
+    stop are kept but marked explicitly via risk_status:
+    'ok', 'missing_stop', 'invalid_stop' (stop on the wrong side of entry),
+    'missing_size' or 'missing_entry' (no usable entry price).
+
+    Args:
+        trades (list): List of trade dictionaries (updated in place)
+
+    Returns:
+        dict: Count of trades per risk_status
+    """
+    status_counts = {
+        "ok": 0,
+        "missing_stop": 0,
+        "invalid_stop": 0,
+        "missing_size": 0,
+        "missing_entry": 0,
+    }
+
+    for trade in trades:
+        entry = trade.get("entry_price")
+        stop = trade.get("stop_loss")
+        size = trade.get("position_size")
+        initial_risk = None
+        r_multiple = None
+
+        if not stop or not isinstance(stop, (int, float)):
+            status = "missing_stop"
+        elif not size or not isinstance(size, (int, float)):
+            status = "missing_size"
+        elif not entry or not isinstance(entry, (int, float)):
+            status = "missing_entry"
+        else:
+            direction = str(trade.get("direction", "LONG")).upper()
+            per_share = stop - entry if direction == "SHORT" else entry - stop
+            if per_share <= 0:
+                status = "invalid_stop"
+            else:
+                status = "ok"
+                initial_risk = round(per_share * abs(size), 4)
+                r_multiple = round(trade.get("pnl_usd", 0) / initial_risk, 2)
+
+        trade["initial_risk_usd"] = initial_risk
+        trade["r_multiple"] = r_multiple
+        trade["risk_status"] = status
+        status_counts[status] += 1
+
+    return status_counts
+
+
 def calculate_statistics(trades):
     """
     Calculate aggregate statistics from all trades
@@ -293,6 +572,17 @@ def main():
         # Sort trades by trade number
         trades.sort(key=lambda x: x.get("trade_number", 0))
 
+        # Add R-multiple columns in one pass over all trades
+        risk_counts = compute_r_multiples(trades)
+        if risk_counts["ok"] < len(trades):
+            print(
+                f"R-multiples: {risk_counts['ok']} trade(s) with a valid stop, "
+                f"{risk_counts['missing_stop']} missing stop, "
+                f"{risk_counts['invalid_stop']} invalid stop, "
+                f"{risk_counts['missing_size']} missing size, "
+                f"{risk_counts['missing_entry']} missing entry"
+            )
+
         # Calculate statistics
         stats = calculate_statistics(trades)
 
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Quantile Sketch Module
+Mergeable t-digest for streaming P&L distributions
+
+Values are buffered and periodically compressed into weighted centroids
+using the arcsine scale function, which keeps the tails (the trades that
+matter most for risk) at high resolution. Digests can be merged, queried
+for percentiles, tail means and histograms, and round-tripped through a
+plain dict so they can be persisted in analytics-state.json.
+
+Queries never mutate the digest: compression for a query happens on a copy,
+so the stored state depends only on the sequence of values added. That keeps
+incremental and full rebuilds of the analytics identical.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_COMPRESSION = 100
+
+
+class TDigest:
+    """Merging t-digest over a stream of floats"""
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.centroids = []  # [[mean, weight], ...] sorted by mean
+        self.buffer = []  # Raw values not yet compressed
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @property
+    def buffer_limit(self) -> int:
+        return 5 * self.compression
+
+    def add(self, value: float) -> None:
+        """Add a single value"""
+        self.buffer.append(value)
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if len(self.buffer) >= self.buffer_limit:
+            self.centroids = self._compressed()
+            self.buffer = []
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """Fold another digest into this one and return self"""
+        if other.count == 0:
+            return self
+        self.centroids = sorted(
+            self.centroids + [list(c) for c in other.centroids], key=lambda c: c[0]
+        )
+        self.buffer.extend(other.buffer)
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        if len(self.buffer) >= self.buffer_limit or (
+            len(self.centroids) > 2 * self.compression
+        ):
+            self.centroids = self._compressed()
+            self.buffer = []
+        return self
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inverse(self, k: float) -> float:
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compressed(self) -> List[List[float]]:
+        """Centroids + buffer merged under the scale-function size limit"""
+        items = sorted(
+            self.centroids + [[value, 1] for value in self.buffer], key=lambda c: c[0]
+        )
+        if not items:
+            return []
+
+        total_weight = sum(weight for _, weight in items)
+        merged = []
+        cur_mean, cur_weight = items[0]
+        weight_so_far = 0.0
+        q_limit = self._k_inverse(self._k(0.0) + 1)
+
+        for mean, weight in items[1:]:
+            q = (weight_so_far + cur_weight + weight) / total_weight
+            if q <= q_limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                merged.append([cur_mean, cur_weight])
+                weight_so_far += cur_weight
+                q_limit = self._k_inverse(self._k(weight_so_far / total_weight) + 1)
+                cur_mean, cur_weight = mean, weight
+
+        merged.append([cur_mean, cur_weight])
+        return merged
+
+    def _quantile(self, centroids: List[List[float]], q: float) -> float:
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        target = q * self.count
+        cumulative = 0.0
+        prev_center, prev_mean = 0.0, self.min
+
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                span = center - prev_center
+                fraction = (target - prev_center) / span if span > 0 else 0
+                return prev_mean + (mean - prev_mean) * fraction
+            prev_center, prev_mean = center, mean
+            cumulative += weight
+
+        span = self.count - prev_center
+        fraction = (target - prev_center) / span if span > 0 else 0
+        return prev_mean + (self.max - prev_mean) * fraction
+
+    def _cdf(self, centroids: List[List[float]], value: float) -> float:
+        if value <= self.min:
+            return 0.0
+        if value >= self.max:
+            return 1.0
+
+        cumulative = 0.0
+        prev_center, prev_mean = 0.0, self.min
+
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if value < mean:
+                span = mean - prev_mean
+                fraction = (value - prev_mean) / span if span > 0 else 0
+                return (prev_center + (center - prev_center) * fraction) / self.count
+            prev_center, prev_mean = center, mean
+            cumulative += weight
+
+        span = self.max - prev_mean
+        fraction = (value - prev_mean) / span if span > 0 else 0
+        return (prev_center + (self.count - prev_center) * fraction) / self.count
+
+    def _tail_mean(
+        self, centroids: List[List[float]], fraction: float, upper: bool = False
+    ) -> float:
+        """Mean of the lowest (or highest) `fraction` of the distribution"""
+        budget = max(fraction * self.count, 1)
+        taken = 0.0
+        total = 0.0
+        ordered = reversed(centroids) if upper else centroids
+
+        for mean, weight in ordered:
+            use = min(weight, budget - taken)
+            total += mean * use
+            taken += use
+            if taken >= budget:
+                break
+
+        return total / taken if taken else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0-1)"""
+        if self.count == 0:
+            return None
+        return self._quantile(self._compressed(), q)
+
+    def summary(self, percentiles: Iterable[int], bins: int, tail: float) -> Dict:
+        """
+        Compact distribution summary for charts
+
+        Args:
+            percentiles: Percentiles to report (e.g. [5, 25, 50, 75, 95])
+            bins: Maximum number of equal-width histogram bins
+            tail: Tail fraction for the tail means (e.g. 0.05)
+
+        Returns:
+            Dict: count, min/max/mean, percentiles, tails and histogram
+        """
+        if self.count == 0:
+            return {"count": 0}
+
+        centroids = self._compressed()
+        result = {
+            "count": self.count,
+            "min": round(self.min, 2),
+            "max": round(self.max, 2),
+            "mean": round(self.total / self.count, 2),
+            "percentiles": {
+                f"p{p}": round(self._quantile(centroids, p / 100), 2)
+                for p in percentiles
+            },
+            "tails": {
+                "lower_mean": round(self._tail_mean(centroids, tail), 2),
+                "upper_mean": round(self._tail_mean(centroids, tail, upper=True), 2),
+                "fraction": tail,
+            },
+        }
+
+        bin_count = max(1, min(bins, self.count))
+        width = (self.max - self.min) / bin_count
+        if width <= 0:
+            result["histogram"] = {
+                "edges": [round(self.min, 2), round(self.max, 2)],
+                "counts": [self.count],
+            }
+            return result
+
+        edges = [self.min + width * i for i in range(bin_count)] + [self.max]
+        cumulative = [round(self._cdf(centroids, e) * self.count) for e in edges]
+        cumulative[0], cumulative[-1] = 0, self.count
+        result["histogram"] = {
+            "edges": [round(e, 2) for e in edges],
+            "counts": [cumulative[i + 1] - cumulative[i] for i in range(bin_count)],
+        }
+        return result
+
+    def to_dict(self) -> Dict:
+        return {
+            "compression": self.compression,
+            "centroids": self.centroids,
+            "buffer": self.buffer,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TDigest":
+        digest = cls(data.get("compression", DEFAULT_COMPRESSION))
+        digest.centroids = data.get("centroids", [])
+        digest.buffer = data.get("buffer", [])
+        digest.count = data.get("count", 0)
+        digest.total = data.get("total", 0.0)
+        digest.min = data.get("min")
+        digest.max = data.get("max")
+        return digest
+
+
+def merge_digests(digests: Iterable[TDigest]) -> TDigest:
+    """Merge any number of digests into a new one"""
+    merged = TDigest()
+    for digest in digests:
+        merged.merge(digest)
+    return merged
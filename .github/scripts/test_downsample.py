@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test Downsample Module
+Unit tests for the LTTB downsampling in downsample.py
+
+Usage:
+    python .github/scripts/test_downsample.py
+"""
+
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from downsample import MIN_POINT_BUDGET, downsample_series, lttb_indices
+
+
+def make_curve(count):
+    """Equity-like curve with one sharp trough in the middle"""
+    values = [math.sin(i / 40) * 100 + i * 0.5 for i in range(count)]
+    values[count // 2] = -5000.0
+    return values
+
+
+class LttbTest(unittest.TestCase):
+    """lttb_indices() and downsample_series()"""
+
+    def test_keeps_endpoints_and_budget(self):
+        values = make_curve(10000)
+        for budget in [MIN_POINT_BUDGET, 10, 500, 9999]:
+            with self.subTest(budget=budget):
+                indices = lttb_indices(values, budget)
+                self.assertEqual(len(indices), budget)
+                self.assertEqual(indices[0], 0)
+                self.assertEqual(indices[-1], len(values) - 1)
+                self.assertEqual(indices, sorted(set(indices)))
+
+    def test_keeps_extreme_points(self):
+        values = make_curve(10000)
+        self.assertIn(len(values) // 2, lttb_indices(values, 100))
+
+    def test_short_series_is_returned_whole(self):
+        for values in [[], [1.0], [1.0, 2.0], [1.0, 2.0, 3.0]]:
+            self.assertEqual(lttb_indices(values, 3), list(range(len(values))))
+
+    def test_rejects_budget_below_minimum(self):
+        for budget in [0, 1, MIN_POINT_BUDGET - 1]:
+            with self.assertRaises(ValueError):
+                lttb_indices([1.0, 2.0, 3.0, 4.0], budget)
+
+    def test_series_labels_follow_values(self):
+        values = make_curve(1000)
+        labels = [f"#{i}" for i in range(len(values))]
+        lite = downsample_series(labels, values, 50)
+        self.assertEqual(len(lite["labels"]), 50)
+        for label, value in zip(lite["labels"], lite["values"]):
+            self.assertEqual(values[int(label[1:])], value)
+
+
+if __name__ == "__main__":
+    unittest.main()
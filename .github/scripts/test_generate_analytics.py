@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test Generate Analytics Script
+Unit tests for the persisted analytics state in generate_analytics.py
+
+Usage:
+    python .github/scripts/test_generate_analytics.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generate_analytics
+from generate_analytics import AnalyticsState, load_state, save_state
+
+STRATEGIES = ["Breakout", "Pullback", "Reversal"]
+
+
+def make_trades(count):
+    """Build `count` trades closing on consecutive days, in date order"""
+    trades = []
+    start = date(2024, 1, 1)
+    for i in range(count):
+        day = start + timedelta(days=i)
+        year, week, _ = day.isocalendar()
+        pnl = round(((i * 37) % 23 - 11) * 12.5, 2)
+        trades.append(
+            {
+                "trade_number": i + 1,
+                "ticker": ["AAPL", "TSLA", "NVDA", "AMD"][i % 4],
+                "strategy": STRATEGIES[i % 3],
+                "setup": ["Flag", "Gap"][i % 2],
+                "session": "Regular",
+                "time_of_day": ["Open", "Midday", "Close"][i % 3],
+                "holding_band": "Intraday",
+                "exit_date": day.isoformat(),
+                "exit_month": day.strftime("%Y-%m"),
+                "exit_week": f"{year}-W{week:02d}",
+                "exit_timestamp": (day - date(1970, 1, 1)).days * 86400,
+                "holding_minutes": 30 + i % 90,
+                "pnl_usd": pnl,
+                "r_multiple": pnl / 50.0,
+                "risk_status": "ok",
+            }
+        )
+    return trades
+
+
+def build(state, trades):
+    """analytics-data.json content without its timestamp"""
+    analytics = state.build_analytics(trades)
+    del analytics["generated_at"]
+    return analytics
+
+
+class AnalyticsStateTest(unittest.TestCase):
+    """Incremental runs from analytics-state.json"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        state_file = os.path.join(self.tmp.name, "analytics-state.json")
+        patcher = mock.patch.object(generate_analytics, "STATE_FILE", state_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.trades = make_trades(60)
+
+    def save_prefix(self, count):
+        state = AnalyticsState()
+        for trade in self.trades[:count]:
+            state.update(trade)
+        save_state(state)
+
+    def load(self, trades):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return load_state(trades)
+
+    def test_incremental_run_matches_full_rebuild(self):
+        self.save_prefix(40)
+        state = self.load(self.trades)
+        self.assertIsNotNone(state)
+        self.assertEqual(state.count, 40)
+        for trade in self.trades[state.count :]:
+            state.update(trade)
+
+        full = AnalyticsState()
+        for trade in self.trades:
+            full.update(trade)
+        self.assertEqual(build(state, self.trades), build(full, self.trades))
+        self.assertEqual(state.to_dict(), full.to_dict())
+
+    def test_unchanged_trades_reuse_state(self):
+        self.save_prefix(60)
+        state = self.load(self.trades)
+        self.assertIsNotNone(state)
+        self.assertEqual(state.count, 60)
+
+    def test_edit_to_early_trade_forces_rebuild(self):
+        self.save_prefix(40)
+        for field, value in [
+            ("strategy", "Retagged"),
+            ("time_of_day", "Premarket"),
+            ("pnl_usd", 1.0),
+        ]:
+            with self.subTest(field=field):
+                trades = [dict(trade) for trade in self.trades]
+                trades[1][field] = value
+                self.assertIsNone(self.load(trades))
+
+    def test_removed_or_inserted_trade_forces_rebuild(self):
+        self.save_prefix(40)
+        self.assertIsNone(self.load(self.trades[1:]))
+        inserted = dict(self.trades[5], trade_number=999)
+        trades = self.trades[:5] + [inserted] + self.trades[5:]
+        self.assertIsNone(self.load(trades))
+
+    def test_version_change_forces_rebuild(self):
+        self.save_prefix(40)
+        with mock.patch.object(
+            generate_analytics, "STATE_VERSION", generate_analytics.STATE_VERSION + 1
+        ):
+            self.assertIsNone(self.load(self.trades))
+
+
+if __name__ == "__main__":
+    unittest.main()
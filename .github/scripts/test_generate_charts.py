@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test Generate Charts Script
+Unit tests for the chart data built by generate_charts.py
+
+Usage:
+    python .github/scripts/test_generate_charts.py
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_charts import calculate_pnl_histogram, generate_trade_distribution_data
+
+
+def make_trades(count, scale, seed=1):
+    rng = random.Random(seed)
+    return [{"pnl_usd": round(rng.gauss(0, scale), 4)} for _ in range(count)]
+
+
+class PnlHistogramTest(unittest.TestCase):
+    """Histogram mode of the trade P&L distribution"""
+
+    def test_every_trade_lands_in_one_bin(self):
+        pnls = [t["pnl_usd"] for t in make_trades(500, 250)]
+        histogram = calculate_pnl_histogram(pnls)
+        self.assertEqual(sum(histogram["counts"]), len(pnls))
+        self.assertEqual(len(histogram["edges"]), len(histogram["counts"]) + 1)
+        self.assertIn(0, histogram["edges"])
+        self.assertEqual(sum(histogram["wins"]), sum(1 for pnl in pnls if pnl > 0))
+
+    def test_labels_stay_distinct_for_narrow_bins(self):
+        for scale in [0.002, 0.03, 0.8, 300]:
+            with self.subTest(scale=scale):
+                data = generate_trade_distribution_data(make_trades(500, scale))
+                self.assertEqual(data["mode"], "histogram")
+                self.assertEqual(len(set(data["labels"])), len(data["labels"]))
+
+    def test_cent_labels_below_a_dollar(self):
+        data = generate_trade_distribution_data(make_trades(500, 0.8))
+        self.assertRegex(data["labels"][0], r"^\$-?\d+\.\d{2} to \$-?\d+\.\d{2}$")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Test Generate Summaries Script
+Unit tests for the period roll-up and the summaries manifest in
+generate_summaries.py
+
+Usage:
+    python .github/scripts/test_generate_summaries.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+from collections import defaultdict
+from datetime import date, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generate_summaries
+from generate_summaries import PeriodRollup, calculate_period_stats
+
+SUMMARIES_DIR = os.path.join("index.directory", "summaries")
+PLACEHOLDER = "_To be filled in manually during review_"
+
+
+def make_trades(count, seed=7):
+    """Trades in trade-number order with entry dates out of that order"""
+    rng = random.Random(seed)
+    trades = []
+    for number in range(1, count + 1):
+        day = date(2024, 1, 1) + timedelta(days=rng.randrange(400))
+        year, week, _ = day.isocalendar()
+        trades.append(
+            {
+                "trade_number": number,
+                "ticker": rng.choice(["AAPL", "TSLA", "NVDA"]),
+                "strategy": rng.choice(["Breakout", "Pullback", "Reversal", "Gap"]),
+                "entry_date": day.isoformat(),
+                "entry_week": f"{year}-W{week:02d}",
+                "entry_month": day.strftime("%Y-%m"),
+                # Repeated values exercise best/worst tie-breaking
+                "pnl_usd": rng.choice([-50.0, 50.0, round(rng.uniform(-300, 300), 2)]),
+                "position_size": rng.randrange(10, 500),
+            }
+        )
+    return trades
+
+
+def direct_stats(trades, key):
+    """Period stats computed straight from each period's trades"""
+    groups = defaultdict(list)
+    for trade in trades:
+        groups[key(trade)].append(trade)
+    return {period: calculate_period_stats(group) for period, group in groups.items()}
+
+
+class PeriodRollupTest(unittest.TestCase):
+    """Merged roll-up statistics match a direct calculation per period"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.trades = make_trades(400)
+        cls.rollup = PeriodRollup.from_trades(cls.trades)
+
+    def assertStatsEqual(self, rolled, direct):
+        self.assertEqual(set(rolled), set(direct))
+        for period, acc in rolled.items():
+            with self.subTest(period=period):
+                stats = acc.to_period_stats()
+                expected = direct[period]
+                # Totals are summed in a different order, so allow for rounding
+                for field in ["total_pnl", "avg_pnl"]:
+                    self.assertAlmostEqual(stats.pop(field), expected.pop(field), 1)
+                for data in list(stats["strategies"].values()) + list(
+                    expected["strategies"].values()
+                ):
+                    data["pnl"] = round(data["pnl"], 6)
+                self.assertEqual(
+                    list(stats["strategies"]), list(expected["strategies"])
+                )
+                self.assertEqual(stats, expected)
+
+    def test_weeks(self):
+        self.assertStatsEqual(
+            self.rollup.weeks(), direct_stats(self.trades, lambda t: t["entry_week"])
+        )
+
+    def test_months(self):
+        self.assertStatsEqual(
+            self.rollup.months(), direct_stats(self.trades, lambda t: t["entry_month"])
+        )
+
+    def test_years(self):
+        self.assertStatsEqual(
+            self.rollup.years(),
+            direct_stats(self.trades, lambda t: t["entry_month"][:4]),
+        )
+
+    def test_quarters(self):
+        def quarter(trade):
+            month = trade["entry_month"]
+            return f"{month[:4]}-Q{(int(month[5:7]) - 1) // 3 + 1}"
+
+        self.assertStatsEqual(
+            self.rollup.quarters(), direct_stats(self.trades, quarter)
+        )
+
+    def test_date_range(self):
+        start, end = "2024-03-10", "2024-06-20"
+        inside = [t for t in self.trades if start <= t["entry_date"] <= end]
+        self.assertStatsEqual(
+            {"range": self.rollup.date_range(start, end)},
+            {"range": calculate_period_stats(inside)},
+        )
+
+    def test_empty_date_range(self):
+        self.assertEqual(
+            self.rollup.date_range("2019-01-01", "2019-12-31").to_period_stats(), {}
+        )
+
+
+class SummaryManifestTest(unittest.TestCase):
+    """Only summaries whose stats or review inputs changed are rewritten"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        os.makedirs("index.directory")
+        self.trades = make_trades(120)
+        self.write_index()
+        self.run_main()
+
+    def write_index(self):
+        with open("index.directory/trades-index.json", "w", encoding="utf-8") as f:
+            json.dump({"trades": self.trades}, f)
+
+    def run_main(self):
+        with mock.patch.object(sys, "argv", ["generate_summaries.py"]):
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_summaries.main()
+
+    def snapshot(self):
+        """{file name: (mtime_ns, bytes)} of the summaries directory"""
+        files = {}
+        for name in os.listdir(SUMMARIES_DIR):
+            path = os.path.join(SUMMARIES_DIR, name)
+            with open(path, "rb") as f:
+                files[name] = (os.stat(path).st_mtime_ns, f.read())
+        return files
+
+    def rewritten(self, before):
+        after = self.snapshot()
+        return sorted(name for name in after if after[name] != before.get(name))
+
+    def test_unchanged_run_writes_nothing(self):
+        before = self.snapshot()
+        self.assertIn("summaries-manifest.json", before)
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_new_mtimes_alone_write_nothing(self):
+        # A fresh checkout gives every file a new mtime
+        for name in os.listdir(SUMMARIES_DIR):
+            path = os.path.join(SUMMARIES_DIR, name)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**10))
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_review_edit_rerenders_only_its_rollups(self):
+        trade = self.trades[0]
+        week, month = trade["entry_week"], trade["entry_month"]
+        weekly = os.path.join(SUMMARIES_DIR, f"weekly-{week}.md")
+        with open(weekly, "r", encoding="utf-8") as f:
+            content = f.read()
+        with open(weekly, "w", encoding="utf-8") as f:
+            f.write(content.replace(PLACEHOLDER, "Waited for the retest.", 1))
+
+        before = self.snapshot()
+        self.run_main()
+        # The edited week is re-rendered around its preserved review
+        expected = [
+            f"weekly-{week}.md",
+            f"monthly-{month}.md",
+            "summaries-manifest.json",
+            f"yearly-{month[:4]}.md",
+        ]
+        # A week straddling two months feeds both
+        expected += [
+            f"monthly-{t['entry_month']}.md"
+            for t in self.trades
+            if t["entry_week"] == week and t["entry_month"] != month
+        ][:1]
+        self.assertEqual(self.rewritten(before), sorted(set(expected)))
+        with open(os.path.join(SUMMARIES_DIR, f"monthly-{month}.md")) as f:
+            self.assertIn("Waited for the retest.", f.read())
+
+        # The merged insight does not make the next run render again
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_changed_trade_rerenders_its_periods(self):
+        trade = self.trades[0]
+        trade["pnl_usd"] += 1000
+        self.write_index()
+        before = self.snapshot()
+        self.run_main()
+        rewritten = self.rewritten(before)
+        for name in [
+            f"weekly-{trade['entry_week']}.md",
+            f"monthly-{trade['entry_month']}.md",
+            f"yearly-{trade['entry_month'][:4]}.md",
+        ]:
+            self.assertIn(name, rewritten)
+        self.assertLess(len(rewritten), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test Generate Trade Pages Script
+Unit tests for incremental trade page rendering in generate_trade_pages.py
+
+Usage:
+    python .github/scripts/test_generate_trade_pages.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generate_trade_pages
+
+PAGES_DIR = Path("index.directory/trades")
+
+
+def make_trades(count):
+    """Trades numbered 1..count, each with its own source file"""
+    return [
+        {
+            "trade_number": number,
+            "ticker": ["AAPL", "TSLA", "NVDA"][number % 3],
+            "entry_date": f"2024-02-{number:02d}",
+            "exit_date": f"2024-02-{number:02d}",
+            "entry_price": 10.0 + number,
+            "exit_price": 10.5 + number,
+            "position_size": 100,
+            "direction": "LONG",
+            "pnl_usd": 50.0,
+            "file_path": f"index.directory/SFTi.Tradez/week.2024.06/t{number}.md",
+        }
+        for number in range(1, count + 1)
+    ]
+
+
+class TradePagesManifestTest(unittest.TestCase):
+    """Only new or changed pages are written; stale pages are pruned"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        os.makedirs("index.directory")
+        self.trades = make_trades(5)
+        self.write_index()
+        self.run_main()
+
+    def write_index(self):
+        with open("index.directory/trades-index.json", "w", encoding="utf-8") as f:
+            json.dump({"trades": self.trades}, f)
+
+    def run_main(self, *args):
+        argv = ["generate_trade_pages.py", "--workers", "1", *args]
+        with mock.patch.object(sys, "argv", argv):
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_trade_pages.main()
+
+    def snapshot(self):
+        """{file name: (mtime_ns, bytes)} of the trade pages directory"""
+        return {
+            path.name: (path.stat().st_mtime_ns, path.read_bytes())
+            for path in PAGES_DIR.iterdir()
+        }
+
+    def rewritten(self, before):
+        after = self.snapshot()
+        return sorted(name for name in after if after[name] != before.get(name))
+
+    def test_first_run_writes_every_page_and_the_manifest(self):
+        self.assertEqual(
+            sorted(self.snapshot()),
+            [
+                "trade-001-TSLA.html",
+                "trade-002-NVDA.html",
+                "trade-003-AAPL.html",
+                "trade-004-TSLA.html",
+                "trade-005-NVDA.html",
+                "trade-pages-manifest.json",
+            ],
+        )
+
+    def test_unchanged_run_writes_nothing(self):
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_new_mtimes_alone_write_nothing(self):
+        for path in PAGES_DIR.iterdir():
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**10))
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_changed_trade_rewrites_only_its_page(self):
+        self.trades[1]["exit_price"] = 99.0
+        self.write_index()
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(
+            self.rewritten(before),
+            ["trade-002-NVDA.html", "trade-pages-manifest.json"],
+        )
+
+    def test_missing_page_is_rendered_again(self):
+        (PAGES_DIR / "trade-003-AAPL.html").unlink()
+        self.run_main()
+        self.assertTrue((PAGES_DIR / "trade-003-AAPL.html").exists())
+
+    def test_deleted_and_renumbered_trades_are_pruned(self):
+        del self.trades[4]
+        self.trades[0]["trade_number"] = 42
+        self.write_index()
+        self.run_main()
+        pages = sorted(path.name for path in PAGES_DIR.glob("trade-*.html"))
+        self.assertEqual(
+            pages,
+            [
+                "trade-002-NVDA.html",
+                "trade-003-AAPL.html",
+                "trade-004-TSLA.html",
+                "trade-042-TSLA.html",
+            ],
+        )
+        with open(PAGES_DIR / "trade-pages-manifest.json", encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 4)
+
+    def test_force_rewrites_every_page(self):
+        # Age the pages so a rewrite shows up even on coarse-mtime filesystems
+        for path in PAGES_DIR.iterdir():
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+        before = self.snapshot()
+        self.run_main("--force")
+        self.assertEqual(len(self.rewritten(before)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
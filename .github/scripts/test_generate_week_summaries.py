@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test Generate Week Summaries Script
+Unit tests for the week fingerprints in master-manifest.json
+
+Usage:
+    python .github/scripts/test_generate_week_summaries.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generate_week_summaries
+
+TRADE_TEMPLATE = """---
+trade_number: {number}
+ticker: {ticker}
+entry_date: {day}
+pnl_usd: {pnl}
+---
+
+## Notes
+
+Trade {number} notes.
+"""
+
+
+class MasterManifestTest(unittest.TestCase):
+    """Only weeks whose inputs changed are re-rendered or re-recorded"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        patcher = mock.patch.object(
+            generate_week_summaries, "get_repo_root", return_value=self.root
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.trades_dir = self.root / "index.directory" / "SFTi.Tradez"
+        self.trades = []
+        for week in range(1, 4):
+            folder = self.trades_dir / f"week.2024.{week:02d}"
+            folder.mkdir(parents=True)
+            for i in range(2):
+                number = week * 10 + i
+                trade = {
+                    "trade_number": number,
+                    "ticker": "AAPL",
+                    "entry_date": f"2024-01-{week * 7 + i:02d}",
+                    "pnl_usd": 25.0 * (i * 2 - 1) * week,
+                    "file_path": f"index.directory/SFTi.Tradez/{folder.name}/t{number}.md",
+                }
+                (self.root / trade["file_path"]).write_text(
+                    TRADE_TEMPLATE.format(
+                        number=number,
+                        ticker=trade["ticker"],
+                        day=trade["entry_date"],
+                        pnl=trade["pnl_usd"],
+                    ),
+                    encoding="utf-8",
+                )
+                self.trades.append(trade)
+        self.write_index()
+        self.run_main()
+
+    def write_index(self):
+        index = self.root / "index.directory" / "trades-index.json"
+        index.write_text(json.dumps({"trades": self.trades}), encoding="utf-8")
+
+    def run_main(self, *args):
+        argv = ["generate_week_summaries.py", "--workers", "1", *args]
+        with mock.patch.object(sys, "argv", argv):
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(generate_week_summaries.main(), 0)
+
+    def snapshot(self):
+        """{path: (mtime_ns, bytes)} of every file under SFTi.Tradez"""
+        return {
+            path.relative_to(self.trades_dir).as_posix(): (
+                path.stat().st_mtime_ns,
+                path.read_bytes(),
+            )
+            for path in self.trades_dir.rglob("*")
+            if path.is_file()
+        }
+
+    def rewritten(self, before):
+        after = self.snapshot()
+        return sorted(name for name in after if after[name] != before.get(name))
+
+    def test_manifest_holds_only_fingerprints(self):
+        manifest = json.loads(
+            (self.trades_dir / "master-manifest.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(
+            sorted(manifest), ["week.2024.01", "week.2024.02", "week.2024.03"]
+        )
+        for fingerprint in manifest.values():
+            self.assertIsInstance(fingerprint, str)
+
+    def test_unchanged_run_writes_nothing(self):
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_new_mtimes_alone_write_nothing(self):
+        # A fresh checkout gives every file a new mtime
+        for path in self.trades_dir.rglob("*"):
+            if path.is_file():
+                stat = path.stat()
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**10))
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(self.rewritten(before), [])
+
+    def test_edited_trade_rerenders_only_its_week(self):
+        trade_file = self.root / self.trades[2]["file_path"]
+        trade_file.write_text(
+            trade_file.read_text(encoding="utf-8") + "\nMore notes.\n",
+            encoding="utf-8",
+        )
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(
+            self.rewritten(before),
+            ["master-manifest.json", "week.2024.02/master.trade.md"],
+        )
+
+    def test_changed_index_record_rerenders_its_week(self):
+        self.trades[4]["pnl_usd"] = 999.0
+        self.write_index()
+        before = self.snapshot()
+        self.run_main()
+        self.assertEqual(
+            self.rewritten(before),
+            ["master-manifest.json", "week.2024.03/master.trade.md"],
+        )
+        master = self.trades_dir / "week.2024.03" / "master.trade.md"
+        self.assertIn("$999.00", master.read_text(encoding="utf-8"))
+
+    def test_removed_week_is_dropped_from_manifest(self):
+        week = self.trades_dir / "week.2024.03"
+        for path in week.iterdir():
+            path.unlink()
+        week.rmdir()
+        self.trades = [t for t in self.trades if "week.2024.03" not in t["file_path"]]
+        self.write_index()
+        self.run_main()
+        manifest = json.loads(
+            (self.trades_dir / "master-manifest.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(sorted(manifest), ["week.2024.01", "week.2024.02"])
+
+
+if __name__ == "__main__":
+    unittest.main()
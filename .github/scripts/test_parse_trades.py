@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test Parse Trades Script
+Unit tests for the R-multiple columns computed by parse_trades.py
+
+Usage:
+    python .github/scripts/test_parse_trades.py
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from parse_trades import compute_r_multiples
+
+
+def make_trade(**fields):
+    """Build a LONG trade with a valid stop, overridden by fields"""
+    trade = {
+        "entry_price": 10.0,
+        "stop_loss": 9.5,
+        "position_size": 100.0,
+        "direction": "LONG",
+        "pnl_usd": 100.0,
+    }
+    trade.update(fields)
+    return trade
+
+
+class ComputeRMultiplesTest(unittest.TestCase):
+    """compute_r_multiples() risk_status and R values"""
+
+    def test_valid_long_stop(self):
+        trade = make_trade()
+        counts = compute_r_multiples([trade])
+        self.assertEqual(trade["risk_status"], "ok")
+        self.assertEqual(trade["initial_risk_usd"], 50.0)
+        self.assertEqual(trade["r_multiple"], 2.0)
+        self.assertEqual(counts["ok"], 1)
+
+    def test_valid_short_stop(self):
+        trade = make_trade(direction="SHORT", stop_loss=10.5, pnl_usd=-25.0)
+        compute_r_multiples([trade])
+        self.assertEqual(trade["risk_status"], "ok")
+        self.assertEqual(trade["r_multiple"], -0.5)
+
+    def test_stop_on_wrong_side_is_invalid_stop(self):
+        trade = make_trade(stop_loss=10.5)
+        compute_r_multiples([trade])
+        self.assertEqual(trade["risk_status"], "invalid_stop")
+        self.assertIsNone(trade["r_multiple"])
+
+    def test_missing_stop_and_size(self):
+        no_stop = make_trade(stop_loss=None)
+        no_size = make_trade(position_size=0)
+        compute_r_multiples([no_stop, no_size])
+        self.assertEqual(no_stop["risk_status"], "missing_stop")
+        self.assertEqual(no_size["risk_status"], "missing_size")
+
+    def test_missing_or_zero_entry_is_missing_entry(self):
+        zero_entry = make_trade(entry_price=0.0)
+        no_entry = make_trade(entry_price=None)
+        text_entry = make_trade(entry_price="n/a")
+        counts = compute_r_multiples([zero_entry, no_entry, text_entry])
+        for trade in (zero_entry, no_entry, text_entry):
+            self.assertEqual(trade["risk_status"], "missing_entry")
+            self.assertIsNone(trade["initial_risk_usd"])
+            self.assertIsNone(trade["r_multiple"])
+        self.assertEqual(counts["missing_entry"], 3)
+        self.assertEqual(counts["invalid_stop"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
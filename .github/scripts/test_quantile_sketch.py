@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test Quantile Sketch Module
+Unit tests for the mergeable t-digest in quantile_sketch.py
+
+Usage:
+    python .github/scripts/test_quantile_sketch.py
+"""
+
+import bisect
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from quantile_sketch import TDigest, merge_digests
+
+QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+
+def make_pnls(count, seed=5):
+    """Heavy-tailed P&L: mostly small trades plus a few large outliers"""
+    rng = random.Random(seed)
+    return [
+        rng.gauss(0, 2000) if rng.random() < 0.05 else rng.gauss(20, 150)
+        for _ in range(count)
+    ]
+
+
+class TDigestTest(unittest.TestCase):
+    """Quantile accuracy, merging and persistence"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.values = make_pnls(20000)
+        cls.ordered = sorted(cls.values)
+
+    def assertRankClose(self, digest, q, tolerance=0.01):
+        """The estimate's rank among the exact values is within tolerance of q"""
+        estimate = digest.quantile(q)
+        low = bisect.bisect_left(self.ordered, estimate) / len(self.ordered)
+        high = bisect.bisect_right(self.ordered, estimate) / len(self.ordered)
+        self.assertLessEqual(low - tolerance, q)
+        self.assertGreaterEqual(high + tolerance, q)
+
+    def test_quantile_accuracy(self):
+        digest = TDigest()
+        digest.extend(self.values)
+        for q in QUANTILES:
+            with self.subTest(q=q):
+                self.assertRankClose(digest, q)
+        self.assertEqual(digest.quantile(0), self.ordered[0])
+        self.assertEqual(digest.quantile(1), self.ordered[-1])
+        self.assertLess(len(digest.centroids), 2 * digest.compression)
+
+    def test_merged_parts_match_the_whole(self):
+        parts = []
+        for start in range(0, len(self.values), 1500):
+            part = TDigest()
+            part.extend(self.values[start : start + 1500])
+            parts.append(part)
+        merged = merge_digests(parts)
+
+        self.assertEqual(merged.count, len(self.values))
+        self.assertEqual(merged.min, self.ordered[0])
+        self.assertEqual(merged.max, self.ordered[-1])
+        self.assertAlmostEqual(merged.total, sum(self.values), places=6)
+        for q in QUANTILES:
+            with self.subTest(q=q):
+                self.assertRankClose(merged, q)
+
+    def test_merging_an_empty_digest_changes_nothing(self):
+        digest = TDigest()
+        digest.extend(self.values[:300])
+        before = digest.to_dict()
+        digest.merge(TDigest())
+        self.assertEqual(digest.to_dict(), before)
+
+    def test_queries_do_not_mutate(self):
+        digest = TDigest()
+        digest.extend(self.values[:700])
+        before = digest.to_dict()
+        digest.quantile(0.5)
+        digest.summary([5, 50, 95], bins=10, tail=0.05)
+        self.assertEqual(digest.to_dict(), before)
+
+    def test_dict_round_trip(self):
+        digest = TDigest()
+        digest.extend(self.values[:1234])
+        restored = TDigest.from_dict(digest.to_dict())
+        for q in QUANTILES:
+            self.assertEqual(restored.quantile(q), digest.quantile(q))
+
+    def test_summary_histogram_counts_every_value(self):
+        digest = TDigest()
+        digest.extend(self.values)
+        summary = digest.summary([5, 50, 95], bins=20, tail=0.05)
+        self.assertEqual(sum(summary["histogram"]["counts"]), len(self.values))
+        self.assertLess(summary["tails"]["lower_mean"], summary["percentiles"]["p5"])
+        self.assertGreater(
+            summary["tails"]["upper_mean"], summary["percentiles"]["p95"]
+        )
+
+    def test_empty_digest(self):
+        self.assertIsNone(TDigest().quantile(0.5))
+        self.assertEqual(TDigest().summary([50], bins=10, tail=0.05), {"count": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
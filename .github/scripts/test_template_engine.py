@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test Template Engine Module
+Unit tests for template compilation and rendering in template_engine.py
+
+Usage:
+    python .github/scripts/test_template_engine.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from template_engine import Template, TemplateSyntaxError, compile_template
+
+
+class RenderTest(unittest.TestCase):
+    """Expressions, blocks and whitespace handling"""
+
+    def test_expressions_and_format_specs(self):
+        template = Template("{{ ticker }}: ${{ pnl:.2f }} ({{ {'a': 1}['a'] }})")
+        self.assertEqual(template.render(ticker="AAPL", pnl=12.5), "AAPL: $12.50 (1)")
+
+    def test_standalone_block_tags_consume_their_line(self):
+        template = Template(
+            "Trades:\n"
+            "  {% for t in trades %}\n"
+            "- {{ t }}\n"
+            "  {% if t == 'B' %}\n"
+            "  (best)\n"
+            "  {% else %}\n"
+            "  {# nothing #}\n"
+            "  {% endif %}\n"
+            "  {% endfor %}\n"
+            "Done\n"
+        )
+        self.assertEqual(
+            template.render(trades=["A", "B"]), "Trades:\n- A\n- B\n  (best)\nDone\n"
+        )
+
+    def test_elif_chain(self):
+        template = Template(
+            "{% if n > 0 %}win{% elif n < 0 %}loss{% else %}flat{% endif %}"
+        )
+        self.assertEqual(
+            [template.render(n=n) for n in (5, -5, 0)], ["win", "loss", "flat"]
+        )
+
+    def test_render_to_file_streams_the_same_text(self):
+        template = Template("{% for i in range(3) %}{{ i }},{% endfor %}")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.txt")
+            template.render_to_file(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), template.render())
+
+    def test_compile_template_is_cached_by_source(self):
+        source = "{{ x }}"
+        self.assertIs(compile_template(source), compile_template(source))
+
+
+class SetScopingTest(unittest.TestCase):
+    """{% set %} and loop targets are locals of one render"""
+
+    def test_set_binds_for_the_rest_of_the_template(self):
+        template = Template(
+            "{% for t in trades %}{% set last = t %}{% endfor %}"
+            "{{ last }} after {{ t }}"
+        )
+        self.assertEqual(template.render(trades=[1, 2, 3]), "3 after 3")
+
+    def test_set_does_not_leak_into_the_context_or_later_renders(self):
+        template = Template("{% set total = sum(values) %}{{ total }}")
+        context = {"values": [1, 2]}
+        self.assertEqual(template.render(context), "3")
+        self.assertNotIn("total", context)
+        self.assertEqual(template.render(values=[5]), "5")
+
+    def test_set_shadowing_a_context_variable_read_earlier_fails(self):
+        # Documented limitation: set names are locals for the whole template
+        template = Template("{{ total }}{% set total = 1 %}")
+        with self.assertRaises(UnboundLocalError):
+            template.render(total=5)
+
+    def test_context_is_global_to_the_template(self):
+        template = Template("{% for i in items %}{{ prefix }}{{ i }}{% endfor %}")
+        self.assertEqual(template.render(items=[1, 2], prefix="#"), "#1#2")
+
+
+class CompileErrorTest(unittest.TestCase):
+    """Malformed templates raise TemplateSyntaxError naming the template"""
+
+    def assertCompileError(self, source, message):
+        with self.assertRaises(TemplateSyntaxError) as caught:
+            Template(source, "broken.md")
+        self.assertIn("broken.md", str(caught.exception))
+        self.assertIn(message, str(caught.exception))
+
+    def test_unclosed_block(self):
+        self.assertCompileError("{% for t in trades %}{{ t }}", "unclosed for")
+
+    def test_mismatched_end_tag(self):
+        self.assertCompileError("{% if x %}y{% endfor %}", "unexpected endfor")
+
+    def test_else_outside_if(self):
+        self.assertCompileError("{% for t in x %}{% else %}{% endfor %}", "else")
+
+    def test_unknown_tag(self):
+        self.assertCompileError("{% include 'x' %}", "unknown tag")
+
+    def test_empty_expression(self):
+        self.assertCompileError("{{ }}", "empty expression")
+
+    def test_python_syntax_error(self):
+        self.assertCompileError("{{ pnl + }}", "")
+
+    def test_is_a_value_error(self):
+        self.assertTrue(issubclass(TemplateSyntaxError, ValueError))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -196,18 +196,22 @@ function renderDrawdownChart(data) {
   
   if (drawdownChart) drawdownChart.destroy();
   
+  // Prefer the LTTB-downsampled series; drop point markers when reduced
+  const series = data.drawdown_series_lite || data.drawdown_series;
+  const reduced = series.values.length < (series.full_points || series.values.length);
+  
   drawdownChart = new Chart(ctx, {
     type: 'line',
     data: {
-      labels: data.drawdown_series.labels,
+      labels: series.labels,
       datasets: [{
         label: 'Drawdown ($)',
-        data: data.drawdown_series.values,
+        data: series.values,
         borderColor: '#ff4757',
         backgroundColor: 'rgba(255, 71, 87, 0.1)',
         fill: true,
         tension: 0.4,
-        pointRadius: 3,
+        pointRadius: reduced ? 0 : 3,
         pointBackgroundColor: '#ff4757'
       }]
     },
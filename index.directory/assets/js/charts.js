@@ -25,7 +25,11 @@ async function loadEquityCurveChart() {
   if (!ctx) return;
 
   try {
-    const response = await fetch(`${basePath}/index.directory/assets/charts/equity-curve-data.json`);
+    // Render the LTTB-downsampled series first; fall back to the full file
+    let response = await fetch(`${basePath}/index.directory/assets/charts/equity-curve-data-lite.json`);
+    if (!response.ok) {
+      response = await fetch(`${basePath}/index.directory/assets/charts/equity-curve-data.json`);
+    }
     const data = await response.json();
     
     if (equityCurveChart) {
@@ -37,6 +41,18 @@ async function loadEquityCurveChart() {
       data: data,
       options: SFTiChartConfig.getCommonChartOptions()
     });
+
+    // Upgrade to full resolution on large screens only
+    const reduced = data.downsampled && data.downsampled.points < data.downsampled.full_points;
+    if (reduced && window.matchMedia('(min-width: 1024px)').matches) {
+      const fullResponse = await fetch(`${basePath}/index.directory/assets/charts/${data.downsampled.full_data}`);
+      if (fullResponse.ok) {
+        const fullData = await fullResponse.json();
+        fullData.datasets[0].pointRadius = 0;
+        equityCurveChart.data = fullData;
+        equityCurveChart.update('none');
+      }
+    }
   } catch (error) {
     console.log('Equity curve data not yet available:', error);
     SFTiChartConfig.renderEmptyChart(ctx, 'No equity curve data available yet. Add trades to see your equity curve.');